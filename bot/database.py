@@ -6,7 +6,9 @@ import sqlite3
 import json
 import logging
 import os
-from datetime import datetime, timedelta
+import queue
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 
 from config import DATABASE_PATH, UPLOADS_DIR
@@ -14,6 +16,60 @@ from .utils import get_kyiv_timezone
 
 logger = logging.getLogger(__name__)
 
+# Shared by add_post and add_posts_bulk so the statement text is identical everywhere
+_INSERT_POST_SQL = '''
+    INSERT INTO posts (user_id, file_path, media_type, description, scheduled_time, mode, channel_id,
+                     is_recurring, recurring_interval_hours, recurring_end_date, recurring_count, 
+                     media_bundle_json, caption_entities)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Bulk-edit mode bucket for a post: recurring status first, then description
+# patterns (Mode 2 typically has long custom descriptions), then batch membership
+_POST_MODE_TAG_SQL = '''
+    CASE
+        WHEN is_recurring THEN 'recurring'
+        WHEN LENGTH(description) > 50 THEN 'mode2'
+        WHEN batch_id IS NOT NULL THEN 'multibatch'
+        ELSE 'mode1'
+    END
+'''
+
+# Stay below SQLite's default limit on bound parameters per statement
+_MAX_IN_PARAMS = 900
+
+# Idle connections kept open for reuse by get_connection
+CONNECTION_POOL_SIZE = 8
+
+_connection_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=CONNECTION_POOL_SIZE)
+
+class _PooledConnection:
+    """Borrowed SQLite connection whose close() hands it back to the pool while there is room"""
+    
+    __slots__ = ('_conn',)
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+    
+    def __getattr__(self, name):
+        # Only reached for the sqlite3.Connection API (cursor, commit, ...)
+        if self._conn is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        return getattr(self._conn, name)
+    
+    def close(self):
+        # Several error paths close twice; only the first close may give the connection back
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        
+        try:
+            # Drop anything left uncommitted, exactly as a real close would
+            conn.rollback()
+            _connection_pool.put_nowait(conn)
+        except (sqlite3.Error, queue.Full):
+            conn.close()
+
 def init_database():
     """Initialize the SQLite database with required tables"""
     conn = sqlite3.connect(DATABASE_PATH)
@@ -180,6 +236,11 @@ def init_database():
         )
     ''')
     
+    # Indexes for the hot per-user and per-batch lookups
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_posts_user_status ON posts(user_id, status)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_posts_batch_status ON posts(batch_id, status)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_post_batches_user_status ON post_batches(user_id, status)')
+    
     conn.commit()
     conn.close()
     logger.info("Database initialized successfully")
@@ -187,8 +248,24 @@ def init_database():
 class Database:
     @staticmethod
     def get_connection():
-        """Get database connection"""
-        return sqlite3.connect(DATABASE_PATH)
+        """Get database connection, reusing an idle one from the pool when available"""
+        try:
+            conn = _connection_pool.get_nowait()
+        except queue.Empty:
+            # Pooled connections are handed between the event loop and worker threads,
+            # but only ever used by one caller at a time
+            conn = sqlite3.connect(DATABASE_PATH, check_same_thread=False)
+        return _PooledConnection(conn)
+    
+    @staticmethod
+    @contextmanager
+    def connection():
+        """Borrow a database connection for the duration of a with block"""
+        conn = Database.get_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()
     
     @staticmethod
     def add_post(user_id: int, file_path: str, media_type: str = 'photo', description: Optional[str] = None, 
@@ -207,12 +284,7 @@ class Database:
         conn = Database.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            INSERT INTO posts (user_id, file_path, media_type, description, scheduled_time, mode, channel_id,
-                             is_recurring, recurring_interval_hours, recurring_end_date, recurring_count, 
-                             media_bundle_json, caption_entities)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (user_id, file_path, media_type, description, scheduled_time, mode, channel_id,
+        cursor.execute(_INSERT_POST_SQL, (user_id, file_path, media_type, description, scheduled_time, mode, channel_id,
               is_recurring, recurring_interval_hours, recurring_end_date, recurring_count, 
               media_bundle_json, caption_entities))
         
@@ -220,9 +292,50 @@ class Database:
         conn.commit()
         conn.close()
         
+        from . import db_cache
+        db_cache.invalidate_scheduled_posts(user_id)
+        
         logger.info(f"Added post {post_id} for user {user_id} (recurring: {is_recurring})")
         return post_id
     
+    @staticmethod
+    def add_posts_bulk(user_id: int, channel_id: Optional[str], posts: List[Dict]) -> int:
+        """Add several posts for one channel in a single transaction
+        
+        Each dict takes the same keys as add_post's keyword arguments.
+        """
+        if not posts:
+            return 0
+        
+        # SECURITY CHECK: Verify user owns the channel before creating the posts
+        if channel_id and not Database.user_has_channel(user_id, channel_id):
+            error_msg = f"Security violation: User {user_id} attempted to create posts for channel {channel_id} they don't own"
+            logger.error(f"SECURITY ALERT: {error_msg}")
+            raise ValueError("Channel access denied - you don't have permission to post to this channel")
+        
+        rows = [
+            (user_id, post['file_path'], post.get('media_type', 'photo'), post.get('description'),
+             post.get('scheduled_time'), post.get('mode', 1), channel_id,
+             post.get('is_recurring', False), post.get('recurring_interval_hours'),
+             post.get('recurring_end_date'), post.get('recurring_count'),
+             post.get('media_bundle_json'), post.get('caption_entities'))
+            for post in posts
+        ]
+        
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.executemany(_INSERT_POST_SQL, rows)
+        
+        conn.commit()
+        conn.close()
+        
+        from . import db_cache
+        db_cache.invalidate_scheduled_posts(user_id)
+        
+        logger.info(f"Added {len(rows)} posts for user {user_id} to channel {channel_id}")
+        return len(rows)
+    
     @staticmethod
     def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
         """Parse datetime values stored as ISO strings into timezone-aware datetimes."""
@@ -232,18 +345,30 @@ class Database:
         if isinstance(value, datetime):
             # Ensure timezone-awareness
             if value.tzinfo is None:
-                return get_kyiv_timezone().localize(value)
+                return value.replace(tzinfo=get_kyiv_timezone())
             return value
 
         try:
             parsed = datetime.fromisoformat(value)
             if parsed.tzinfo is None:
-                parsed = get_kyiv_timezone().localize(parsed)
+                parsed = parsed.replace(tzinfo=get_kyiv_timezone())
             return parsed
         except (ValueError, TypeError):
             logger.warning(f"Unable to parse datetime value: {value}")
             return None
 
+    @staticmethod
+    def get_post_owner_ids(conn, post_ids: List[int]) -> List[int]:
+        """Users owning any of the given posts, read on the caller's connection or cursor"""
+        post_ids = list(post_ids)
+        owner_ids = set()
+        for i in range(0, len(post_ids), _MAX_IN_PARAMS):
+            chunk = post_ids[i:i + _MAX_IN_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            rows = conn.execute(f'SELECT DISTINCT user_id FROM posts WHERE id IN ({placeholders})', chunk).fetchall()
+            owner_ids.update(row[0] for row in rows)
+        return list(owner_ids)
+
     @staticmethod
     def get_post_by_id(post_id: int) -> Optional[Dict]:
         """Get a complete post by ID"""
@@ -254,7 +379,8 @@ class Database:
             SELECT id, user_id, file_path, media_type, description, scheduled_time, mode,
                    channel_id, is_recurring, recurring_interval_hours, recurring_end_date,
                    recurring_count, media_bundle_json, status, created_at, posted_at,
-                   batch_id, retry_count, last_retry_at, failure_reason, cleanup_date, caption_entities
+                   batch_id, retry_count, last_retry_at, failure_reason, cleanup_date, caption_entities,
+                   recurring_posted_count
             FROM posts
             WHERE id = ?
         ''', (post_id,))
@@ -287,7 +413,8 @@ class Database:
             'last_retry_at': Database._parse_datetime(row[18]),
             'failure_reason': row[19],
             'cleanup_date': Database._parse_datetime(row[20]),
-            'caption_entities': row[21]
+            'caption_entities': row[21],
+            'recurring_posted_count': row[22]
         }
 
     @staticmethod
@@ -343,12 +470,53 @@ class Database:
         conn.close()
         return posts
     
+    @staticmethod
+    def get_pending_post_ids(user_id: int, channel_id: Optional[str] = None) -> List[int]:
+        """Get the ids of a user's pending posts, optionally limited to one channel"""
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        if channel_id:
+            cursor.execute('''
+                SELECT id FROM posts
+                WHERE user_id = ? AND status = 'pending' AND channel_id = ?
+            ''', (user_id, channel_id))
+        else:
+            cursor.execute('''
+                SELECT id FROM posts
+                WHERE user_id = ? AND status = 'pending'
+            ''', (user_id,))
+        
+        post_ids = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        return post_ids
+    
+    @staticmethod
+    def get_pending_post_schedules() -> List[Dict]:
+        """Get id, owner and scheduled time of every pending post that has a time, earliest first"""
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT id, user_id, scheduled_time FROM posts
+            WHERE status = 'pending' AND scheduled_time IS NOT NULL
+            ORDER BY scheduled_time ASC
+        ''')
+        
+        posts = [
+            {'id': row[0], 'user_id': row[1], 'scheduled_time': Database._parse_datetime(row[2])}
+            for row in cursor.fetchall()
+        ]
+        conn.close()
+        return posts
+    
     @staticmethod
     def mark_post_as_posted(post_id: int):
         """Mark a post as successfully posted"""
         conn = Database.get_connection()
         cursor = conn.cursor()
         
+        owner_ids = Database.get_post_owner_ids(cursor, [post_id])
         cursor.execute('''
             UPDATE posts 
             SET status = 'posted', posted_at = CURRENT_TIMESTAMP
@@ -358,6 +526,9 @@ class Database:
         conn.commit()
         conn.close()
         
+        from . import db_cache
+        db_cache.invalidate_scheduled_posts(*owner_ids)
+        
         logger.info(f"Marked post {post_id} as posted")
     
     @staticmethod
@@ -366,6 +537,7 @@ class Database:
         conn = Database.get_connection()
         cursor = conn.cursor()
         
+        owner_ids = Database.get_post_owner_ids(cursor, [post_id])
         cursor.execute('''
             UPDATE posts 
             SET status = 'failed', failure_reason = ?
@@ -375,6 +547,9 @@ class Database:
         conn.commit()
         conn.close()
         
+        from . import db_cache
+        db_cache.invalidate_scheduled_posts(*owner_ids)
+        
         logger.warning(f"Marked post {post_id} as failed: {failure_reason}")
     
     @staticmethod
@@ -396,7 +571,10 @@ class Database:
     
     @staticmethod
     def get_failed_posts(user_id: int, channel_id: Optional[str] = None) -> List[Dict]:
-        """Get all failed posts for a user, optionally filtered by channel"""
+        """Get all failed posts for a user, optionally filtered by channel
+        
+        Only a short description preview is returned, which is all the retry menus show.
+        """
         conn = Database.get_connection()
         cursor = conn.cursor()
         
@@ -410,8 +588,11 @@ class Database:
         where_clause = " AND ".join(conditions)
         
         cursor.execute(f'''
-            SELECT id, file_path, media_type, description, scheduled_time, mode, 
-                   channel_id, created_at, posted_at
+            SELECT id, file_path, media_type,
+                   CASE WHEN LENGTH(description) > 20 THEN SUBSTR(description, 1, 20) || '...'
+                        ELSE COALESCE(NULLIF(description, ''), 'No description')
+                   END AS description_preview,
+                   scheduled_time, mode, channel_id, created_at, posted_at
             FROM posts 
             WHERE {where_clause}
             ORDER BY created_at DESC
@@ -419,12 +600,12 @@ class Database:
         
         posts = []
         for row in cursor.fetchall():
-            post_id, file_path, media_type, description, scheduled_time, mode, channel_id, created_at, posted_at = row
+            post_id, file_path, media_type, description_preview, scheduled_time, mode, channel_id, created_at, posted_at = row
             posts.append({
                 'id': post_id,
                 'file_path': file_path,
                 'media_type': media_type or 'photo',
-                'description': description,
+                'description_preview': description_preview,
                 'scheduled_time': scheduled_time,
                 'mode': mode,
                 'channel_id': channel_id,
@@ -624,6 +805,9 @@ class Database:
             conn.commit()
             conn.close()
             
+            from . import db_cache
+            db_cache.invalidate_scheduled_posts(user_id)
+            
             logger.info(f"Rescheduled {total_posts_scheduled} posts for user {user_id} starting from {today} with simultaneous channel scheduling")
             return total_posts_scheduled
             
@@ -817,6 +1001,10 @@ class Database:
                 ''', (new_time.isoformat(), post_id, user_id))
             
             conn.commit()
+            
+            from . import db_cache
+            db_cache.invalidate_scheduled_posts(user_id)
+            
             logger.info(f"Rescheduled {updated_count} overdue posts and shifted {len(future_posts)} future posts for user {user_id}")
             
             return updated_count
@@ -848,6 +1036,7 @@ class Database:
             return False
             
         # Reset the post to pending status
+        owner_ids = Database.get_post_owner_ids(cursor, [post_id])
         cursor.execute('''
             UPDATE posts 
             SET status = 'pending', posted_at = NULL
@@ -857,21 +1046,61 @@ class Database:
         conn.commit()
         conn.close()
         
+        from . import db_cache
+        db_cache.invalidate_scheduled_posts(*owner_ids)
+        
         logger.info(f"Reset failed post {post_id} back to pending for retry")
         return True
     
+    @staticmethod
+    def retry_failed_posts_bulk(post_ids: List[int]) -> int:
+        """Reset many failed posts back to pending status, returning how many were reset"""
+        if not post_ids:
+            return 0
+        
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        owner_ids = Database.get_post_owner_ids(cursor, post_ids)
+        reset_count = 0
+        for i in range(0, len(post_ids), _MAX_IN_PARAMS):
+            chunk = post_ids[i:i + _MAX_IN_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f'''
+                UPDATE posts 
+                SET status = 'pending', posted_at = NULL
+                WHERE id IN ({placeholders}) AND status = 'failed'
+            ''', chunk)
+            reset_count += cursor.rowcount
+        
+        conn.commit()
+        conn.close()
+        
+        from . import db_cache
+        db_cache.invalidate_scheduled_posts(*owner_ids)
+        
+        logger.info(f"Reset {reset_count} failed posts back to pending for retry")
+        return reset_count
+    
     @staticmethod
     def update_user_session(user_id: int, mode: str, session_data: Optional[Dict] = None):
         """Update user session state"""
+        from .session_store import session_store
+        session_store.set(user_id, mode, session_data)
+    
+    @staticmethod
+    def write_user_sessions(rows: List[Tuple[int, str, Optional[str]]]):
+        """Persist (user_id, mode, session_json) rows to the user_sessions table"""
+        if not rows:
+            return
+        
         conn = Database.get_connection()
         cursor = conn.cursor()
         
-        session_json = json.dumps(session_data) if session_data else None
-        
-        cursor.execute('''
+        cursor.executemany('''
             INSERT OR REPLACE INTO user_sessions (user_id, current_mode, session_data, updated_at)
             VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-        ''', (user_id, mode, session_json))
+        ''', rows)
         
         conn.commit()
         conn.close()
@@ -879,24 +1108,8 @@ class Database:
     @staticmethod
     def get_user_session(user_id: int) -> Tuple[str, Dict]:
         """Get user session state"""
-        conn = Database.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT current_mode, session_data
-            FROM user_sessions
-            WHERE user_id = ?
-        ''', (user_id,))
-        
-        row = cursor.fetchone()
-        conn.close()
-        
-        if row:
-            mode = row[0]
-            session_data = json.loads(row[1]) if row[1] else {}
-            return mode, session_data
-        
-        return 'idle', {}
+        from .session_store import session_store
+        return session_store.get(user_id)
     
     @staticmethod
     def clear_user_posts(user_id: int, mode: Optional[int] = None, channel_id: Optional[str] = None,
@@ -1018,6 +1231,10 @@ class Database:
         conn.commit()
         conn.close()
         
+        # Batch post counts include queued posts
+        from . import db_cache
+        db_cache.invalidate(user_id)
+        
         logger.info(f"Cleared {count} queued posts for user {user_id}{channel_info}. {scheduled_remaining} scheduled posts remain.")
         return count
     
@@ -1075,6 +1292,9 @@ class Database:
         conn.commit()
         conn.close()
         
+        from . import db_cache
+        db_cache.invalidate_scheduled_posts(user_id)
+        
         logger.info(f"Cleared {count} scheduled posts for user {user_id}{channel_info}. {queued_remaining} queued posts remain.")
         return count
 
@@ -1122,6 +1342,9 @@ class Database:
         conn.commit()
         conn.close()
 
+        from . import db_cache
+        db_cache.invalidate_scheduled_posts(user_id)
+
         logger.info(f"Deleted scheduled post {post_id} for user {user_id}")
         return True
 
@@ -1139,6 +1362,9 @@ class Database:
         
         conn.commit()
         conn.close()
+        
+        from . import db_cache
+        db_cache.invalidate(user_id)
     
     @staticmethod
     def get_scheduling_config(user_id: int) -> Tuple[int, int, int]:
@@ -1222,16 +1448,20 @@ class Database:
         conn.close()
     
     @staticmethod
-    def update_last_reminder_sent(user_id: int):
-        """Update the timestamp of the last reminder sent"""
+    def update_last_reminder_sent_bulk(user_ids: List[int]):
+        """Stamp the last reminder time for many users in one transaction"""
+        if not user_ids:
+            return
+        
         conn = Database.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('''
+        sent_at = datetime.now().isoformat()
+        cursor.executemany('''
             UPDATE scheduling_config 
             SET last_reminder_sent = ? 
             WHERE user_id = ?
-        ''', (datetime.now().isoformat(), user_id))
+        ''', [(sent_at, user_id) for user_id in user_ids])
         
         conn.commit()
         conn.close()
@@ -1268,8 +1498,8 @@ class Database:
         return posts
     
     @staticmethod
-    def get_users_for_reminders() -> List[Tuple[int, int]]:
-        """Get all users who have reminder enabled and check their post counts"""
+    def get_users_for_reminders() -> List[Tuple[int, int, int]]:
+        """Get (user_id, post_count, threshold) for users with reminders enabled who are due one"""
         conn = Database.get_connection()
         cursor = conn.cursor()
         
@@ -1297,7 +1527,7 @@ class Database:
                     last_sent_dt = datetime.fromisoformat(last_sent)
                     if (now - last_sent_dt).total_seconds() < 86400:  # 24 hours
                         continue
-                users_to_remind.append((user_id, post_count))
+                users_to_remind.append((user_id, post_count, threshold))
         
         conn.close()
         return users_to_remind
@@ -1318,6 +1548,9 @@ class Database:
             conn.commit()
             conn.close()
             
+            from . import db_cache
+            db_cache.invalidate(user_id)
+            
             logger.info(f"Added channel {channel_id} for user {user_id}")
             return True
             
@@ -1352,10 +1585,58 @@ class Database:
         conn.close()
         return channels
     
+    @staticmethod
+    def get_channel(user_id: int, channel_id: str) -> Optional[Dict]:
+        """Get one active channel of a user, or None if it is not configured"""
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT id, channel_id, channel_name, is_default, is_active
+            FROM user_channels
+            WHERE user_id = ? AND channel_id = ? AND is_active = TRUE
+            LIMIT 1
+        ''', (user_id, channel_id))
+        
+        row = cursor.fetchone()
+        conn.close()
+        
+        if not row:
+            return None
+        
+        return {
+            'id': row[0],
+            'channel_id': row[1],
+            'channel_name': row[2],
+            'is_default': bool(row[3]),
+            'is_active': bool(row[4])
+        }
+    
 
     
 
     
+    @staticmethod
+    def get_channel_names(user_id: int, channel_ids) -> Dict[str, str]:
+        """Get display names for the given active channels of a user, keyed by channel_id"""
+        channel_ids = list(channel_ids)
+        if not channel_ids:
+            return {}
+        
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        placeholders = ','.join('?' * len(channel_ids))
+        cursor.execute(f'''
+            SELECT channel_id, channel_name
+            FROM user_channels
+            WHERE user_id = ? AND is_active = TRUE AND channel_id IN ({placeholders})
+        ''', [user_id, *channel_ids])
+        
+        channel_names = dict(cursor.fetchall())
+        conn.close()
+        return channel_names
+    
     @staticmethod
     def user_has_channel(user_id: int, channel_id: str) -> bool:
         """Verify that a user owns/has access to a specific channel"""
@@ -1406,6 +1687,9 @@ class Database:
             conn.commit()
             conn.close()
             
+            from . import db_cache
+            db_cache.invalidate(user_id)
+            
             logger.info(f"Removed channel {channel_id} for user {user_id}")
             return True
             
@@ -1423,7 +1707,9 @@ class Database:
         # Clear all user posts
         cursor.execute('DELETE FROM posts WHERE user_id = ?', (user_id,))
         
-        # Clear user session
+        # Clear user session, dropping any unflushed copy first
+        from .session_store import session_store
+        session_store.discard(user_id)
         cursor.execute('DELETE FROM user_sessions WHERE user_id = ?', (user_id,))
         
         # Clear user scheduling config
@@ -1435,6 +1721,9 @@ class Database:
         conn.commit()
         conn.close()
         
+        from . import db_cache
+        db_cache.invalidate(user_id)
+        
         logger.info(f"Cleared all data for user {user_id}")
 
     @staticmethod
@@ -1599,19 +1888,35 @@ class Database:
         return posts_by_channel
 
     @staticmethod
-    def increment_recurring_post_count(post_id: int):
-        """Increment the recurring post count for a post"""
+    def finalize_recurring_post(post_id: int, next_time: Optional[datetime] = None):
+        """Count one sent occurrence of a recurring post in a single write.
+
+        With a next_time the post is moved to its next occurrence, otherwise
+        the series is finished and the post is marked as posted.
+        """
         conn = Database.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            UPDATE posts 
-            SET recurring_posted_count = recurring_posted_count + 1
-            WHERE id = ?
-        ''', (post_id,))
+        owner_ids = Database.get_post_owner_ids(cursor, [post_id])
+        if next_time is not None:
+            cursor.execute('''
+                UPDATE posts 
+                SET recurring_posted_count = recurring_posted_count + 1, scheduled_time = ?
+                WHERE id = ?
+            ''', (next_time.isoformat(), post_id))
+        else:
+            cursor.execute('''
+                UPDATE posts 
+                SET recurring_posted_count = recurring_posted_count + 1,
+                    status = 'posted', posted_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (post_id,))
         
         conn.commit()
         conn.close()
+        
+        from . import db_cache
+        db_cache.invalidate_scheduled_posts(*owner_ids)
 
     @staticmethod
     def get_recurring_posts() -> List[Dict]:
@@ -1774,6 +2079,9 @@ class Database:
         conn.commit()
         conn.close()
         
+        from . import db_cache
+        db_cache.invalidate(user_id)
+        
         logger.info(f"Created batch {batch_id} '{batch_name}' for user {user_id}")
         return batch_id
 
@@ -1809,6 +2117,131 @@ class Database:
         conn.close()
         return batches
 
+    @staticmethod
+    def get_pending_batches_with_posts(user_id: int) -> List[Dict]:
+        """Get a user's pending batches that still have pending posts"""
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT b.id, b.batch_name, b.channel_id, b.status, b.created_at,
+                   c.channel_name, COUNT(p.id) as post_count
+            FROM post_batches b
+            LEFT JOIN user_channels c ON b.channel_id = c.channel_id AND b.user_id = c.user_id
+            JOIN posts p ON b.id = p.batch_id AND p.status = 'pending'
+            WHERE b.user_id = ? AND b.status = 'pending'
+            GROUP BY b.id
+            ORDER BY b.created_at DESC
+        ''', (user_id,))
+        
+        batches = []
+        for row in cursor.fetchall():
+            batches.append({
+                'id': row[0],
+                'batch_name': row[1],
+                'channel_id': row[2],
+                'status': row[3],
+                'created_at': row[4],
+                'channel_name': row[5] or row[2],
+                'post_count': row[6]
+            })
+        
+        conn.close()
+        return batches
+
+    @staticmethod
+    def get_batch(user_id: int, batch_id: int) -> Optional[Dict]:
+        """Get one batch owned by a user, or None if it does not exist"""
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT b.id, b.batch_name, b.channel_id, b.status, b.created_at,
+                   c.channel_name, COUNT(p.id) as post_count
+            FROM post_batches b
+            LEFT JOIN user_channels c ON b.channel_id = c.channel_id AND b.user_id = c.user_id
+            LEFT JOIN posts p ON b.id = p.batch_id AND p.status = 'pending'
+            WHERE b.id = ? AND b.user_id = ?
+            GROUP BY b.id
+        ''', (batch_id, user_id))
+        
+        row = cursor.fetchone()
+        conn.close()
+        
+        if not row:
+            return None
+        
+        return {
+            'id': row[0],
+            'batch_name': row[1],
+            'channel_id': row[2],
+            'status': row[3],
+            'created_at': row[4],
+            'channel_name': row[5] or row[2],
+            'post_count': row[6]
+        }
+    
+    @staticmethod
+    def get_user_batches_page(user_id: int, offset: int, limit: int = 20) -> Tuple[int, List[Dict]]:
+        """Get the total batch count and one page of a user's batches, newest first"""
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT COUNT(*) FROM post_batches WHERE user_id = ?', (user_id,))
+        total_count = cursor.fetchone()[0]
+        
+        batches = []
+        if total_count > offset:
+            cursor.execute('''
+                SELECT b.id, b.batch_name, b.channel_id, b.status, b.created_at,
+                       c.channel_name, COUNT(p.id) as post_count
+                FROM post_batches b
+                LEFT JOIN user_channels c ON b.channel_id = c.channel_id AND b.user_id = c.user_id
+                LEFT JOIN posts p ON b.id = p.batch_id AND p.status = 'pending'
+                WHERE b.user_id = ?
+                GROUP BY b.id
+                ORDER BY b.created_at DESC, b.id DESC
+                LIMIT ? OFFSET ?
+            ''', (user_id, limit, offset))
+            
+            for row in cursor.fetchall():
+                batches.append({
+                    'id': row[0],
+                    'batch_name': row[1],
+                    'channel_id': row[2],
+                    'status': row[3],
+                    'created_at': row[4],
+                    'channel_name': row[5] or row[2],
+                    'post_count': row[6]
+                })
+        
+        conn.close()
+        return total_count, batches
+
+    @staticmethod
+    def get_user_batches_summary(user_id: int, limit: int = 3) -> Tuple[int, List[Dict]]:
+        """Get the total batch count and the most recent batches for a user"""
+        return Database.get_user_batches_page(user_id, 0, limit)
+
+    @staticmethod
+    def get_user_batch_totals(user_id: int) -> Tuple[int, int]:
+        """Get the number of batches and pending batch posts for a user"""
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT
+                (SELECT COUNT(*) FROM post_batches WHERE user_id = ?),
+                (SELECT COUNT(*)
+                 FROM posts p
+                 JOIN post_batches b ON p.batch_id = b.id
+                 WHERE b.user_id = ? AND p.status = 'pending')
+        ''', (user_id, user_id))
+        
+        batch_count, total_posts = cursor.fetchone()
+        conn.close()
+        return batch_count, total_posts
+
     @staticmethod
     def get_batch_posts(batch_id: int) -> List[Dict]:
         """Get all posts in a specific batch"""
@@ -1844,6 +2277,64 @@ class Database:
         conn.close()
         return posts
 
+    @staticmethod
+    def get_batch_media_type_counts(batch_id: int) -> Dict[str, int]:
+        """Count pending posts in a batch per media type, in upload order"""
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT COALESCE(media_type, 'photo') as media_type, COUNT(*)
+            FROM posts 
+            WHERE batch_id = ? AND status = 'pending'
+            GROUP BY COALESCE(media_type, 'photo')
+            ORDER BY MIN(id) ASC
+        ''', (batch_id,))
+        
+        counts = dict(cursor.fetchall())
+        conn.close()
+        return counts
+
+    @staticmethod
+    def get_posts_for_batches(batch_ids: List[int]) -> Dict[int, List[Dict]]:
+        """Get pending posts for several batches at once, keyed by batch id"""
+        posts_by_batch = {batch_id: [] for batch_id in batch_ids}
+        if not batch_ids:
+            return posts_by_batch
+        
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        placeholders = ','.join('?' * len(batch_ids))
+        cursor.execute(f'''
+            SELECT id, user_id, file_path, media_type, description, scheduled_time, mode, channel_id,
+                   is_recurring, recurring_interval_hours, recurring_end_date, recurring_count, recurring_posted_count,
+                   batch_id
+            FROM posts 
+            WHERE batch_id IN ({placeholders}) AND status = 'pending'
+            ORDER BY id ASC
+        ''', batch_ids)
+        
+        for row in cursor.fetchall():
+            posts_by_batch[row[13]].append({
+                'id': row[0],
+                'user_id': row[1],
+                'file_path': row[2],
+                'media_type': row[3] or 'photo',
+                'description': row[4],
+                'scheduled_time': datetime.fromisoformat(row[5]) if row[5] else None,
+                'mode': row[6],
+                'channel_id': row[7],
+                'is_recurring': bool(row[8]) if row[8] is not None else False,
+                'recurring_interval_hours': row[9],
+                'recurring_end_date': datetime.fromisoformat(row[10]) if row[10] else None,
+                'recurring_count': row[11],
+                'recurring_posted_count': row[12] or 0
+            })
+        
+        conn.close()
+        return posts_by_batch
+
     @staticmethod
     def add_post_to_batch(user_id: int, file_path: str, batch_id: int, media_type: str = 'photo', 
                          description: Optional[str] = None, mode: int = 1) -> int:
@@ -1883,9 +2374,63 @@ class Database:
         conn.commit()
         conn.close()
         
+        from . import db_cache
+        db_cache.invalidate(user_id)
+        
         logger.info(f"Added post {post_id} to batch {batch_id} for user {user_id}")
         return post_id
 
+    @staticmethod
+    def add_posts_to_batch_bulk(user_id: int, batch_id: int, media_items: List[Tuple[str, str]],
+                                mode: int = 1) -> List[int]:
+        """Add several (file_path, media_type) posts to a batch in one transaction"""
+        if not media_items:
+            return []
+        
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        # Get batch info and verify user owns the batch
+        cursor.execute('SELECT channel_id, user_id FROM post_batches WHERE id = ?', (batch_id,))
+        batch_info = cursor.fetchone()
+        if not batch_info:
+            conn.close()
+            raise ValueError(f"Batch {batch_id} not found")
+        
+        channel_id, batch_owner_id = batch_info
+        
+        # SECURITY CHECK: Verify user owns the batch
+        if batch_owner_id != user_id:
+            conn.close()
+            error_msg = f"Security violation: User {user_id} attempted to add posts to batch {batch_id} owned by user {batch_owner_id}"
+            logger.error(f"SECURITY ALERT: {error_msg}")
+            raise ValueError("Batch access denied - you don't have permission to add posts to this batch")
+        
+        # Additional security check: Verify user still owns the channel (in case permissions changed)
+        if not Database.user_has_channel(user_id, channel_id):
+            conn.close()
+            error_msg = f"Security violation: User {user_id} attempted to add posts to batch {batch_id} for channel {channel_id} they no longer own"
+            logger.error(f"SECURITY ALERT: {error_msg}")
+            raise ValueError("Channel access denied - you no longer have permission to post to this channel")
+        
+        # Insert row by row inside the single transaction so each new post id is known
+        post_ids = []
+        for file_path, media_type in media_items:
+            cursor.execute('''
+                INSERT INTO posts (user_id, file_path, media_type, description, mode, channel_id, batch_id)
+                VALUES (?, ?, ?, NULL, ?, ?, ?)
+            ''', (user_id, file_path, media_type, mode, channel_id, batch_id))
+            post_ids.append(cursor.lastrowid)
+        
+        conn.commit()
+        conn.close()
+        
+        from . import db_cache
+        db_cache.invalidate(user_id)
+        
+        logger.info(f"Added {len(post_ids)} posts to batch {batch_id} for user {user_id}")
+        return post_ids
+
     @staticmethod
     def schedule_batch(batch_id: int, scheduled_times: List[datetime]):
         """Schedule all posts in a batch"""
@@ -1917,11 +2462,45 @@ class Database:
             WHERE id = ?
         ''', (batch_id,))
         
+        cursor.execute('SELECT user_id FROM post_batches WHERE id = ?', (batch_id,))
+        owner_row = cursor.fetchone()
+        
         conn.commit()
         conn.close()
         
+        if owner_row:
+            from . import db_cache
+            db_cache.invalidate(owner_row[0])
+        
         logger.info(f"Scheduled batch {batch_id} with {len(scheduled_times)} times")
 
+    @staticmethod
+    def schedule_batches_bulk(user_id: int, batch_ids: List[int], post_ids: List[int],
+                              scheduled_times: List[datetime]):
+        """Schedule posts from several batches and mark those batches scheduled in one transaction"""
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.executemany('''
+            UPDATE posts 
+            SET scheduled_time = ?
+            WHERE id = ?
+        ''', [(scheduled_time.isoformat(), post_id) for post_id, scheduled_time in zip(post_ids, scheduled_times)])
+        
+        cursor.executemany('''
+            UPDATE post_batches 
+            SET status = 'scheduled'
+            WHERE id = ? AND user_id = ?
+        ''', [(batch_id, user_id) for batch_id in batch_ids])
+        
+        conn.commit()
+        conn.close()
+        
+        from . import db_cache
+        db_cache.invalidate(user_id)
+        
+        logger.info(f"Scheduled {len(batch_ids)} batches with {len(post_ids)} posts for user {user_id}")
+
     @staticmethod
     def update_post_schedule(post_id: int, scheduled_time: datetime):
         """Update the scheduled time for a specific post"""
@@ -1929,6 +2508,7 @@ class Database:
         cursor = conn.cursor()
         
         try:
+            owner_ids = Database.get_post_owner_ids(cursor, [post_id])
             cursor.execute('''
                 UPDATE posts 
                 SET scheduled_time = ?
@@ -1939,6 +2519,9 @@ class Database:
             rows_affected = cursor.rowcount
             conn.close()
             
+            from . import db_cache
+            db_cache.invalidate_scheduled_posts(*owner_ids)
+            
             if rows_affected > 0:
                 logger.info(f"Updated scheduled time for post {post_id} to {scheduled_time}")
                 return True
@@ -1958,6 +2541,7 @@ class Database:
         cursor = conn.cursor()
         
         try:
+            owner_ids = Database.get_post_owner_ids(cursor, [post_id])
             cursor.execute('''
                 UPDATE posts 
                 SET description = ?, caption_entities = ?
@@ -1968,6 +2552,9 @@ class Database:
             rows_affected = cursor.rowcount
             conn.close()
             
+            from . import db_cache
+            db_cache.invalidate_scheduled_posts(*owner_ids)
+            
             if rows_affected > 0:
                 logger.info(f"Updated description for post {post_id}")
                 return True
@@ -1987,6 +2574,7 @@ class Database:
         cursor = conn.cursor()
         
         try:
+            owner_ids = Database.get_post_owner_ids(cursor, [post_id])
             cursor.execute('''
                 UPDATE posts 
                 SET file_path = ?, media_type = ?
@@ -1997,6 +2585,9 @@ class Database:
             rows_affected = cursor.rowcount
             conn.close()
             
+            from . import db_cache
+            db_cache.invalidate_scheduled_posts(*owner_ids)
+            
             if rows_affected > 0:
                 logger.info(f"Updated media for post {post_id}")
                 return True
@@ -2026,6 +2617,9 @@ class Database:
             rows_affected = cursor.rowcount
             conn.close()
             
+            from . import db_cache
+            db_cache.invalidate_scheduled_posts(user_id)
+            
             if rows_affected > 0:
                 logger.info(f"Deleted post {post_id} for user {user_id}")
                 return True
@@ -2113,6 +2707,9 @@ class Database:
             rows_affected = cursor.rowcount
             conn.close()
             
+            from . import db_cache
+            db_cache.invalidate_scheduled_posts(user_id)
+            
             logger.info(f"Deleted captions from {rows_affected} posts for user {user_id}")
             return rows_affected
                 
@@ -2164,9 +2761,14 @@ class Database:
     def delete_batch(batch_id: int) -> bool:
         """Delete a batch and all its posts"""
         from .utils import delete_media_file
+        from . import db_cache
         conn = Database.get_connection()
         cursor = conn.cursor()
         
+        # Get the batch owner so their cached batch list can be dropped
+        cursor.execute('SELECT user_id FROM post_batches WHERE id = ?', (batch_id,))
+        owner_row = cursor.fetchone()
+        
         # Get file paths of posts in the batch
         cursor.execute('''
             SELECT file_path FROM posts 
@@ -2189,10 +2791,57 @@ class Database:
         conn.commit()
         conn.close()
         
+        if owner_row:
+            db_cache.invalidate(owner_row[0])
+        
         if success:
             logger.info(f"Deleted batch {batch_id}")
         return success
 
+    @staticmethod
+    def delete_all_user_batches(user_id: int) -> int:
+        """Delete all batches for a user and their posts in a single transaction"""
+        from .utils import delete_media_file
+        from . import db_cache
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            # Get file paths of pending posts in the user's batches
+            cursor.execute('''
+                SELECT file_path FROM posts 
+                WHERE status = 'pending' AND batch_id IN (SELECT id FROM post_batches WHERE user_id = ?)
+            ''', (user_id,))
+            
+            file_paths = [row[0] for row in cursor.fetchall()]
+            
+            # Delete posts in the batches
+            cursor.execute('''
+                DELETE FROM posts 
+                WHERE batch_id IN (SELECT id FROM post_batches WHERE user_id = ?)
+            ''', (user_id,))
+            
+            # Delete the batches themselves
+            cursor.execute('DELETE FROM post_batches WHERE user_id = ?', (user_id,))
+            deleted_count = cursor.rowcount
+            
+            conn.commit()
+        except Exception as e:
+            logger.error(f"Error deleting batches for user {user_id}: {e}")
+            conn.rollback()
+            return 0
+        finally:
+            conn.close()
+        
+        # Delete the physical files once the records are gone
+        for file_path in file_paths:
+            delete_media_file(file_path)
+        
+        db_cache.invalidate(user_id)
+        
+        logger.info(f"Deleted {deleted_count} batches for user {user_id}")
+        return deleted_count
+
     @staticmethod
     def get_pending_posts_by_batch(user_id: int) -> Dict[str, List[Dict]]:
         """Get pending posts grouped by batch"""
@@ -2233,25 +2882,29 @@ class Database:
         return posts_by_batch
 
     @staticmethod
-    def get_posts_by_date_range(user_id: int, start_date: datetime, end_date: datetime) -> Dict[str, List[Dict]]:
-        """Get scheduled posts grouped by date for calendar view"""
+    def get_posts_by_date_range(user_id: int, start_date: datetime, end_date: datetime) -> Dict[date, List[Dict]]:
+        """Get scheduled posts grouped by local date for calendar view"""
         conn = Database.get_connection()
         cursor = conn.cursor()
         
+        # Same local-date string range as get_posts_for_date, inclusive of end_date
+        range_start = start_date.strftime('%Y-%m-%d')
+        range_end = (end_date + timedelta(days=1)).strftime('%Y-%m-%d')
+        
         cursor.execute('''
             SELECT p.id, p.scheduled_time, p.media_type, p.description, p.channel_id, p.is_recurring,
                    uc.channel_name, p.mode
             FROM posts p
             LEFT JOIN user_channels uc ON p.channel_id = uc.channel_id AND p.user_id = uc.user_id
-            WHERE p.user_id = ? AND p.status = 'pending' AND p.scheduled_time IS NOT NULL
-            AND DATE(p.scheduled_time) BETWEEN DATE(?) AND DATE(?)
+            WHERE p.user_id = ? AND p.status = 'pending'
+            AND p.scheduled_time >= ? AND p.scheduled_time < ?
             ORDER BY p.scheduled_time ASC
-        ''', (user_id, start_date.isoformat(), end_date.isoformat()))
+        ''', (user_id, range_start, range_end))
         
         posts_by_date = {}
         for row in cursor.fetchall():
             scheduled_time = datetime.fromisoformat(row[1])
-            date_key = scheduled_time.strftime('%Y-%m-%d')
+            date_key = scheduled_time.date()
             
             if date_key not in posts_by_date:
                 posts_by_date[date_key] = []
@@ -2270,6 +2923,65 @@ class Database:
         conn.close()
         return posts_by_date
 
+    @staticmethod
+    def get_month_day_counts(user_id: int, year: int, month: int) -> Dict[date, int]:
+        """Count pending posts per local date in a month for the calendar grid"""
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        # Group on the stored local date prefix; DATE() would shift to UTC
+        range_start = date(year, month, 1)
+        range_end = date(year + month // 12, month % 12 + 1, 1)
+        
+        cursor.execute('''
+            SELECT SUBSTR(scheduled_time, 1, 10) AS day, COUNT(*)
+            FROM posts
+            WHERE user_id = ? AND status = 'pending'
+            AND scheduled_time >= ? AND scheduled_time < ?
+            GROUP BY day
+        ''', (user_id, range_start.isoformat(), range_end.isoformat()))
+        
+        day_counts = {date.fromisoformat(day): count for day, count in cursor.fetchall()}
+        conn.close()
+        return day_counts
+
+    @staticmethod
+    def get_posts_for_date(user_id: int, day: datetime) -> List[Dict]:
+        """Get scheduled posts for a single day for the calendar day view"""
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        # Compare the stored ISO strings directly so the lookup can use the index;
+        # the date prefix is local time, matching the days of get_posts_by_date_range
+        day_start = day.strftime('%Y-%m-%d')
+        day_end = (day + timedelta(days=1)).strftime('%Y-%m-%d')
+        
+        cursor.execute('''
+            SELECT p.id, p.scheduled_time, p.media_type, p.description, p.channel_id, p.is_recurring,
+                   uc.channel_name, p.mode
+            FROM posts p
+            LEFT JOIN user_channels uc ON p.channel_id = uc.channel_id AND p.user_id = uc.user_id
+            WHERE p.user_id = ? AND p.status = 'pending'
+            AND p.scheduled_time >= ? AND p.scheduled_time < ?
+            ORDER BY p.scheduled_time ASC
+        ''', (user_id, day_start, day_end))
+        
+        posts = []
+        for row in cursor.fetchall():
+            posts.append({
+                'id': row[0],
+                'scheduled_time': datetime.fromisoformat(row[1]),
+                'media_type': row[2] or 'photo',
+                'description': row[3],
+                'channel_id': row[4],
+                'channel_name': row[6] or row[4],
+                'is_recurring': bool(row[5]),
+                'mode': row[7]
+            })
+        
+        conn.close()
+        return posts
+
     @staticmethod
     def get_scheduled_posts_for_channel(user_id: int, channel_id: Optional[str] = None) -> List[Dict]:
         """Get all scheduled posts for a user, optionally filtered by channel"""
@@ -2287,7 +2999,7 @@ class Database:
         
         cursor.execute(f'''
             SELECT id, file_path, media_type, description, scheduled_time, 
-                   channel_id, mode, is_recurring
+                   channel_id, mode, is_recurring, batch_id, {_POST_MODE_TAG_SQL} AS mode_tag
             FROM posts 
             WHERE {where_clause}
             ORDER BY scheduled_time ASC
@@ -2303,12 +3015,72 @@ class Database:
                 'scheduled_time': datetime.fromisoformat(row[4]) if row[4] else None,
                 'channel_id': row[5],
                 'mode': row[6],
-                'is_recurring': bool(row[7]) if row[7] is not None else False
+                'is_recurring': bool(row[7]) if row[7] is not None else False,
+                'batch_id': row[8],
+                'mode_tag': row[9]
             })
         
         conn.close()
         return posts
 
+    @staticmethod
+    def get_scheduled_post_ids(user_id: int, post_ids: List[int]) -> List[int]:
+        """Keep the given ids that are still scheduled posts of the user, ordered by scheduled time"""
+        if not post_ids:
+            return []
+        
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        post_ids = list(post_ids)
+        rows = []
+        for i in range(0, len(post_ids), _MAX_IN_PARAMS):
+            chunk = post_ids[i:i + _MAX_IN_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f'''
+                SELECT id, scheduled_time
+                FROM posts
+                WHERE id IN ({placeholders}) AND user_id = ?
+                AND status = 'pending' AND scheduled_time IS NOT NULL
+            ''', (*chunk, user_id))
+            rows.extend(cursor.fetchall())
+        
+        conn.close()
+        # Same order as get_scheduled_posts_for_channel, across all chunks
+        rows.sort(key=lambda row: row[1])
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def get_scheduled_post_summary(user_id: int) -> Dict:
+        """Count a user's scheduled posts per channel and per bulk-edit mode"""
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+        
+        # Channels in order of their earliest scheduled post
+        cursor.execute('''
+            SELECT channel_id, COUNT(*)
+            FROM posts
+            WHERE user_id = ? AND status = 'pending' AND scheduled_time IS NOT NULL
+            GROUP BY channel_id
+            ORDER BY MIN(scheduled_time)
+        ''', (user_id,))
+        by_channel = dict(cursor.fetchall())
+        
+        cursor.execute(f'''
+            SELECT {_POST_MODE_TAG_SQL} AS post_mode, COUNT(*)
+            FROM posts
+            WHERE user_id = ? AND status = 'pending' AND scheduled_time IS NOT NULL
+            GROUP BY post_mode
+        ''', (user_id,))
+        by_mode = dict(cursor.fetchall())
+        
+        conn.close()
+        return {
+            'total': sum(by_channel.values()),
+            'by_channel': by_channel,
+            'by_mode': by_mode
+        }
+
     @staticmethod
     def get_latest_scheduled_time(user_id: int, channel_id: Optional[str] = None) -> Optional[datetime]:
         """Get the latest scheduled time for a user's posts, optionally filtered by channel"""
@@ -2351,8 +3123,10 @@ class Database:
         cursor = conn.cursor()
         
         updated_count = 0
+        owner_ids = []
         
         try:
+            owner_ids = Database.get_post_owner_ids(cursor, [post_id for post_id, _ in post_schedules])
             for post_id, scheduled_time in post_schedules:
                 cursor.execute('''
                     UPDATE posts 
@@ -2373,6 +3147,9 @@ class Database:
         finally:
             conn.close()
         
+        from . import db_cache
+        db_cache.invalidate_scheduled_posts(*owner_ids)
+        
         return updated_count
 
     @staticmethod
@@ -2537,6 +3314,9 @@ class Database:
             
             conn.commit()
             
+            from . import db_cache
+            db_cache.invalidate_scheduled_posts(user_id)
+            
             message = f"Restored {restored_count} posts"
             if missing_files_count > 0:
                 message += f" ({missing_files_count} with missing files marked as failed)"
@@ -0,0 +1,137 @@
+"""
+Short-lived in-process cache for frequently re-read per-user database lookups
+"""
+
+import time
+import logging
+from typing import Dict, List, Optional, Tuple, Any
+
+from .database import Database
+
+logger = logging.getLogger(__name__)
+
+# Entries live just long enough to coalesce multi-step menu navigation
+CACHE_TTL_SECONDS = 5
+CACHE_MAX_SIZE = 10_000
+# Every channel write invalidates explicitly, so the channel list can live longer
+CHANNELS_TTL_SECONDS = 60
+# Only update_scheduling_config changes the hours, and it invalidates explicitly
+SCHEDULING_CONFIG_TTL_SECONDS = 300
+# Every post write invalidates explicitly, so bulk-edit menus can be browsed from one read
+SCHEDULED_POSTS_TTL_SECONDS = 30
+
+_user_channels_cache: Dict[int, Tuple[float, List[Dict]]] = {}
+_user_channel_map_cache: Dict[int, Tuple[float, Dict[str, Optional[Dict]]]] = {}
+_user_batch_map_cache: Dict[int, Tuple[float, Dict[int, Optional[Dict]]]] = {}
+_user_batch_summary_cache: Dict[int, Tuple[float, Tuple[int, List[Dict]]]] = {}
+_user_scheduling_config_cache: Dict[int, Tuple[float, Tuple[int, int, int]]] = {}
+_user_scheduled_posts_cache: Dict[int, Tuple[float, List[Dict]]] = {}
+_user_batch_page_cache: Dict[int, Tuple[float, Dict[Tuple[int, int], Tuple[int, List[Dict]]]]] = {}
+
+
+def _cache_get(cache: Dict[int, Tuple[float, Any]], user_id: int):
+    """Return a cached value for the user, or None if missing or expired"""
+    entry = cache.get(user_id)
+    if entry is None:
+        return None
+
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        cache.pop(user_id, None)
+        return None
+
+    return value
+
+
+def _cache_set(cache: Dict[int, Tuple[float, Any]], user_id: int, value, ttl: float = CACHE_TTL_SECONDS):
+    """Store a value for the user, evicting the oldest entry when full"""
+    if len(cache) >= CACHE_MAX_SIZE and user_id not in cache:
+        # Dicts keep insertion order, so the first key is the oldest entry
+        cache.pop(next(iter(cache)), None)
+    cache[user_id] = (time.monotonic() + ttl, value)
+
+
+def cached_get_user_channels(user_id: int) -> List[Dict]:
+    """Get all channels for a user, served from cache when fresh"""
+    channels = _cache_get(_user_channels_cache, user_id)
+    if channels is None:
+        channels = Database.get_user_channels(user_id)
+        _cache_set(_user_channels_cache, user_id, channels, CHANNELS_TTL_SECONDS)
+    return channels
+
+
+def cached_get_scheduling_config(user_id: int) -> Tuple[int, int, int]:
+    """Get a user's posting hours and interval, served from cache when fresh"""
+    config = _cache_get(_user_scheduling_config_cache, user_id)
+    if config is None:
+        config = Database.get_scheduling_config(user_id)
+        _cache_set(_user_scheduling_config_cache, user_id, config, SCHEDULING_CONFIG_TTL_SECONDS)
+    return config
+
+
+def cached_get_scheduled_posts(user_id: int) -> List[Dict]:
+    """Get all of a user's scheduled posts, served from cache when fresh"""
+    posts = _cache_get(_user_scheduled_posts_cache, user_id)
+    if posts is None:
+        posts = Database.get_scheduled_posts_for_channel(user_id)
+        _cache_set(_user_scheduled_posts_cache, user_id, posts, SCHEDULED_POSTS_TTL_SECONDS)
+    return posts
+
+
+def _cached_row(cache: Dict[int, Tuple[float, Dict]], user_id: int, key, fetch):
+    """Look up one row in a user's cached row map, fetching and storing it on a miss"""
+    rows = _cache_get(cache, user_id)
+    if rows is None:
+        rows = {}
+        _cache_set(cache, user_id, rows)
+    if key not in rows:
+        rows[key] = fetch(user_id, key)
+    return rows[key]
+
+
+def cached_get_channel(user_id: int, channel_id: str) -> Optional[Dict]:
+    """Get one of a user's channels, served from cache when fresh"""
+    return _cached_row(_user_channel_map_cache, user_id, channel_id, Database.get_channel)
+
+
+def cached_get_channel_name(user_id: int, channel_id: str) -> str:
+    """Resolve a channel's display name, falling back to its id"""
+    channel = cached_get_channel(user_id, channel_id)
+    return channel['channel_name'] if channel else channel_id
+
+
+def cached_get_user_batch(user_id: int, batch_id: int) -> Optional[Dict]:
+    """Get one of a user's batches by id, served from cache when fresh"""
+    return _cached_row(_user_batch_map_cache, user_id, batch_id, Database.get_batch)
+
+
+def cached_get_user_batches_summary(user_id: int) -> Tuple[int, List[Dict]]:
+    """Get the batch count and most recent batches for a user, served from cache when fresh"""
+    summary = _cache_get(_user_batch_summary_cache, user_id)
+    if summary is None:
+        summary = Database.get_user_batches_summary(user_id)
+        _cache_set(_user_batch_summary_cache, user_id, summary)
+    return summary
+
+
+def cached_get_user_batches_page(user_id: int, offset: int, limit: int) -> Tuple[int, List[Dict]]:
+    """Get the batch count and one page of a user's batches, served from cache when fresh"""
+    return _cached_row(_user_batch_page_cache, user_id, (offset, limit),
+                       lambda uid, key: Database.get_user_batches_page(uid, *key))
+
+
+def invalidate(user_id: int):
+    """Drop all cached entries for a user after their channels, batches, posts or settings change"""
+    _user_channels_cache.pop(user_id, None)
+    _user_channel_map_cache.pop(user_id, None)
+    _user_batch_map_cache.pop(user_id, None)
+    _user_batch_summary_cache.pop(user_id, None)
+    _user_batch_page_cache.pop(user_id, None)
+    _user_scheduling_config_cache.pop(user_id, None)
+    _user_scheduled_posts_cache.pop(user_id, None)
+
+
+def invalidate_scheduled_posts(*user_ids: int):
+    """Drop only the cached scheduled-post lists after the users' posts change"""
+    for user_id in user_ids:
+        _user_scheduled_posts_cache.pop(user_id, None)
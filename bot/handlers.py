@@ -3,17 +3,28 @@ Telegram bot handlers for different commands and interactions
 """
 
 import os
+import calendar
+import heapq
+import re
 import json
 import logging
 from datetime import datetime, timedelta
+from collections import defaultdict
+from functools import lru_cache
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 
 from .database import Database
+from . import db_cache
+from .db_cache import (
+    cached_get_user_channels, cached_get_channel, cached_get_channel_name, cached_get_user_batch,
+    cached_get_user_batches_summary, cached_get_user_batches_page, cached_get_scheduled_posts,
+    cached_get_scheduling_config
+)
 from .scheduler import PostScheduler
 from .caption_recovery import handle_recover_captions_command, handle_recover_captions_interactive
 from .utils import (
-    generate_unique_filename, save_media, calculate_schedule_times,
+    generate_unique_filename, save_media, save_media_streaming, calculate_schedule_times,
     format_schedule_summary, parse_schedule_input, get_current_kyiv_time,
     parse_date_input, calculate_custom_date_schedule, generate_mini_calendar,
     format_daily_schedule, get_calendar_navigation_dates, get_media_icon,
@@ -31,6 +42,55 @@ if not hasattr(BotStates, 'WAITING_BULK_EDIT_INPUT'):
     # Add fallback
     BotStates.WAITING_BULK_EDIT_INPUT = "waiting_bulk_edit_input"
 
+# Human-readable labels for the preset recurring intervals
+INTERVAL_TEXTS = {
+    24: "24 hours (daily)",
+    48: "48 hours (every 2 days)",
+    168: "168 hours (weekly)",
+}
+
+# Static buttons shared by many menus; PTB objects are immutable, so reuse is safe
+BACK_TO_MENU_BUTTON = InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")
+CANCEL_BUTTON = InlineKeyboardButton("❌ Cancel", callback_data="back_to_main")
+BULKEDIT_BACK_BUTTON = InlineKeyboardButton("🔙 Back", callback_data="bulkedit_back")
+BACK_TO_MODES_BUTTON = InlineKeyboardButton("🔙 Back to Modes", callback_data="bulkedit_modes")
+
+BACK_TO_MAIN_MARKUP = InlineKeyboardMarkup([[BACK_TO_MENU_BUTTON]])
+CANCEL_MARKUP = InlineKeyboardMarkup([[CANCEL_BUTTON]])
+# Shown once posts have been (re)scheduled
+SCHEDULE_UPDATED_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📅 View Calendar", callback_data="main_calendar")],
+    [InlineKeyboardButton("📊 View Statistics", callback_data="main_stats")],
+    [BACK_TO_MENU_BUTTON]
+])
+
+# Callback data for picking a channel when starting mode 1, 2 or 3
+_MODE_CHANNEL_RE = re.compile(r"^mode([123])_channel_(.+)$")
+
+def _count_label(count: int, noun: str) -> str:
+    """Format a count with its noun, pluralized for counts above one"""
+    return f"{count} {noun}s" if count > 1 else f"{count} {noun}"
+
+
+# Accepted end date formats for recurring schedules, most common first
+_DATE_FORMATS = (
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%m/%d/%Y %H:%M",
+    "%d.%m.%Y %H:%M",
+)
+
+
+def _parse_end_date(date_str: str):
+    """Parse a recurring end date, returning a naive datetime or None"""
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    return None
+
 # Scheduler will be accessed from application context
 
 async def extract_and_save_media(update: Update, user_id: int, media_type: str) -> str:
@@ -68,8 +128,8 @@ async def extract_and_save_media(update: Update, user_id: int, media_type: str)
         return None
     
     file = await media_file.get_file()
-    file_data = await file.download_as_bytearray()
-    file_path = save_media(bytes(file_data), filename, media_type, user_id)
+    # Stream straight to disk instead of buffering the whole file in memory
+    file_path = await save_media_streaming(file, filename, media_type, user_id)
     
     return file_path
 
@@ -133,7 +193,7 @@ async def mode1_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = update.effective_user
     
     # Check if user has channels configured
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     if not channels:
         await update.message.reply_text(
@@ -158,7 +218,7 @@ async def mode1_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def recurring_mode_handler(query, user):
     """Handle the recurring posts mode"""
     # Check if user has channels configured
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     if not channels:
         await query.edit_message_text(
@@ -184,7 +244,7 @@ async def prompt_channel_selection_for_recurring_mode(query, user_id, channels):
         callback_data = f"recurring_channel_{channel_id}"
         keyboard.append([InlineKeyboardButton(display_text, callback_data=callback_data)])
     
-    keyboard.append([InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")])
+    keyboard.append([BACK_TO_MENU_BUTTON])
     reply_markup = InlineKeyboardMarkup(keyboard)
     
     message = """
@@ -222,7 +282,7 @@ async def handle_recurring_channel_selection(query, user, channel_id):
     Database.clear_user_posts(user.id, channel_id=channel_id, mode=3)  # mode 3 for recurring
     
     keyboard = [
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+        [BACK_TO_MENU_BUTTON]
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
     
@@ -251,7 +311,7 @@ async def mode2_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = update.effective_user
     
     # Check if user has channels configured
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     if not channels:
         await update.message.reply_text(
@@ -336,6 +396,11 @@ async def handle_media_upload(update: Update, context: ContextTypes.DEFAULT_TYPE
     logger.info(f"handle_media_upload called - User: {user.id}, Mode: {mode}, Media Type: {media_type}")
     
     # Check for batch modes first
+    if mode == BotStates.BATCH_MODE1_PHOTOS and update.message.media_group_id:
+        logger.info(f"Collecting batch album {update.message.media_group_id} for user {user.id}")
+        await handle_batch_media_group(update, context, user, media_type, update.message.media_group_id)
+        return
+    
     if mode in [BotStates.BATCH_MODE1_PHOTOS, BotStates.BATCH_MODE2_PHOTOS]:
         logger.info(f"Handling batch media upload for user {user.id}")
         await handle_batch_media_upload_wrapper(update, context, user, mode, session_data, media_type)
@@ -427,8 +492,6 @@ async def handle_media_upload(update: Update, context: ContextTypes.DEFAULT_TYPE
         logger.info(f"Generated filename: {filename} for user {user.id}")
         
         # Stream download and save media (optimized for heavy files)
-        from bot.utils import save_media_streaming
-        
         try:
             file_path = await save_media_streaming(file, filename, media_type, user.id)
             logger.info(f"Streamed media to: {file_path} for user {user.id}")
@@ -437,7 +500,7 @@ async def handle_media_upload(update: Update, context: ContextTypes.DEFAULT_TYPE
             # Fallback to traditional method for smaller files or if streaming fails
             file_data = await file.download_as_bytearray()
             logger.info(f"Downloaded file data ({len(file_data)} bytes) for user {user.id}")
-            file_path = save_media(bytes(file_data), filename, media_type, user.id)
+            file_path = await asyncio.to_thread(save_media, file_data, filename, media_type, user.id)
             logger.info(f"Saved media to: {file_path} for user {user.id}")
         
         if mode == BotStates.MODE1_PHOTOS:
@@ -478,8 +541,8 @@ async def handle_media_upload(update: Update, context: ContextTypes.DEFAULT_TYPE
                 
                 error_message += f"\n\n*Current uploads ({len(current_uploads)} files):*\n"
                 for media_type_key, count in media_summary.items():
-                    icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type_key, '📁')
-                    error_message += f"• {icon} {count} {media_type_key}{'s' if count > 1 else ''}\n"
+                    icon = get_media_icon(media_type_key)
+                    error_message += f"• {icon} {_count_label(count, media_type_key)}\n"
             
             error_message += "\n\n📤 Continue uploading more files or use /schedule when ready."
             
@@ -489,7 +552,7 @@ async def handle_media_upload(update: Update, context: ContextTypes.DEFAULT_TYPE
             if current_uploads:
                 error_message += f"\n\n*Current uploads ({len(current_uploads)} files ready):*"
                 for i, post in enumerate(current_uploads[-3:], 1):  # Show last 3
-                    icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(post['media_type'], '📁')
+                    icon = get_media_icon(post['media_type'])
                     desc_preview = post['description'][:30] + "..." if post['description'] and len(post['description']) > 30 else post['description'] or "No description"
                     desc_preview = escape_markdown(desc_preview)
                     error_message += f"\n• {icon} {desc_preview}"
@@ -536,7 +599,7 @@ async def handle_mode1_media(update: Update, user, file_path: str, media_type: s
     Database.update_user_session(user.id, BotStates.MODE1_PHOTOS, session_data)
     
     # Format media type for display
-    media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+    media_icon = get_media_icon(media_type)
     
     # Show progress with current uploads
     media_summary = {}
@@ -554,8 +617,8 @@ async def handle_mode1_media(update: Update, user, file_path: str, media_type: s
     progress_text = f"✅ {media_icon} {media_type.replace('document_', '').title()}{quality_text} uploaded! ({len(media_items)} total)\n\n"
     progress_text += "*Current uploads:*\n"
     for media_type_key, count in media_summary.items():
-        icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type_key, '📁')
-        progress_text += f"• {icon} {count} {media_type_key}{'s' if count > 1 else ''}\n"
+        icon = get_media_icon(media_type_key)
+        progress_text += f"• {icon} {_count_label(count, media_type_key)}\n"
     
     progress_text += "\n📤 Continue uploading more files or use /schedule when ready."
     
@@ -622,7 +685,7 @@ async def handle_mode2_media(update: Update, user, file_path: str, media_type: s
     Database.update_user_session(user.id, BotStates.MODE2_PHOTOS, session_data)
     
     # Format media type for display
-    media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+    media_icon = get_media_icon(media_type)
     # Escape markdown in user-provided caption to prevent parsing errors
     escaped_caption = escape_markdown(caption) if caption else None
     desc_text = f'"{escaped_caption}"' if escaped_caption else "no caption"
@@ -636,8 +699,8 @@ async def handle_mode2_media(update: Update, user, file_path: str, media_type: s
     progress_text = f"✅ {media_icon} {media_type.title()} saved with {desc_text}! ({len(media_items)} total)\n\n"
     progress_text += "*Ready to schedule:*\n"
     for media_type_key, count in media_summary.items():
-        icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type_key, '📁')
-        progress_text += f"• {icon} {count} {media_type_key}{'s' if count > 1 else ''}\n"
+        icon = get_media_icon(media_type_key)
+        progress_text += f"• {icon} {_count_label(count, media_type_key)}\n"
     
     progress_text += f"\n📤 Send more media or use /schedule when ready."
     
@@ -763,12 +826,11 @@ async def process_media_group_delayed(context, user, mode: str, session_data: di
             
             # Use streaming download for efficiency
             try:
-                from bot.utils import save_media_streaming
                 file_path = await save_media_streaming(file, filename, media_type)
             except Exception as e:
                 logger.error(f"Streaming failed, falling back to byte array download: {e}")
                 file_data = await file.download_as_bytearray()
-                file_path = save_media(bytes(file_data), filename, media_type)
+                file_path = await asyncio.to_thread(save_media, file_data, filename, media_type)
             
             # Add to media bundle
             media_bundle.append({
@@ -844,7 +906,7 @@ async def process_media_group_delayed(context, user, mode: str, session_data: di
     progress_text += "*Album contents:*\n"
     for media_type_key, count in media_summary.items():
         icon = {'photo': '📸', 'video': '🎥', 'image': '📸', 'video': '🎥'}.get(media_type_key, '📁')
-        progress_text += f"• {icon} {count} {media_type_key}{'s' if count > 1 else ''}\n"
+        progress_text += f"• {icon} {_count_label(count, media_type_key)}\n"
     
     progress_text += f"\n💬 *Send a caption for this album* or use /schedule to post without caption."
     
@@ -951,7 +1013,7 @@ async def show_post_preview(update_or_query, user_id: int, post_index: int, post
     # Get channel name
     channel_name = "Unknown"
     if post.get('channel_id'):
-        channels = Database.get_user_channels(user_id)
+        channels = cached_get_user_channels(user_id)
         for channel in channels:
             if channel['channel_id'] == post['channel_id']:
                 channel_name = channel['channel_name']
@@ -1214,7 +1276,7 @@ async def main_preview_handler(query, user):
         return
     
     # Get user's channels
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     if not channels:
         await query.edit_message_text(
@@ -1253,7 +1315,7 @@ async def show_preview_channel_selection(query, user, channels):
         callback_data = f"preview_channel_{channel_id}"
         keyboard.append([InlineKeyboardButton(display_text, callback_data=callback_data)])
     
-    keyboard.append([InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")])
+    keyboard.append([BACK_TO_MENU_BUTTON])
     reply_markup = InlineKeyboardMarkup(keyboard)
     
     message = """
@@ -1282,7 +1344,7 @@ async def handle_preview_channel_selection(query, user, channel_selection):
         pending_posts = Database.get_pending_posts(user.id, channel_id=channel_id, unscheduled_only=False)
         
         # Get channel name for display
-        channels = Database.get_user_channels(user.id)
+        channels = cached_get_user_channels(user.id)
         channel_name = next((ch['channel_name'] for ch in channels if ch['channel_id'] == channel_id), "Unknown Channel")
     
     if not pending_posts:
@@ -1372,7 +1434,7 @@ async def handle_preview_navigation_for_channel(query, user, channel_selection,
         pending_posts = Database.get_pending_posts(user.id, channel_id=channel_id, unscheduled_only=False)
         
         # Get channel name for display
-        channels = Database.get_user_channels(user.id)
+        channels = cached_get_user_channels(user.id)
         channel_name = next((ch['channel_name'] for ch in channels if ch['channel_id'] == channel_id), "Unknown Channel")
     
     if not pending_posts:
@@ -1407,7 +1469,7 @@ async def handle_recurring_media(update: Update, user, file_path: str, media_typ
     Database.update_user_session(user.id, BotStates.RECURRING_DESCRIPTION, session_data)
     
     # Format media type for display
-    media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+    media_icon = get_media_icon(media_type)
     
     await update.message.reply_text(
         f"📝 {media_icon} {media_type.title()} received for recurring posts!\n\n"
@@ -1439,7 +1501,7 @@ async def handle_recurring_description(update: Update, user, description: str, s
     )
     
     # Format media type for display
-    media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+    media_icon = get_media_icon(media_type)
     
     # Create scheduling options for recurring posts
     keyboard = [
@@ -1447,7 +1509,7 @@ async def handle_recurring_description(update: Update, user, description: str, s
         [InlineKeyboardButton("📅 Every 3 Days", callback_data=f"recurring_schedule_3days_{post_id}")],
         [InlineKeyboardButton("📅 Weekly", callback_data=f"recurring_schedule_weekly_{post_id}")],
         [InlineKeyboardButton("📅 Custom Interval", callback_data=f"recurring_schedule_custom_{post_id}")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+        [BACK_TO_MENU_BUTTON]
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
     
@@ -1567,7 +1629,7 @@ async def handle_mode2_description(update: Update, user, description: str, sessi
     Database.update_user_session(user.id, BotStates.MODE2_PHOTOS, session_data)
     
     # Format media type for display
-    media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+    media_icon = get_media_icon(media_type)
     desc_text = f'"{final_description}"' if final_description else "no description"
     
     # Show comprehensive progress for Mode 2
@@ -1579,8 +1641,8 @@ async def handle_mode2_description(update: Update, user, description: str, sessi
     progress_text = f"✅ {media_icon} {media_type.title()} saved with {desc_text}! ({len(media_items)} total)\n\n"
     progress_text += "*Ready to schedule:*\n"
     for media_type_key, count in media_summary.items():
-        icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type_key, '📁')
-        progress_text += f"• {icon} {count} {media_type_key}{'s' if count > 1 else ''}\n"
+        icon = get_media_icon(media_type_key)
+        progress_text += f"• {icon} {_count_label(count, media_type_key)}\n"
     
     progress_text += f"\n📤 Continue uploading or use /schedule when ready."
     
@@ -1604,7 +1666,7 @@ async def schedule_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     # Check if user has channels configured
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     if not channels:
         await update.message.reply_text(
@@ -1615,20 +1677,18 @@ async def schedule_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     # Get current scheduling config
-    start_hour, end_hour, interval_hours = Database.get_scheduling_config(user.id)
+    start_hour, end_hour, interval_hours = cached_get_scheduling_config(user.id)
     
     # Group posts by their assigned channels
-    posts_by_channel = {}
+    posts_by_channel = defaultdict(list)
     for post in pending_posts:
-        channel_id = post['channel_id']
-        if channel_id not in posts_by_channel:
-            posts_by_channel[channel_id] = []
-        posts_by_channel[channel_id].append(post)
+        posts_by_channel[post['channel_id']].append(post)
     
     # Build channel info text showing posts per channel
     channel_info = f"\n*Posts by Channel:*\n"
+    channel_by_id = {ch['channel_id']: ch for ch in channels}
     for channel_id, posts in posts_by_channel.items():
-        channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+        channel = channel_by_id.get(channel_id)
         channel_name = channel['channel_name'] if channel else f"Unknown ({channel_id})"
         channel_info += f"• {channel_name}: {len(posts)} posts\n"
     
@@ -1707,7 +1767,7 @@ async def callback_query_handler(update: Update, context: ContextTypes.DEFAULT_T
     elif data.startswith("help_"):
         await handle_help_callback(query, user, data)
     elif data.startswith("recurring_channel_"):
-        channel_id = data.replace("recurring_channel_", "")
+        channel_id = data.removeprefix("recurring_channel_")
         await handle_recurring_channel_selection(query, user, channel_id)
     elif data.startswith("recurring_"):
         await handle_recurring_callback(query, user, data, context)
@@ -1723,15 +1783,10 @@ async def callback_query_handler(update: Update, context: ContextTypes.DEFAULT_T
         await handle_retry_callback(query, user, data)
     elif data.startswith("reschedule_"):
         await handle_reschedule_action_callback(query, user, data, context)
-    elif data.startswith("mode1_channel_") or data.startswith("mode2_channel_") or data.startswith("mode3_channel_"):
-        # Parse the mode and channel from the callback data
-        parts = data.split("_", 2)  # Split into max 3 parts: mode, "channel", channel_id
-        if len(parts) >= 3:
-            mode = int(parts[0].replace("mode", ""))
-            channel_id = parts[2]  # The channel ID (could contain underscores)
-            await handle_mode_channel_selection(query, user, mode, channel_id)
-        else:
-            await query.edit_message_text("❌ Invalid selection.")
+    elif mode_channel_match := _MODE_CHANNEL_RE.match(data):
+        # The channel ID is everything after the prefix (could contain underscores)
+        mode, channel_id = int(mode_channel_match[1]), mode_channel_match[2]
+        await handle_mode_channel_selection(query, user, mode, channel_id)
     elif data == "mode3_done_uploading":
         await handle_mode3_done_uploading(query, user)
     elif data == "mode3_skip_caption":
@@ -1743,22 +1798,22 @@ async def callback_query_handler(update: Update, context: ContextTypes.DEFAULT_T
     elif data == "stats_channels":
         await stats_channels_handler(query, user)
     elif data.startswith("stats_channel_"):
-        channel_id = data.replace("stats_channel_", "")
+        channel_id = data.removeprefix("stats_channel_")
         await stats_channel_details_handler(query, user, channel_id)
     elif data.startswith("edit_mode2_"):
-        channel_id = data.replace("edit_mode2_", "")
+        channel_id = data.removeprefix("edit_mode2_")
         logger.info(f"Edit Mode2 callback triggered for user {user.id}, channel {channel_id}")
         await edit_mode2_posts_handler(query, user, channel_id)
     elif data.startswith("edit_post_"):
-        post_id = int(data.replace("edit_post_", ""))
+        post_id = int(data.removeprefix("edit_post_"))
         logger.info(f"Edit post callback triggered for user {user.id}, post {post_id}")
         await edit_post_handler(query, user, post_id)
     elif data.startswith("edit_schedule_"):
-        post_id = int(data.replace("edit_schedule_", ""))
+        post_id = int(data.removeprefix("edit_schedule_"))
         logger.info(f"Edit schedule callback triggered for user {user.id}, post {post_id}")
         await edit_post_schedule_handler(query, user, post_id)
     elif data.startswith("edit_description_"):
-        post_id = int(data.replace("edit_description_", ""))
+        post_id = int(data.removeprefix("edit_description_"))
         logger.info(f"Edit description callback triggered for user {user.id}, post {post_id}")
         await edit_post_description_handler(query, user, post_id)
     elif data.startswith("cal_"):
@@ -1774,35 +1829,35 @@ async def callback_query_handler(update: Update, context: ContextTypes.DEFAULT_T
         await handle_overdue_callback(query, user, data)
     elif data.startswith("preview_nav_channel_"):
         # Handle channel-specific navigation: preview_nav_channel_{channel_id}_{post_index}
-        parts = data.replace("preview_nav_channel_", "").split("_")
+        parts = data.removeprefix("preview_nav_channel_").split("_")
         if len(parts) >= 2:
             channel_selection = "_".join(parts[:-1])  # Channel ID might contain underscores
             post_index = int(parts[-1])
             await handle_preview_navigation_for_channel(query, user, channel_selection, post_index)
     elif data.startswith("preview_nav_"):
-        post_index = int(data.replace("preview_nav_", ""))
+        post_index = int(data.removeprefix("preview_nav_"))
         await handle_preview_navigation(query, user, post_index)
     elif data.startswith("preview_channel_"):
-        channel_selection = data.replace("preview_channel_", "")
+        channel_selection = data.removeprefix("preview_channel_")
         await handle_preview_channel_selection(query, user, channel_selection)
     elif data.startswith("edit_caption_"):
-        post_id = int(data.replace("edit_caption_", ""))
+        post_id = int(data.removeprefix("edit_caption_"))
         await handle_edit_caption_callback(query, user, post_id)
     elif data.startswith("delete_post_"):
-        post_id = int(data.replace("delete_post_", ""))
+        post_id = int(data.removeprefix("delete_post_"))
         await handle_delete_post_callback(query, user, post_id)
     elif data.startswith("send_preview_"):
-        post_id = int(data.replace("send_preview_", ""))
+        post_id = int(data.removeprefix("send_preview_"))
         await send_post_preview_to_user(query, post_id, user.id)
     elif data.startswith("refresh_preview_channel_"):
         # Handle channel-specific refresh: refresh_preview_channel_{channel_id}_{post_index}
-        parts = data.replace("refresh_preview_channel_", "").split("_")
+        parts = data.removeprefix("refresh_preview_channel_").split("_")
         if len(parts) >= 2:
             channel_selection = "_".join(parts[:-1])  # Channel ID might contain underscores
             post_index = int(parts[-1])
             await handle_preview_navigation_for_channel(query, user, channel_selection, post_index)
     elif data.startswith("refresh_preview_"):
-        post_index = int(data.replace("refresh_preview_", ""))
+        post_index = int(data.removeprefix("refresh_preview_"))
         await handle_preview_navigation(query, user, post_index)
     elif data.startswith("settings_"):
         await handle_settings_callback(query, user, data)
@@ -1814,81 +1869,81 @@ async def callback_query_handler(update: Update, context: ContextTypes.DEFAULT_T
     elif data == "editposts_menu":
         await show_editposts_menu(query, user)
     elif data.startswith("editposts_channel_"):
-        channel_id = data.replace("editposts_channel_", "")
+        channel_id = data.removeprefix("editposts_channel_")
         await handle_editposts_channel_selection(query, user, channel_id)
     elif data.startswith("editposts_nav_"):
-        new_index = int(data.replace("editposts_nav_", ""))
+        new_index = int(data.removeprefix("editposts_nav_"))
         await handle_editposts_navigation(query, user, new_index)
     elif data == "editposts_info":
         await query.answer("Navigate using Prev/Next buttons")
     elif data.startswith("editposts_preview_"):
-        post_id = int(data.replace("editposts_preview_", ""))
+        post_id = int(data.removeprefix("editposts_preview_"))
         await handle_editposts_preview(query, user, post_id)
     elif data.startswith("editposts_caption_"):
-        post_id = int(data.replace("editposts_caption_", ""))
+        post_id = int(data.removeprefix("editposts_caption_"))
         await handle_editposts_caption(query, user, post_id)
     elif data.startswith("editposts_media_"):
-        post_id = int(data.replace("editposts_media_", ""))
+        post_id = int(data.removeprefix("editposts_media_"))
         await handle_editposts_media(query, user, post_id)
     elif data.startswith("editposts_schedule_"):
-        post_id = int(data.replace("editposts_schedule_", ""))
+        post_id = int(data.removeprefix("editposts_schedule_"))
         await handle_editposts_schedule(query, user, post_id)
     elif data.startswith("editposts_schedquick_"):
-        parts = data.replace("editposts_schedquick_", "").split("_")
+        parts = data.removeprefix("editposts_schedquick_").split("_")
         post_id = int(parts[0])
         hours = int(parts[1])
         await handle_editposts_schedule_quick(query, user, post_id, hours, context)
     elif data.startswith("editposts_schedcustom_"):
-        post_id = int(data.replace("editposts_schedcustom_", ""))
+        post_id = int(data.removeprefix("editposts_schedcustom_"))
         await handle_editposts_schedule_custom(query, user, post_id)
     elif data.startswith("editposts_delete_"):
-        post_id = int(data.replace("editposts_delete_", ""))
+        post_id = int(data.removeprefix("editposts_delete_"))
         await handle_editposts_delete(query, user, post_id)
     elif data.startswith("editposts_confirmdelete_"):
-        post_id = int(data.replace("editposts_confirmdelete_", ""))
+        post_id = int(data.removeprefix("editposts_confirmdelete_"))
         await handle_editposts_confirm_delete(query, user, post_id, context)
     elif data.startswith("editposts_cancel_"):
-        post_id = int(data.replace("editposts_cancel_", ""))
+        post_id = int(data.removeprefix("editposts_cancel_"))
         await handle_editposts_cancel(query, user, post_id)
     # Recurring posts management callbacks
     elif data == "recurring_manage_menu":
         await show_recurring_posts_menu(query, user)
     elif data.startswith("recur_manage_ch_"):
-        channel_id = data.replace("recur_manage_ch_", "")
+        channel_id = data.removeprefix("recur_manage_ch_")
         await handle_recurring_channel_posts(query, user, channel_id)
     elif data.startswith("recur_nav_"):
-        new_index = int(data.replace("recur_nav_", ""))
+        new_index = int(data.removeprefix("recur_nav_"))
         await handle_recurring_navigation(query, user, new_index)
     elif data.startswith("recur_preview_"):
-        post_id = int(data.replace("recur_preview_", ""))
+        post_id = int(data.removeprefix("recur_preview_"))
         await handle_recurring_preview(query, user, post_id)
     elif data.startswith("recur_editcap_"):
-        post_id = int(data.replace("recur_editcap_", ""))
+        post_id = int(data.removeprefix("recur_editcap_"))
         await handle_recurring_edit_caption(query, user, post_id)
     elif data.startswith("recur_editint_"):
-        post_id = int(data.replace("recur_editint_", ""))
+        post_id = int(data.removeprefix("recur_editint_"))
         await handle_recurring_edit_interval(query, user, post_id)
     elif data.startswith("recur_setint_"):
-        parts = data.replace("recur_setint_", "").split("_")
+        parts = data.removeprefix("recur_setint_").split("_")
         post_id = int(parts[0])
         interval = int(parts[1])
         await handle_recurring_set_interval(query, user, post_id, interval)
     elif data.startswith("recur_editend_"):
-        post_id = int(data.replace("recur_editend_", ""))
+        post_id = int(data.removeprefix("recur_editend_"))
         await handle_recurring_edit_end(query, user, post_id)
     elif data.startswith("recur_setend_"):
-        parts = data.replace("recur_setend_", "").split("_", 1)
+        parts = data.removeprefix("recur_setend_").split("_", 1)
         post_id = int(parts[0])
         end_type = parts[1] if len(parts) > 1 else "never"
         await handle_recurring_set_end(query, user, post_id, end_type, context)
     elif data.startswith("recur_delete_"):
-        post_id = int(data.replace("recur_delete_", ""))
+        post_id = int(data.removeprefix("recur_delete_"))
         await handle_recurring_delete(query, user, post_id)
     elif data.startswith("recur_confirmdel_"):
-        post_id = int(data.replace("recur_confirmdel_", ""))
+        post_id = int(data.removeprefix("recur_confirmdel_"))
         await handle_recurring_confirm_delete(query, user, post_id, context)
     elif data.startswith("recur_back_"):
-        post_id = int(data.replace("recur_back_", ""))
+        post_id = int(data.removeprefix("recur_back_"))
         await handle_recurring_back_to_post(query, user, post_id)
     else:
         logger.warning(f"Unhandled callback data: {data} from user {user.id}")
@@ -1902,7 +1957,7 @@ async def execute_scheduling(query, user, context=None, selected_channel_id=None
         return
     
     # Get user's channels for display purposes
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     if not channels:
         await query.edit_message_text(
             "❌ *No channels configured!*\n\n"
@@ -1912,15 +1967,12 @@ async def execute_scheduling(query, user, context=None, selected_channel_id=None
         return
     
     # Group posts by their assigned channels (they already have channel_id)
-    posts_by_channel = {}
+    posts_by_channel = defaultdict(list)
     for post in pending_posts:
-        channel_id = post['channel_id']
-        if channel_id not in posts_by_channel:
-            posts_by_channel[channel_id] = []
-        posts_by_channel[channel_id].append(post)
+        posts_by_channel[post['channel_id']].append(post)
     
     # Get scheduling config
-    start_hour, end_hour, interval_hours = Database.get_scheduling_config(user.id)
+    start_hour, end_hour, interval_hours = cached_get_scheduling_config(user.id)
     
     # Calculate schedule times for all posts together
     schedule_times = calculate_schedule_times(start_hour, end_hour, interval_hours, len(pending_posts))
@@ -1947,6 +1999,7 @@ async def execute_scheduling(query, user, context=None, selected_channel_id=None
         )
     conn.commit()
     conn.close()
+    db_cache.invalidate_scheduled_posts(user.id)
     logger.info(f"Saved {total_posts} post schedule times to database")
     
     # Then try to register with APScheduler (monitoring will catch any missed ones)
@@ -1961,8 +2014,9 @@ async def execute_scheduling(query, user, context=None, selected_channel_id=None
     
     # Build summary message showing channels
     channel_summary = ""
+    channel_by_id = {ch['channel_id']: ch for ch in channels}
     for channel_id, posts in posts_by_channel.items():
-        channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+        channel = channel_by_id.get(channel_id)
         channel_name = channel['channel_name'] if channel else f"Unknown ({channel_id})"
         channel_summary += f"• *{channel_name}*: {len(posts)} posts\n"
     
@@ -2008,7 +2062,7 @@ async def execute_next_slot_scheduling(query, user, context=None):
         return
     
     # Get user's channels for display purposes
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     if not channels:
         await query.edit_message_text(
             "❌ *No channels configured!*\n\n"
@@ -2018,15 +2072,12 @@ async def execute_next_slot_scheduling(query, user, context=None):
         return
     
     # Group posts by their assigned channels (they already have channel_id)
-    posts_by_channel = {}
+    posts_by_channel = defaultdict(list)
     for post in pending_posts:
-        channel_id = post['channel_id']
-        if channel_id not in posts_by_channel:
-            posts_by_channel[channel_id] = []
-        posts_by_channel[channel_id].append(post)
+        posts_by_channel[post['channel_id']].append(post)
     
     # Get scheduling config
-    start_hour, end_hour, interval_hours = Database.get_scheduling_config(user.id)
+    start_hour, end_hour, interval_hours = cached_get_scheduling_config(user.id)
     
     # Find the latest scheduled post time to start from there
     from bot.utils import get_current_kyiv_time
@@ -2043,7 +2094,7 @@ async def execute_next_slot_scheduling(query, user, context=None):
         if latest_scheduled_time.tzinfo is None:
             from bot.utils import get_kyiv_timezone
             kyiv_tz = get_kyiv_timezone()
-            latest_scheduled_time = kyiv_tz.localize(latest_scheduled_time)
+            latest_scheduled_time = latest_scheduled_time.replace(tzinfo=kyiv_tz)
         
         # Calculate next slot after the latest scheduled post
         start_date = latest_scheduled_time + timedelta(hours=interval_hours)
@@ -2099,7 +2150,6 @@ async def execute_next_slot_scheduling(query, user, context=None):
                 start_date = now.replace(hour=next_hour, minute=0, second=0, microsecond=0)
     
     # Calculate schedule times from the determined start date
-    from bot.utils import calculate_schedule_times
     schedule_times = calculate_schedule_times(start_hour, end_hour, interval_hours, len(pending_posts), start_date)
     
     # Schedule all posts
@@ -2126,6 +2176,7 @@ async def execute_next_slot_scheduling(query, user, context=None):
         )
     conn.commit()
     conn.close()
+    db_cache.invalidate_scheduled_posts(user.id)
     logger.info(f"Saved {total_posts} post schedule times to database (next slot)")
     
     # Then try to register with APScheduler (monitoring will catch any missed ones)
@@ -2140,8 +2191,9 @@ async def execute_next_slot_scheduling(query, user, context=None):
     
     # Build summary message showing channels
     channel_summary = ""
+    channel_by_id = {ch['channel_id']: ch for ch in channels}
     for channel_id, posts in posts_by_channel.items():
-        channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+        channel = channel_by_id.get(channel_id)
         channel_name = channel['channel_name'] if channel else f"Unknown ({channel_id})"
         channel_summary += f"• *{channel_name}*: {len(posts)} posts\n"
     
@@ -2243,7 +2295,7 @@ async def handle_date_input(update: Update, user, text: str, session_data: dict,
         return
     
     # Enforce default schedule window constraints for custom dates
-    default_start, default_end, default_interval = Database.get_scheduling_config(user.id)
+    default_start, default_end, default_interval = cached_get_scheduling_config(user.id)
     start_hour = start_datetime.hour
     
     if start_hour < default_start or start_hour >= default_end:
@@ -2290,7 +2342,7 @@ async def handle_individual_post_edit(update: Update, user, text: str, post_id:
         # Parse the datetime
         naive_dt = datetime.strptime(text.strip(), "%Y-%m-%d %H:%M")
         kyiv_tz = get_kyiv_timezone()
-        scheduled_dt = kyiv_tz.localize(naive_dt)
+        scheduled_dt = naive_dt.replace(tzinfo=kyiv_tz)
         
         # Validate future date
         from bot.utils import get_current_kyiv_time
@@ -2304,7 +2356,7 @@ async def handle_individual_post_edit(update: Update, user, text: str, post_id:
             return
         
         # Enforce default schedule window constraints
-        default_start, default_end, default_interval = Database.get_scheduling_config(user.id)
+        default_start, default_end, default_interval = cached_get_scheduling_config(user.id)
         scheduled_hour = scheduled_dt.hour
         
         if scheduled_hour < default_start or scheduled_hour >= default_end:
@@ -2350,8 +2402,7 @@ async def handle_individual_post_edit(update: Update, user, text: str, post_id:
             description, channel_id = row
             
             # Get channel name
-            channels = Database.get_user_channels(user.id)
-            channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+            channel = cached_get_channel(user.id, channel_id)
             channel_name = channel['channel_name'] if channel else channel_id
             
             desc_text = description[:50] + "..." if description and len(description) > 50 else description or "No description"
@@ -2396,9 +2447,7 @@ async def execute_custom_date_scheduling(update: Update, user, pending_posts: li
             if context and context.application and context.application.bot_data:
                 scheduler = context.application.bot_data.get('scheduler')
             if not scheduler:
-                from .scheduler import PostScheduler
-                scheduler = PostScheduler()
-                logger.warning("Using fallback scheduler instance - jobs may not persist")
+                scheduler = PostScheduler.instance()
         
         # Prepare post IDs and schedule times for batch scheduling
         post_ids = []
@@ -2420,17 +2469,15 @@ async def execute_custom_date_scheduling(update: Update, user, pending_posts: li
             await scheduler.schedule_posts(post_ids, valid_schedule_times)
         
         # Get channels for summary
-        channels = Database.get_user_channels(user.id)
+        channels = cached_get_user_channels(user.id)
         channel_summary = ""
-        posts_by_channel = {}
+        posts_by_channel = defaultdict(list)
         for post in pending_posts:
-            channel_id = post['channel_id']
-            if channel_id not in posts_by_channel:
-                posts_by_channel[channel_id] = []
-            posts_by_channel[channel_id].append(post)
+            posts_by_channel[post['channel_id']].append(post)
         
+        channel_by_id = {ch['channel_id']: ch for ch in channels}
         for channel_id, posts in posts_by_channel.items():
-            channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+            channel = channel_by_id.get(channel_id)
             channel_name = channel['channel_name'] if channel else f"Unknown ({channel_id})"
             channel_summary += f"• {channel_name}: {len(posts)} posts\n"
         
@@ -2481,7 +2528,7 @@ async def handle_schedule_input(update: Update, user, text: str, session_data: d
     schedule_times = calculate_schedule_times(start_hour, end_hour, interval_hours, len(pending_posts))
     
     # Check channels for confirmation
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     if len(channels) > 1:
         keyboard = [
@@ -2580,7 +2627,7 @@ async def help_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         [InlineKeyboardButton("🔧 Management Help", callback_data="help_management"),
          InlineKeyboardButton("📊 Batches Help", callback_data="help_batches")],
         [InlineKeyboardButton("📅 View Scheduled Posts", callback_data="help_scheduled_posts")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+        [BACK_TO_MENU_BUTTON]
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
     
@@ -2636,7 +2683,7 @@ async def channels_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = update.effective_user
     
     # Get user's channels
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     keyboard = []
     
@@ -2744,7 +2791,7 @@ async def handle_channel_input(update: Update, user, text: str, session_data: di
 
 async def handle_channel_callback(query, user, data):
     """Handle channel management callbacks"""
-    action = data.replace("channels_", "")
+    action = data.removeprefix("channels_")
     
     if action == "add":
         Database.update_user_session(user.id, BotStates.WAITING_CHANNEL_ID)
@@ -2761,7 +2808,7 @@ async def handle_channel_callback(query, user, data):
         )
         
     elif action == "list":
-        channels = Database.get_user_channels(user.id)
+        channels = cached_get_user_channels(user.id)
         if not channels:
             await query.edit_message_text("❌ No channels configured.")
             return
@@ -2775,7 +2822,7 @@ async def handle_channel_callback(query, user, data):
         await query.edit_message_text(message, parse_mode='Markdown')
         
     elif action == "remove":
-        channels = Database.get_user_channels(user.id)
+        channels = cached_get_user_channels(user.id)
         if not channels:
             await query.edit_message_text("❌ No channels to remove.")
             return
@@ -2803,7 +2850,7 @@ async def handle_channel_callback(query, user, data):
 async def handle_channel_selection(query, user, data, context=None):
     """Handle channel selection for posting"""
     if data.startswith("remove_channel_"):
-        channel_id = data.replace("remove_channel_", "")
+        channel_id = data.removeprefix("remove_channel_")
         
         # SECURITY CHECK: Verify user owns the channel before removal
         if not Database.user_has_channel(user.id, channel_id):
@@ -2827,7 +2874,7 @@ async def handle_channel_selection(query, user, data, context=None):
 
 async def prompt_channel_selection(update, user_id: int, pending_posts: list):
     """Show channel selection for scheduling"""
-    channels = Database.get_user_channels(user_id)
+    channels = cached_get_user_channels(user_id)
     
     if not channels:
         await update.reply_text(
@@ -2867,7 +2914,7 @@ async def stats_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     stats = Database.get_user_stats(user.id)
     
     # Get user channels for channel-specific buttons
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     keyboard = []
     
@@ -2877,7 +2924,7 @@ async def stats_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     keyboard.extend([
         [InlineKeyboardButton("🔄 Refresh Stats", callback_data="main_stats")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+        [BACK_TO_MENU_BUTTON]
     ])
     reply_markup = InlineKeyboardMarkup(keyboard)
     
@@ -2918,7 +2965,7 @@ async def stats_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 from datetime import datetime
                 dt = datetime.fromisoformat(scheduled_time)
                 time_str = dt.strftime("%m/%d %H:%M")
-                media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+                media_icon = get_media_icon(media_type)
                 channel_display = channel_name if channel_name != 'Unknown Channel' else channel_id
                 next_posts_text += f"• {time_str} - {media_icon} {channel_display}\n"
             except (ValueError, TypeError, AttributeError) as e:
@@ -2997,11 +3044,10 @@ async def clearscheduled_handler(update: Update, context: ContextTypes.DEFAULT_T
     
     # Build channel breakdown for display
     channel_breakdown = ""
+    channel_names = {ch['channel_id']: ch['channel_name'] for ch in cached_get_user_channels(user.id)}
     for channel_id, posts in scheduled_posts_by_channel.items():
         if posts:
-            # Get channel name
-            channels = Database.get_user_channels(user.id)
-            channel_name = next((ch['channel_name'] for ch in channels if ch['channel_id'] == channel_id), channel_id)
+            channel_name = channel_names.get(channel_id, channel_id)
             channel_breakdown += f"• {channel_name}: {len(posts)} posts\n"
     
     # Show options: clear all or select channel
@@ -3070,7 +3116,7 @@ async def handle_reset_callback(query, user):
 
 async def handle_clearqueue_callback(query, user, data):
     """Handle clearqueue confirmation callbacks"""
-    action = data.replace("clearqueue_", "")
+    action = data.removeprefix("clearqueue_")
     
     if action == "confirm":
         # Clear all queued posts
@@ -3095,7 +3141,7 @@ async def handle_clearqueue_callback(query, user, data):
 
 async def handle_main_menu_callback(query, user, data):
     """Handle main menu button callbacks"""
-    action = data.replace("main_", "")
+    action = data.removeprefix("main_")
     
     # Handle "main_menu" specifically - return to main menu
     if action == "menu":
@@ -3106,7 +3152,7 @@ async def handle_main_menu_callback(query, user, data):
     
     if action == "mode1":
         # Check if user has channels configured
-        channels = Database.get_user_channels(user.id)
+        channels = cached_get_user_channels(user.id)
         
         if not channels:
             await query.edit_message_text(
@@ -3121,7 +3167,7 @@ async def handle_main_menu_callback(query, user, data):
         
     elif action == "mode2":
         # Check if user has channels configured
-        channels = Database.get_user_channels(user.id)
+        channels = cached_get_user_channels(user.id)
         
         if not channels:
             await query.edit_message_text(
@@ -3136,7 +3182,7 @@ async def handle_main_menu_callback(query, user, data):
     
     elif action == "mode3":
         # Check if user has channels configured
-        channels = Database.get_user_channels(user.id)
+        channels = cached_get_user_channels(user.id)
         
         if not channels:
             await query.edit_message_text(
@@ -3187,7 +3233,7 @@ async def handle_main_menu_callback(query, user, data):
 
 async def channels_handler_inline(query, user):
     """Handle inline channels management"""
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     keyboard = []
     
@@ -3198,7 +3244,7 @@ async def channels_handler_inline(query, user):
     else:
         keyboard.append([InlineKeyboardButton("➕ Add Your First Channel", callback_data="channels_add")])
     
-    keyboard.append([InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")])
+    keyboard.append([BACK_TO_MENU_BUTTON])
     reply_markup = InlineKeyboardMarkup(keyboard)
     
     if channels:
@@ -3226,7 +3272,7 @@ async def stats_handler_inline(query, user):
     stats = Database.get_user_stats(user.id)
     
     # Get user channels for channel-specific buttons
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     keyboard = []
     
@@ -3236,7 +3282,7 @@ async def stats_handler_inline(query, user):
     
     keyboard.extend([
         [InlineKeyboardButton("🔄 Refresh Stats", callback_data="main_stats")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+        [BACK_TO_MENU_BUTTON]
     ])
     reply_markup = InlineKeyboardMarkup(keyboard)
     
@@ -3277,7 +3323,7 @@ async def stats_handler_inline(query, user):
                 from datetime import datetime
                 dt = datetime.fromisoformat(scheduled_time)
                 time_str = dt.strftime("%m/%d %H:%M")
-                media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+                media_icon = get_media_icon(media_type)
                 channel_display = channel_name if channel_name != 'Unknown Channel' else channel_id
                 next_posts_text += f"• {time_str} - {media_icon} {channel_display}\n"
             except (ValueError, TypeError, AttributeError) as e:
@@ -3311,7 +3357,7 @@ async def stats_handler_inline(query, user):
 
 async def stats_channels_handler(query, user):
     """Show channel selection for detailed stats"""
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     if not channels:
         await query.edit_message_text(
@@ -3350,8 +3396,7 @@ async def stats_channel_details_handler(query, user, channel_id):
         return
     
     # Get channel info
-    channels = Database.get_user_channels(user.id)
-    channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+    channel = cached_get_channel(user.id, channel_id)
     
     if not channel:
         await query.edit_message_text("❌ Channel not found!")
@@ -3394,7 +3439,7 @@ async def stats_channel_details_handler(query, user, channel_id):
                 from datetime import datetime
                 scheduled_dt = datetime.fromisoformat(post['scheduled_time'])
                 time_str = scheduled_dt.strftime("%m/%d %H:%M")
-                media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(post['media_type'], '📁')
+                media_icon = get_media_icon(post['media_type'])
                 
                 # Show full description without truncation, escaped for Markdown
                 desc = escape_markdown(post['description'] or "No description")
@@ -3435,8 +3480,7 @@ async def edit_mode2_posts_handler(query, user, channel_id):
             return
         
         # Get channel info
-        channels = Database.get_user_channels(user.id)
-        channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+        channel = cached_get_channel(user.id, channel_id)
         
         if not channel:
             logger.warning(f"Channel {channel_id} not found for user {user.id}")
@@ -3538,8 +3582,7 @@ async def edit_post_handler(query, user, post_id):
             return
         
         # Get channel name
-        channels = Database.get_user_channels(user.id)
-        channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+        channel = cached_get_channel(user.id, channel_id)
         channel_name = channel['channel_name'] if channel else channel_id
         
         # Handle scheduled_time that might be NULL (from retried posts)
@@ -3557,7 +3600,7 @@ async def edit_post_handler(query, user, post_id):
         else:
             time_str = "Not scheduled"
         
-        media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+        media_icon = get_media_icon(media_type)
         
         message = f"*✏️ Edit Post #{post_id}*\n\n"
         message += f"*📺 Channel:* {channel_name}\n"
@@ -3611,8 +3654,7 @@ async def edit_post_schedule_handler(query, user, post_id):
             return
         
         # Get channel name
-        channels = Database.get_user_channels(user.id)
-        channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+        channel = cached_get_channel(user.id, channel_id)
         channel_name = channel['channel_name'] if channel else channel_id
         
         # Handle scheduled_time that might be NULL (from retried posts)
@@ -3630,7 +3672,7 @@ async def edit_post_schedule_handler(query, user, post_id):
         else:
             time_str = "Not scheduled"
         
-        media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+        media_icon = get_media_icon(media_type)
         
         # Store post ID in session for editing
         from config import BotStates
@@ -3687,8 +3729,7 @@ async def edit_post_description_handler(query, user, post_id):
             return
         
         # Get channel name
-        channels = Database.get_user_channels(user.id)
-        channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+        channel = cached_get_channel(user.id, channel_id)
         channel_name = channel['channel_name'] if channel else channel_id
         
         # Handle scheduled_time that might be NULL (from retried posts)
@@ -3706,7 +3747,7 @@ async def edit_post_description_handler(query, user, post_id):
         else:
             time_str = "Not scheduled"
         
-        media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+        media_icon = get_media_icon(media_type)
         
         # Store post ID in session for editing
         from config import BotStates
@@ -3768,8 +3809,7 @@ async def handle_individual_post_description_edit(update: Update, user, text: st
             description, channel_id = row
             
             # Get channel name
-            channels = Database.get_user_channels(user.id)
-            channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+            channel = cached_get_channel(user.id, channel_id)
             channel_name = channel['channel_name'] if channel else channel_id
             
             desc_text = description or 'No description'
@@ -3803,7 +3843,7 @@ async def help_handler_inline(query, user):
         [InlineKeyboardButton("📺 Channels Help", callback_data="help_channels")],
         [InlineKeyboardButton("🔄 Recurring Help", callback_data="help_recurring")],
         [InlineKeyboardButton("📅 View Scheduled Posts", callback_data="help_scheduled_posts")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+        [BACK_TO_MENU_BUTTON]
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
     
@@ -3885,7 +3925,7 @@ Choose an option below:
 
 async def help_scheduled_posts_handler(query, user):
     """Display channel selection for viewing scheduled posts"""
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     if not channels:
         keyboard = [
@@ -3927,8 +3967,7 @@ Select a channel to view scheduled posts:
 async def help_channel_posts_handler(query, user, channel_id):
     """Display scheduled posts for a specific channel"""
     # Get channel info
-    channels = Database.get_user_channels(user.id)
-    channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+    channel = cached_get_channel(user.id, channel_id)
     
     if not channel:
         await query.edit_message_text("❌ Channel not found.")
@@ -4035,7 +4074,7 @@ async def help_delete_post_handler(query, user, channel_id, page: int = 0):
         if not dt:
             return float('inf')
         if dt.tzinfo is None:
-            dt = kyiv_tz.localize(dt)
+            dt = dt.replace(tzinfo=kyiv_tz)
         else:
             dt = dt.astimezone(kyiv_tz)
         return dt.timestamp()
@@ -4049,8 +4088,7 @@ async def help_delete_post_handler(query, user, channel_id, page: int = 0):
     end_index = start_index + page_size
     page_posts = scheduled_posts[start_index:end_index]
 
-    channels = Database.get_user_channels(user.id)
-    channel_info = next((ch for ch in channels if ch['channel_id'] == channel_id), {})
+    channel_info = cached_get_channel(user.id, channel_id) or {}
     channel_name = escape_markdown(channel_info.get('channel_name', channel_id))
 
     keyboard = []
@@ -4058,7 +4096,7 @@ async def help_delete_post_handler(query, user, channel_id, page: int = 0):
         scheduled_time = post.get('scheduled_time')
         if scheduled_time:
             if scheduled_time.tzinfo is None:
-                scheduled_time = kyiv_tz.localize(scheduled_time)
+                scheduled_time = scheduled_time.replace(tzinfo=kyiv_tz)
             else:
                 scheduled_time = scheduled_time.astimezone(kyiv_tz)
             time_str = scheduled_time.strftime("%b %d %H:%M")
@@ -4111,7 +4149,7 @@ async def help_delete_post_confirm(query, user, channel_id, post_id: int):
     scheduled_time = post.get('scheduled_time')
     if scheduled_time:
         if scheduled_time.tzinfo is None:
-            scheduled_time = kyiv_tz.localize(scheduled_time)
+            scheduled_time = scheduled_time.replace(tzinfo=kyiv_tz)
         else:
             scheduled_time = scheduled_time.astimezone(kyiv_tz)
         scheduled_str = scheduled_time.strftime("%Y-%m-%d %H:%M Kyiv")
@@ -4120,8 +4158,7 @@ async def help_delete_post_confirm(query, user, channel_id, post_id: int):
 
     description = escape_markdown(post.get('description') or 'No description')
 
-    channels = Database.get_user_channels(user.id)
-    channel_info = next((ch for ch in channels if ch['channel_id'] == channel_id), {})
+    channel_info = cached_get_channel(user.id, channel_id) or {}
     channel_name = escape_markdown(channel_info.get('channel_name', channel_id))
 
     media_icon = get_media_icon(post.get('media_type'))
@@ -4159,19 +4196,11 @@ async def help_delete_post_execute(query, user, channel_id, post_id: int):
         )
         return
 
-    scheduler = None
+    # The bot has no link back to the application, so use the shared scheduler directly
     try:
-        bot = query.get_bot()
-        if bot and bot.application and bot.application.bot_data:
-            scheduler = bot.application.bot_data.get('scheduler')
-    except AttributeError:
-        scheduler = None
-
-    if scheduler:
-        try:
-            await scheduler.cancel_post_job(post_id)
-        except Exception as e:
-            logger.error(f"Error cancelling scheduler job for post {post_id}: {e}")
+        await PostScheduler.instance().cancel_post_job(post_id)
+    except Exception as e:
+        logger.error(f"Error cancelling scheduler job for post {post_id}: {e}")
 
     deleted = Database.delete_scheduled_post(user.id, post_id)
 
@@ -4194,7 +4223,7 @@ async def help_delete_post_execute(query, user, channel_id, post_id: int):
 
 async def handle_help_callback(query, user, data):
     """Handle help topic callbacks"""
-    topic = data.replace("help_", "")
+    topic = data.removeprefix("help_")
 
     if topic.startswith("delete_post|"):
         _, channel_id, page = topic.split("|", 2)
@@ -4213,7 +4242,7 @@ async def handle_help_callback(query, user, data):
         await help_scheduled_posts_handler(query, user)
         return
     elif topic.startswith("channel_posts_"):
-        channel_id = topic.replace("channel_posts_", "")
+        channel_id = topic.removeprefix("channel_posts_")
         await help_channel_posts_handler(query, user, channel_id)
         return
     
@@ -4439,7 +4468,7 @@ Select posting frequency:
 
 async def handle_recurring_callback(query, user, data, context=None):
     """Handle recurring schedule callbacks"""
-    action = data.replace("recurring_", "")
+    action = data.removeprefix("recurring_")
     
     # Handle start time selection for recurring posts
     if action == "start_now":
@@ -4517,7 +4546,7 @@ async def handle_recurring_callback(query, user, data, context=None):
     
     # Handle individual recurring post schedule options (old format)
     elif action.startswith("recur_"):
-        recur_action = action.replace("recur_", "")
+        recur_action = action.removeprefix("recur_")
         
         if recur_action == "daily":
             interval_hours = 24
@@ -4555,13 +4584,7 @@ async def handle_recurring_callback(query, user, data, context=None):
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
-        interval_text = f"{interval_hours} hours"
-        if interval_hours == 24:
-            interval_text = "24 hours (daily)"
-        elif interval_hours == 48:
-            interval_text = "48 hours (every 2 days)"
-        elif interval_hours == 168:
-            interval_text = "168 hours (weekly)"
+        interval_text = INTERVAL_TEXTS.get(interval_hours, f"{interval_hours} hours")
         
         message = f"""
 🔄 *Individual Post Recurring Schedule*
@@ -4858,13 +4881,13 @@ Choose end condition:
     # Handle initial options - extract interval from action type
     if action == "daily":
         interval_hours = 24
-        interval_text = "24 hours (daily)"
+        interval_text = INTERVAL_TEXTS[interval_hours]
     elif action == "2days":
         interval_hours = 48
-        interval_text = "48 hours (every 2 days)"
+        interval_text = INTERVAL_TEXTS[interval_hours]
     elif action == "weekly":
         interval_hours = 168
-        interval_text = "168 hours (weekly)"
+        interval_text = INTERVAL_TEXTS[interval_hours]
     elif action == "custom":
         session_data = {"action": "recurring_setup"}
         Database.update_user_session(user.id, "waiting_recurring_hours", session_data)
@@ -4881,7 +4904,7 @@ Choose end condition:
     else:
         # Fallback for unknown actions
         interval_hours = 24
-        interval_text = "24 hours (daily)"
+        interval_text = INTERVAL_TEXTS[interval_hours]
     
     # Show end condition options
     keyboard = [
@@ -4922,7 +4945,7 @@ def setup_recurring_posts_direct(user, interval_hours, recurring_count=None, rec
         return False
     
     # Get target channel  
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     if len(channels) == 1:
         target_channel_id = channels[0]['channel_id']
@@ -4932,8 +4955,10 @@ def setup_recurring_posts_direct(user, interval_hours, recurring_count=None, rec
     # Create new recurring posts 
     first_post_time = get_current_kyiv_time() + timedelta(minutes=1)
     
-    for i, post in enumerate(pending_posts):
-        post_start_time = first_post_time + timedelta(minutes=i)
+    # Stagger posts one minute apart, computing all start times up front
+    post_start_times = [first_post_time + timedelta(minutes=i) for i in range(len(pending_posts))]
+    
+    for post, post_start_time in zip(pending_posts, post_start_times):
         
         Database.add_post(
             user_id=user.id,
@@ -4957,53 +4982,58 @@ def setup_recurring_posts_direct(user, interval_hours, recurring_count=None, rec
     
     return True
 
+def _recurring_end_suffix(recurring_count=None, recurring_end_date=None) -> str:
+    """Build the callback data suffix that encodes a recurring end condition"""
+    if recurring_count:
+        return f"_count_{recurring_count}"
+    if recurring_end_date:
+        return f"_date_{recurring_end_date.isoformat()}"
+    return "_never"
+
 async def setup_recurring_posts_with_channel(query, user, interval_hours, channel_id, recurring_count=None, recurring_end_date=None):
     """Set up recurring posts with a specific channel"""
     # Only get unscheduled posts for the specific channel to avoid using all previous uploads
-    pending_posts = Database.get_pending_posts(user.id, channel_id=channel_id, unscheduled_only=True)
+    pending_posts = await asyncio.to_thread(
+        Database.get_pending_posts, user.id, channel_id=channel_id, unscheduled_only=True
+    )
     
     if not pending_posts:
         await query.edit_message_text("❌ No posts to schedule.")
         return
     
-    from bot.utils import get_current_kyiv_time
-    from datetime import timedelta
-    
     # Get channel name for display
-    channels = Database.get_user_channels(user.id)
-    selected_channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+    selected_channel = cached_get_channel(user.id, channel_id)
     channel_name = selected_channel['channel_name'] if selected_channel else channel_id
     
     # Create new recurring posts 
     first_post_time = get_current_kyiv_time() + timedelta(minutes=1)
     
-    for i, post in enumerate(pending_posts):
-        post_start_time = first_post_time + timedelta(minutes=i)
+    # Stagger posts one minute apart, computing all start times up front
+    post_start_times = [first_post_time + timedelta(minutes=i) for i in range(len(pending_posts))]
+    
+    def create_recurring_posts():
+        Database.add_posts_bulk(user.id, channel_id, [
+            {
+                'file_path': post['file_path'],
+                'media_type': post.get('media_type', 'photo'),
+                'description': post['description'],
+                'scheduled_time': post_start_time,
+                'mode': post['mode'],
+                'is_recurring': True,
+                'recurring_interval_hours': interval_hours,
+                'recurring_end_date': recurring_end_date,
+                'recurring_count': recurring_count
+            }
+            for post, post_start_time in zip(pending_posts, post_start_times)
+        ])
         
-        Database.add_post(
-            user_id=user.id,
-            file_path=post['file_path'],
-            media_type=post.get('media_type', 'photo'),
-            description=post['description'],
-            scheduled_time=post_start_time,
-            mode=post['mode'],
-            channel_id=channel_id,
-            is_recurring=True,
-            recurring_interval_hours=interval_hours,
-            recurring_end_date=recurring_end_date,
-            recurring_count=recurring_count
-        )
+        # Clear only the specific channel's posts that were used for recurring setup
+        Database.clear_queued_posts(user.id, channel_id)
     
-    # Clear only the specific channel's posts that were used for recurring setup
-    Database.clear_queued_posts(user.id, channel_id)
+    # Keep the inserts off the event loop so other updates are not stalled
+    await asyncio.to_thread(create_recurring_posts)
     
-    interval_text = f"{interval_hours} hours"
-    if interval_hours == 24:
-        interval_text = "24 hours (daily)"
-    elif interval_hours == 48:
-        interval_text = "48 hours (every 2 days)"  
-    elif interval_hours == 168:
-        interval_text = "168 hours (weekly)"
+    interval_text = INTERVAL_TEXTS.get(interval_hours, f"{interval_hours} hours")
     
     end_info = ""
     if recurring_count:
@@ -5013,8 +5043,7 @@ async def setup_recurring_posts_with_channel(query, user, interval_hours, channe
     else:
         end_info = f"• **Duration:** Infinite (manual stop required)\n"
     
-    keyboard = [[InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    reply_markup = BACK_TO_MAIN_MARKUP
     
     await query.edit_message_text(
         f"✅ *Recurring Schedule Activated!*\n\n"
@@ -5029,38 +5058,30 @@ async def setup_recurring_posts_with_channel(query, user, interval_hours, channe
         reply_markup=reply_markup,
         parse_mode='Markdown'
     )
-    
     Database.update_user_session(user.id, BotStates.IDLE)
 
 async def setup_recurring_posts(query, user, interval_hours, recurring_count=None, recurring_end_date=None):
     """Set up recurring posts with specified parameters"""
     # Only get unscheduled posts to avoid using all previous uploads
-    pending_posts = Database.get_pending_posts(user.id, unscheduled_only=True)
+    pending_posts = await asyncio.to_thread(Database.get_pending_posts, user.id, unscheduled_only=True)
     
     if not pending_posts:
         await query.edit_message_text("❌ No posts to schedule.")
         return
     
-    # Get target channel  
-    channels = Database.get_user_channels(user.id)
+    # Get target channel
+    channels = cached_get_user_channels(user.id)
     
     if len(channels) > 1:
         # Show channel selection for recurring posts
-        keyboard = []
-        for channel in channels:
-            status = "⭐ " if channel['is_default'] else ""
-            callback_data = f"recurring_channel_{channel['channel_id']}_{interval_hours}"
-            if recurring_count:
-                callback_data += f"_count_{recurring_count}"
-            elif recurring_end_date:
-                callback_data += f"_date_{recurring_end_date.isoformat()}"
-            else:
-                callback_data += "_never"
-                
-            keyboard.append([InlineKeyboardButton(
-                f"{status}{channel['channel_name']}", 
-                callback_data=callback_data
-            )])
+        suffix = _recurring_end_suffix(recurring_count, recurring_end_date)
+        keyboard = [
+            [InlineKeyboardButton(
+                f"{'⭐ ' if channel['is_default'] else ''}{channel['channel_name']}",
+                callback_data=f"recurring_channel_{channel['channel_id']}_{interval_hours}{suffix}"
+            )]
+            for channel in channels
+        ]
         
         keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="schedule_cancel")])
         reply_markup = InlineKeyboardMarkup(keyboard)
@@ -5081,32 +5102,31 @@ async def setup_recurring_posts(query, user, interval_hours, recurring_count=Non
     # Create new recurring posts 
     first_post_time = get_current_kyiv_time() + timedelta(minutes=1)
     
-    for i, post in enumerate(pending_posts):
-        post_start_time = first_post_time + timedelta(minutes=i)
+    # Stagger posts one minute apart, computing all start times up front
+    post_start_times = [first_post_time + timedelta(minutes=i) for i in range(len(pending_posts))]
+    
+    def create_recurring_posts():
+        Database.add_posts_bulk(user.id, target_channel_id, [
+            {
+                'file_path': post['file_path'],
+                'description': post['description'],
+                'scheduled_time': post_start_time,
+                'mode': post['mode'],
+                'is_recurring': True,
+                'recurring_interval_hours': interval_hours,
+                'recurring_end_date': recurring_end_date,
+                'recurring_count': recurring_count
+            }
+            for post, post_start_time in zip(pending_posts, post_start_times)
+        ])
         
-        Database.add_post(
-            user_id=user.id,
-            file_path=post['file_path'],
-            description=post['description'],
-            scheduled_time=post_start_time,
-            mode=post['mode'],
-            channel_id=target_channel_id,
-            is_recurring=True,
-            recurring_interval_hours=interval_hours,
-            recurring_end_date=recurring_end_date,
-            recurring_count=recurring_count
-        )
+        # Clear only posts from the selected channel
+        Database.clear_queued_posts(user.id, target_channel_id)
     
-    # Clear only posts from the selected channel
-    Database.clear_queued_posts(user.id, target_channel_id)
+    # Keep the inserts off the event loop so other updates are not stalled
+    await asyncio.to_thread(create_recurring_posts)
     
-    interval_text = f"{interval_hours} hours"
-    if interval_hours == 24:
-        interval_text = "24 hours (daily)"
-    elif interval_hours == 48:
-        interval_text = "48 hours (every 2 days)"  
-    elif interval_hours == 168:
-        interval_text = "168 hours (weekly)"
+    interval_text = INTERVAL_TEXTS.get(interval_hours, f"{interval_hours} hours")
     
     end_info = ""
     if recurring_count:
@@ -5116,8 +5136,7 @@ async def setup_recurring_posts(query, user, interval_hours, recurring_count=Non
     else:
         end_info = f"• **Duration:** Infinite (manual stop required)\n"
     
-    keyboard = [[InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    reply_markup = BACK_TO_MAIN_MARKUP
     
     await query.edit_message_text(
         f"✅ **Recurring Schedule Activated!**\n\n"
@@ -5131,13 +5150,12 @@ async def setup_recurring_posts(query, user, interval_hours, recurring_count=Non
         f"Use /reset to stop all recurring posts.",
         reply_markup=reply_markup
     )
-    
     Database.update_user_session(user.id, BotStates.IDLE)
 
 async def setup_individual_recurring_post(query, user, interval_hours, recurring_count=None, recurring_end_date=None, first_post_time=None):
     """Set up recurring posts for individual mode"""
     # Get the post data from the current recurring mode session
-    mode, session_data = Database.get_user_session(user.id)
+    mode, session_data = await asyncio.to_thread(Database.get_user_session, user.id)
     if mode != 'RECURRING_MODE':
         await query.edit_message_text("❌ No post to schedule for recurring.")
         return
@@ -5152,24 +5170,18 @@ async def setup_individual_recurring_post(query, user, interval_hours, recurring
         return
     
     # Get target channel
-    channels = Database.get_user_channels(user.id)
+    channels = await asyncio.to_thread(cached_get_user_channels, user.id)
     
     if len(channels) > 1:
         # Show channel selection for individual recurring post
-        keyboard = []
-        for channel in channels:
-            callback_data = f"recur_channel_{channel['channel_id']}_{interval_hours}"
-            if recurring_count:
-                callback_data += f"_count_{recurring_count}"
-            elif recurring_end_date:
-                callback_data += f"_date_{recurring_end_date.isoformat()}"
-            else:
-                callback_data += "_never"
-                
-            keyboard.append([InlineKeyboardButton(
-                f"📺 {channel['channel_name']}", 
-                callback_data=callback_data
-            )])
+        suffix = _recurring_end_suffix(recurring_count, recurring_end_date)
+        keyboard = [
+            [InlineKeyboardButton(
+                f"📺 {channel['channel_name']}",
+                callback_data=f"recur_channel_{channel['channel_id']}_{interval_hours}{suffix}"
+            )]
+            for channel in channels
+        ]
         
         keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="recurring_schedule")])
         reply_markup = InlineKeyboardMarkup(keyboard)
@@ -5188,14 +5200,12 @@ async def setup_individual_recurring_post(query, user, interval_hours, recurring
         await query.edit_message_text("❌ No channels configured!")
         return
     
-    from bot.utils import get_current_kyiv_time
-    from datetime import timedelta
-    
     # Use provided first_post_time or default to 1 minute from now
     if first_post_time is None:
         first_post_time = get_current_kyiv_time() + timedelta(minutes=1)
     
-    Database.add_post(
+    await asyncio.to_thread(
+        Database.add_post,
         user_id=user.id,
         file_path=file_path,
         media_type=media_type,
@@ -5209,13 +5219,7 @@ async def setup_individual_recurring_post(query, user, interval_hours, recurring
         recurring_count=recurring_count
     )
     
-    interval_text = f"{interval_hours} hours"
-    if interval_hours == 24:
-        interval_text = "24 hours (daily)"
-    elif interval_hours == 48:
-        interval_text = "48 hours (every 2 days)"  
-    elif interval_hours == 168:
-        interval_text = "168 hours (weekly)"
+    interval_text = INTERVAL_TEXTS.get(interval_hours, f"{interval_hours} hours")
     
     end_info = ""
     if recurring_count:
@@ -5225,8 +5229,7 @@ async def setup_individual_recurring_post(query, user, interval_hours, recurring
     else:
         end_info = f"• *Duration:* Infinite (manual stop required)\n"
     
-    keyboard = [[InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    reply_markup = BACK_TO_MAIN_MARKUP
     
     await query.edit_message_text(
         f"✅ *Individual Recurring Post Activated!*\n\n"
@@ -5240,14 +5243,12 @@ async def setup_individual_recurring_post(query, user, interval_hours, recurring
         reply_markup=reply_markup,
         parse_mode='Markdown'
     )
-    
-    # Clear the session since we've scheduled the post
     Database.update_user_session(user.id, BotStates.IDLE)
 
 async def setup_individual_recurring_post_with_channel(query, user, interval_hours, channel_id, recurring_count=None, recurring_end_date=None, first_post_time=None):
     """Set up individual recurring post with specific channel"""
     # Get the post data from the current recurring mode session
-    mode, session_data = Database.get_user_session(user.id)
+    mode, session_data = await asyncio.to_thread(Database.get_user_session, user.id)
     if mode != 'RECURRING_MODE':
         await query.edit_message_text("❌ No post to schedule for recurring.")
         return
@@ -5261,19 +5262,16 @@ async def setup_individual_recurring_post_with_channel(query, user, interval_hou
         await query.edit_message_text("❌ No media file found for recurring schedule.")
         return
     
-    from bot.utils import get_current_kyiv_time
-    from datetime import timedelta
-    
     # Get channel name for display
-    channels = Database.get_user_channels(user.id)
-    selected_channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+    selected_channel = await asyncio.to_thread(cached_get_channel, user.id, channel_id)
     channel_name = selected_channel['channel_name'] if selected_channel else channel_id
     
     # Use provided first_post_time or default to 1 minute from now
     if first_post_time is None:
         first_post_time = get_current_kyiv_time() + timedelta(minutes=1)
     
-    Database.add_post(
+    await asyncio.to_thread(
+        Database.add_post,
         user_id=user.id,
         file_path=file_path,
         media_type=media_type,
@@ -5287,13 +5285,7 @@ async def setup_individual_recurring_post_with_channel(query, user, interval_hou
         recurring_count=recurring_count
     )
     
-    interval_text = f"{interval_hours} hours"
-    if interval_hours == 24:
-        interval_text = "24 hours (daily)"
-    elif interval_hours == 48:
-        interval_text = "48 hours (every 2 days)"  
-    elif interval_hours == 168:
-        interval_text = "168 hours (weekly)"
+    interval_text = INTERVAL_TEXTS.get(interval_hours, f"{interval_hours} hours")
     
     end_info = ""
     if recurring_count:
@@ -5303,8 +5295,7 @@ async def setup_individual_recurring_post_with_channel(query, user, interval_hou
     else:
         end_info = f"• *Duration:* Infinite (manual stop required)\n"
     
-    keyboard = [[InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    reply_markup = BACK_TO_MAIN_MARKUP
     
     await query.edit_message_text(
         f"✅ *Individual Recurring Post Activated!*\n\n"
@@ -5318,8 +5309,6 @@ async def setup_individual_recurring_post_with_channel(query, user, interval_hou
         reply_markup=reply_markup,
         parse_mode='Markdown'
     )
-    
-    # Clear the session since we've scheduled the post
     Database.update_user_session(user.id, BotStates.IDLE)
 
 
@@ -5493,7 +5482,7 @@ async def handle_recurring_start_time_input(update: Update, user, text: str, ses
             start_time = start_time.replace(hour=current_time.hour, minute=0)
         
         # Make it timezone-aware
-        start_time = kyiv_tz.localize(start_time)
+        start_time = start_time.replace(tzinfo=kyiv_tz)
         
         # Validate it's in the future
         if start_time <= current_time:
@@ -5549,6 +5538,7 @@ async def finalize_recurring_post(query, user, session_data: dict, recurring_con
                   first_post_time.isoformat(), post_id, user.id))
             conn.commit()
             conn.close()
+            db_cache.invalidate_scheduled_posts(user.id)
             
             # Schedule via shared scheduler
             if context and 'scheduler' in context.application.bot_data:
@@ -5556,13 +5546,7 @@ async def finalize_recurring_post(query, user, session_data: dict, recurring_con
                 scheduler._schedule_single_post(post_id, first_post_time)
                 logger.info(f"Scheduled recurring post {post_id} via shared scheduler")
             
-            interval_text = f"{interval_hours} hours"
-            if interval_hours == 24:
-                interval_text = "24 hours (daily)"
-            elif interval_hours == 48:
-                interval_text = "48 hours (every 2 days)"
-            elif interval_hours == 168:
-                interval_text = "168 hours (weekly)"
+            interval_text = INTERVAL_TEXTS.get(interval_hours, f"{interval_hours} hours")
             
             end_info = ""
             if recurring_count:
@@ -5572,8 +5556,7 @@ async def finalize_recurring_post(query, user, session_data: dict, recurring_con
             else:
                 end_info = "*End Condition:* Never (runs until manually stopped)\n"
             
-            keyboard = [[InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = BACK_TO_MAIN_MARKUP
             
             await query.edit_message_text(
                 f"✅ *Recurring Post Scheduled!*\n\n"
@@ -5616,7 +5599,7 @@ async def finalize_recurring_post(query, user, session_data: dict, recurring_con
         
         # Get channel from session (user selected it earlier) or fall back to first channel
         target_channel_id = session_data.get('channel_id')
-        channels = Database.get_user_channels(user.id)
+        channels = cached_get_user_channels(user.id)
         
         if not channels:
             await query.edit_message_text("❌ No channels configured!")
@@ -5643,13 +5626,7 @@ async def finalize_recurring_post(query, user, session_data: dict, recurring_con
             recurring_count=recurring_count
         )
         
-        interval_text = f"{interval_hours} hours"
-        if interval_hours == 24:
-            interval_text = "24 hours (daily)"
-        elif interval_hours == 48:
-            interval_text = "48 hours (every 2 days)"
-        elif interval_hours == 168:
-            interval_text = "168 hours (weekly)"
+        interval_text = INTERVAL_TEXTS.get(interval_hours, f"{interval_hours} hours")
         
         end_info = ""
         if recurring_count:
@@ -5659,8 +5636,7 @@ async def finalize_recurring_post(query, user, session_data: dict, recurring_con
         else:
             end_info = f"• *Duration:* Infinite (manual stop required)\n"
         
-        keyboard = [[InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        reply_markup = BACK_TO_MAIN_MARKUP
         
         await query.edit_message_text(
             f"✅ *Individual Recurring Post Activated!*\n\n"
@@ -5713,14 +5689,9 @@ async def finalize_recurring_post_from_message(update: Update, user, session_dat
                   first_post_time.isoformat(), post_id, user.id))
             conn.commit()
             conn.close()
+            db_cache.invalidate_scheduled_posts(user.id)
             
-            interval_text = f"{interval_hours} hours"
-            if interval_hours == 24:
-                interval_text = "24 hours (daily)"
-            elif interval_hours == 48:
-                interval_text = "48 hours (every 2 days)"
-            elif interval_hours == 168:
-                interval_text = "168 hours (weekly)"
+            interval_text = INTERVAL_TEXTS.get(interval_hours, f"{interval_hours} hours")
             
             end_info = ""
             if recurring_count:
@@ -5730,8 +5701,7 @@ async def finalize_recurring_post_from_message(update: Update, user, session_dat
             else:
                 end_info = "*End Condition:* Never (runs until manually stopped)\n"
             
-            keyboard = [[InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = BACK_TO_MAIN_MARKUP
             
             await update.message.reply_text(
                 f"✅ *Recurring Post Scheduled!*\n\n"
@@ -5774,7 +5744,7 @@ async def finalize_recurring_post_from_message(update: Update, user, session_dat
         
         # Get channel from session (user selected it earlier) or fall back to first channel
         target_channel_id = session_data.get('channel_id')
-        channels = Database.get_user_channels(user.id)
+        channels = cached_get_user_channels(user.id)
         
         if not channels:
             await update.message.reply_text("❌ No channels configured!")
@@ -5801,13 +5771,7 @@ async def finalize_recurring_post_from_message(update: Update, user, session_dat
             recurring_count=recurring_count
         )
         
-        interval_text = f"{interval_hours} hours"
-        if interval_hours == 24:
-            interval_text = "24 hours (daily)"
-        elif interval_hours == 48:
-            interval_text = "48 hours (every 2 days)"
-        elif interval_hours == 168:
-            interval_text = "168 hours (weekly)"
+        interval_text = INTERVAL_TEXTS.get(interval_hours, f"{interval_hours} hours")
         
         end_info = ""
         if recurring_count:
@@ -5817,8 +5781,7 @@ async def finalize_recurring_post_from_message(update: Update, user, session_dat
         else:
             end_info = f"• *Duration:* Infinite (manual stop required)\n"
         
-        keyboard = [[InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        reply_markup = BACK_TO_MAIN_MARKUP
         
         await update.message.reply_text(
             f"✅ *Individual Recurring Post Activated!*\n\n"
@@ -6071,28 +6034,11 @@ async def handle_recurring_count_input(update: Update, user, text: str, session_
 async def handle_recurring_date_input(update: Update, user, text: str, session_data: dict):
     """Handle recurring end date input"""
     try:
-        from datetime import datetime
-        from bot.utils import get_kyiv_timezone
-        
         # Parse the date string
         date_str = text.strip()
         
         # Try different date formats
-        date_formats = [
-            "%Y-%m-%d %H:%M",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-            "%m/%d/%Y %H:%M",
-            "%d.%m.%Y %H:%M"
-        ]
-        
-        end_date = None
-        for fmt in date_formats:
-            try:
-                end_date = datetime.strptime(date_str, fmt)
-                break
-            except ValueError:
-                continue
+        end_date = _parse_end_date(date_str)
         
         if not end_date:
             await update.message.reply_text(
@@ -6109,7 +6055,7 @@ async def handle_recurring_date_input(update: Update, user, text: str, session_d
         
         # Add timezone info
         kyiv_tz = get_kyiv_timezone()
-        end_date = kyiv_tz.localize(end_date)
+        end_date = end_date.replace(tzinfo=kyiv_tz)
         
         # Check if date is in the future
         current_time = get_current_kyiv_time()
@@ -6163,12 +6109,77 @@ async def handle_recurring_date_input(update: Update, user, text: str, session_d
 
 # New Multi-Channel Batch Management Handlers
 
+MULTIBATCH_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📦 Create New Batch", callback_data="batch_create")],
+    [InlineKeyboardButton("📋 View My Batches", callback_data="batch_list")],
+    [InlineKeyboardButton("📅 Schedule All Batches", callback_data="batch_schedule_all")],
+    [InlineKeyboardButton("🗑️ Clear All Batches", callback_data="batch_clear_all")],
+    [BACK_TO_MENU_BUTTON]
+])
+
+BACK_TO_BATCHES_MARKUP = InlineKeyboardMarkup([[InlineKeyboardButton("🔙 Back to Batches", callback_data="batch_list")]])
+
+BATCH_LIST_PAGE_SIZE = 20
+
+NO_BATCHES_MARKUP = InlineKeyboardMarkup([[InlineKeyboardButton("📦 Create First Batch", callback_data="batch_create")]])
+
+@lru_cache(maxsize=1024)
+def _batch_finish_markup(batch_id: int) -> InlineKeyboardMarkup:
+    """Keyboard shown after finishing uploads to a batch; markups are immutable so they can be reused"""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton("📅 Schedule This Batch", callback_data=f"batch_schedule_{batch_id}")],
+        [InlineKeyboardButton("📦 Create Another Batch", callback_data="batch_create")],
+        [InlineKeyboardButton("📋 View All Batches", callback_data="batch_list")],
+        [BACK_TO_MENU_BUTTON]
+    ])
+
+@lru_cache(maxsize=4096)
+def _batch_select_button(batch_id: int, label: str) -> InlineKeyboardButton:
+    """Batch list entry; buttons are immutable, so unchanged ones are reused across re-renders"""
+    return InlineKeyboardButton(label, callback_data=f"batch_select_{batch_id}")
+
+def _batch_media_count(session_data: dict) -> int:
+    """Number of media uploaded in the current batch session"""
+    # Items live in the posts table; older sessions still carry the full list
+    return session_data.get('media_count', len(session_data.get('media_items', [])))
+
+async def _render_multibatch_menu(user_id: int):
+    """Build the multi-channel batch menu text and keyboard for a user"""
+    channels = await asyncio.to_thread(cached_get_user_channels, user_id)
+    # Get the batch count and the few most recent batches for the summary
+    batch_count, recent_batches = await asyncio.to_thread(cached_get_user_batches_summary, user_id)
+    
+    batch_summary = ""
+    if batch_count:
+        lines = [f"\n\n*Current Batches:* {batch_count}"]
+        lines.extend(  # Show first 3 batches
+            f"\n• {batch['batch_name']} → {batch['channel_name']} ({batch['post_count']} posts)"
+            for batch in recent_batches
+        )
+        if batch_count > 3:
+            lines.append(f"\n• ... and {batch_count - 3} more")
+        batch_summary = "".join(lines)
+    
+    message = f"""
+🔥 *Multi-Channel Batch Scheduler*
+
+Create separate batches of posts for different channels! This lets you:
+• Upload photos for multiple channels at once
+• Schedule each batch independently
+• Mix Mode 1 (bulk) and Mode 2 (with descriptions)
+
+*Available Channels:* {len(channels)}{batch_summary}
+
+Choose an option:
+"""
+    return message, MULTIBATCH_MARKUP
+
 async def multibatch_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /multibatch command - multi-channel batch scheduling"""
     user = update.effective_user
     
     # Check if user has channels configured
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     if not channels:
         await update.message.reply_text(
@@ -6178,44 +6189,12 @@ async def multibatch_handler(update: Update, context: ContextTypes.DEFAULT_TYPE)
         )
         return
     
-    # Get existing batches
-    batches = Database.get_user_batches(user.id)
-    
     # Update user session
     Database.update_user_session(user.id, BotStates.MULTI_BATCH_MENU, {
         'start_time': datetime.now().isoformat()
     })
     
-    keyboard = [
-        [InlineKeyboardButton("📦 Create New Batch", callback_data="batch_create")],
-        [InlineKeyboardButton("📋 View My Batches", callback_data="batch_list")],
-        [InlineKeyboardButton("📅 Schedule All Batches", callback_data="batch_schedule_all")],
-        [InlineKeyboardButton("🗑️ Clear All Batches", callback_data="batch_clear_all")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    
-    batch_summary = ""
-    if batches:
-        batch_summary = f"\n\n*Current Batches:* {len(batches)}"
-        for batch in batches[:3]:  # Show first 3 batches
-            batch_summary += f"\n• {batch['batch_name']} → {batch['channel_name']} ({batch['post_count']} posts)"
-        if len(batches) > 3:
-            batch_summary += f"\n• ... and {len(batches) - 3} more"
-    
-    message = f"""
-🔥 *Multi-Channel Batch Scheduler*
-
-Create separate batches of posts for different channels! This lets you:
-• Upload photos for multiple channels at once
-• Schedule each batch independently
-• Mix Mode 1 (bulk) and Mode 2 (with descriptions)
-
-*Available Channels:* {len(channels)}{batch_summary}
-
-Choose an option:
-"""
-    
+    message, reply_markup = await _render_multibatch_menu(user.id)
     await update.message.reply_text(message, reply_markup=reply_markup, parse_mode='Markdown')
 
 async def handle_batch_callback(query, user, data):
@@ -6224,67 +6203,36 @@ async def handle_batch_callback(query, user, data):
         await prompt_batch_creation(query, user)
     elif data == "batch_list":
         await show_batch_list(query, user)
+    elif data.startswith("batch_page_"):
+        page = int(data.removeprefix("batch_page_"))
+        await show_batch_list(query, user, page)
     elif data == "batch_schedule_all":
         await schedule_all_batches(query, user)
     elif data == "batch_clear_all":
         await confirm_clear_all_batches(query, user)
     elif data.startswith("batch_select_"):
-        batch_id = int(data.replace("batch_select_", ""))
+        batch_id = int(data.removeprefix("batch_select_"))
         await show_batch_details(query, user, batch_id)
     elif data.startswith("batch_delete_"):
-        batch_id = int(data.replace("batch_delete_", ""))
+        batch_id = int(data.removeprefix("batch_delete_"))
         await delete_batch_confirm(query, user, batch_id)
     elif data.startswith("batch_schedule_"):
-        batch_id = int(data.replace("batch_schedule_", ""))
+        batch_id = int(data.removeprefix("batch_schedule_"))
         await schedule_single_batch(query, user, batch_id)
     elif data.startswith("batch_channel_"):
-        channel_id = data.replace("batch_channel_", "")
+        channel_id = data.removeprefix("batch_channel_")
         await create_batch_for_channel(query, user, channel_id)
     elif data == "batch_back":
         # Show main batch menu again
-        channels = Database.get_user_channels(user.id)
-        batches = Database.get_user_batches(user.id)
-        
-        keyboard = [
-            [InlineKeyboardButton("📦 Create New Batch", callback_data="batch_create")],
-            [InlineKeyboardButton("📋 View My Batches", callback_data="batch_list")],
-            [InlineKeyboardButton("📅 Schedule All Batches", callback_data="batch_schedule_all")],
-            [InlineKeyboardButton("🗑️ Clear All Batches", callback_data="batch_clear_all")],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        batch_summary = ""
-        if batches:
-            batch_summary = f"\n\n*Current Batches:* {len(batches)}"
-            for batch in batches[:3]:
-                batch_summary += f"\n• {batch['batch_name']} → {batch['channel_name']} ({batch['post_count']} posts)"
-            if len(batches) > 3:
-                batch_summary += f"\n• ... and {len(batches) - 3} more"
-        
-        message = f"""
-🔥 *Multi-Channel Batch Scheduler*
-
-Create separate batches of posts for different channels! This lets you:
-• Upload photos for multiple channels at once
-• Schedule each batch independently
-• Mix Mode 1 (bulk) and Mode 2 (with descriptions)
-
-*Available Channels:* {len(channels)}{batch_summary}
-
-Choose an option:
-"""
-        
+        message, reply_markup = await _render_multibatch_menu(user.id)
         await query.edit_message_text(message, reply_markup=reply_markup, parse_mode='Markdown')
     elif data.startswith("batch_clear_confirmed"):
         # Clear all batches
-        batches = Database.get_user_batches(user.id)
-        for batch in batches:
-            Database.delete_batch(batch['id'])
+        await asyncio.to_thread(Database.delete_all_user_batches, user.id)
         await query.edit_message_text("✅ All batches cleared successfully!")
     elif data.startswith("batch_delete_confirmed_"):
-        batch_id = int(data.replace("batch_delete_confirmed_", ""))
-        success = Database.delete_batch(batch_id)
+        batch_id = int(data.removeprefix("batch_delete_confirmed_"))
+        success = await asyncio.to_thread(Database.delete_batch, batch_id)
         if success:
             await query.edit_message_text("✅ Batch deleted successfully!")
         else:
@@ -6293,15 +6241,15 @@ Choose an option:
 async def handle_batch_mode_callback(query, user, data):
     """Handle batch mode selection callbacks"""
     if data.startswith("batch_mode1_"):
-        batch_id = int(data.replace("batch_mode1_", ""))
+        batch_id = int(data.removeprefix("batch_mode1_"))
         await start_batch_mode1(query, user, batch_id)
     elif data.startswith("batch_mode2_"):
-        batch_id = int(data.replace("batch_mode2_", ""))
+        batch_id = int(data.removeprefix("batch_mode2_"))
         await start_batch_mode2(query, user, batch_id)
 
 async def prompt_batch_creation(query, user):
     """Prompt user to create a new batch"""
-    channels = Database.get_user_channels(user.id)
+    channels = await asyncio.to_thread(cached_get_user_channels, user.id)
     
     keyboard = []
     for channel in channels:
@@ -6324,7 +6272,7 @@ async def prompt_batch_creation(query, user):
 async def create_batch_for_channel(query, user, channel_id):
     """Create a new batch for the selected channel"""
     # SECURITY CHECK: Verify user owns the channel before creating batch
-    if not Database.user_has_channel(user.id, channel_id):
+    if not await asyncio.to_thread(Database.user_has_channel, user.id, channel_id):
         logger.error(f"Security violation: User {user.id} attempted to create batch for channel {channel_id} they don't own")
         await query.edit_message_text(
             "❌ *Security Error*\n\nYou don't have access to this channel.",
@@ -6338,8 +6286,7 @@ async def create_batch_for_channel(query, user, channel_id):
     })
     
     # Get channel name
-    channels = Database.get_user_channels(user.id)
-    channel_name = next((c['channel_name'] for c in channels if c['channel_id'] == channel_id), channel_id)
+    channel_name = await asyncio.to_thread(cached_get_channel_name, user.id, channel_id)
     
     await query.edit_message_text(
         f"*📦 Create Batch for {channel_name}*\n\n"
@@ -6364,11 +6311,10 @@ async def handle_batch_name_input(update: Update, user, text: str, session_data:
         return
     
     try:
-        batch_id = Database.create_batch(user.id, batch_name, channel_id)
+        batch_id = await asyncio.to_thread(Database.create_batch, user.id, batch_name, channel_id)
         
         # Get channel name
-        channels = Database.get_user_channels(user.id)
-        channel_name = next((c['channel_name'] for c in channels if c['channel_id'] == channel_id), channel_id)
+        channel_name = await asyncio.to_thread(cached_get_channel_name, user.id, channel_id)
         
         keyboard = [
             [
@@ -6402,7 +6348,7 @@ async def start_batch_mode1(query, user, batch_id):
     """Start Mode 1 (bulk) for a specific batch"""
     Database.update_user_session(user.id, BotStates.BATCH_MODE1_PHOTOS, {
         'batch_id': batch_id,
-        'media_items': [],
+        'media_count': 0,
         'start_time': datetime.now().isoformat()
     })
     
@@ -6420,7 +6366,7 @@ async def start_batch_mode2(query, user, batch_id):
     """Start Mode 2 (with descriptions) for a specific batch"""
     Database.update_user_session(user.id, BotStates.BATCH_MODE2_PHOTOS, {
         'batch_id': batch_id,
-        'media_items': [],
+        'media_count': 0,
         'current_media_path': None,
         'start_time': datetime.now().isoformat()
     })
@@ -6436,13 +6382,14 @@ async def start_batch_mode2(query, user, batch_id):
         parse_mode='Markdown'
     )
 
-async def show_batch_list(query, user):
-    """Show list of user's batches"""
-    batches = Database.get_user_batches(user.id)
+async def show_batch_list(query, user, page: int = 0):
+    """Show one page of the user's batches"""
+    batch_count, batches = await asyncio.to_thread(
+        cached_get_user_batches_page, user.id, page * BATCH_LIST_PAGE_SIZE, BATCH_LIST_PAGE_SIZE
+    )
     
-    if not batches:
-        keyboard = [[InlineKeyboardButton("📦 Create First Batch", callback_data="batch_create")]]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+    if not batch_count:
+        reply_markup = NO_BATCHES_MARKUP
         
         await query.edit_message_text(
             "*📋 No Batches Yet*\n\n"
@@ -6455,16 +6402,24 @@ async def show_batch_list(query, user):
     keyboard = []
     for batch in batches:
         status_icon = "✅" if batch['status'] == 'scheduled' else "📦"
-        keyboard.append([InlineKeyboardButton(
-            f"{status_icon} {batch['batch_name']} → {batch['channel_name']} ({batch['post_count']})",
-            callback_data=f"batch_select_{batch['id']}"
+        keyboard.append([_batch_select_button(
+            batch['id'], f"{status_icon} {batch['batch_name']} → {batch['channel_name']} ({batch['post_count']})"
         )])
     
+    # Prev/Next navigation when the batches do not fit on one page
+    nav_row = []
+    if page > 0:
+        nav_row.append(InlineKeyboardButton("⬅️ Prev", callback_data=f"batch_page_{page - 1}"))
+    if (page + 1) * BATCH_LIST_PAGE_SIZE < batch_count:
+        nav_row.append(InlineKeyboardButton("Next ➡️", callback_data=f"batch_page_{page + 1}"))
+    if nav_row:
+        keyboard.append(nav_row)
+    
     keyboard.append([InlineKeyboardButton("🔙 Back", callback_data="batch_back")])
     reply_markup = InlineKeyboardMarkup(keyboard)
     
     await query.edit_message_text(
-        f"*📋 Your Batches ({len(batches)})*\n\n"
+        f"*📋 Your Batches ({batch_count})*\n\n"
         "Select a batch to view details or schedule:",
         reply_markup=reply_markup,
         parse_mode='Markdown'
@@ -6472,17 +6427,18 @@ async def show_batch_list(query, user):
 
 async def show_batch_details(query, user, batch_id):
     """Show details of a specific batch"""
-    batches = Database.get_user_batches(user.id)
-    batch = next((b for b in batches if b['id'] == batch_id), None)
+    batch = await asyncio.to_thread(cached_get_user_batch, user.id, batch_id)
     
     if not batch:
         await query.edit_message_text("❌ Batch not found.")
         return
     
-    posts = Database.get_batch_posts(batch_id)
+    # Only the per-type counts are shown, so let SQL aggregate them
+    media_types = await asyncio.to_thread(Database.get_batch_media_type_counts, batch_id)
+    post_count = sum(media_types.values())
     
     keyboard = []
-    if posts:
+    if post_count:
         keyboard.append([InlineKeyboardButton("📅 Schedule This Batch", callback_data=f"batch_schedule_{batch_id}")])
     keyboard.extend([
         [InlineKeyboardButton("🗑️ Delete Batch", callback_data=f"batch_delete_{batch_id}")],
@@ -6492,58 +6448,47 @@ async def show_batch_details(query, user, batch_id):
     
     status_text = "✅ Scheduled" if batch['status'] == 'scheduled' else "📦 Pending"
     post_summary = ""
-    if posts:
-        media_types = {}
-        for post in posts:
-            media_type = post['media_type']
-            media_types[media_type] = media_types.get(media_type, 0) + 1
-        
-        post_summary = "\n\n*Contents:*\n"
-        for media_type, count in media_types.items():
-            icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
-            post_summary += f"• {icon} {count} {media_type}{'s' if count > 1 else ''}\n"
+    if post_count:
+        post_summary = "\n\n*Contents:*\n" + "".join(
+            f"• {get_media_icon(media_type)} {_count_label(count, media_type)}\n"
+            for media_type, count in media_types.items()
+        )
     
     await query.edit_message_text(
         f"*📦 Batch Details*\n\n"
         f"*Name:* {batch['batch_name']}\n"
         f"*Channel:* {batch['channel_name']}\n"
         f"*Status:* {status_text}\n"
-        f"*Posts:* {len(posts)}{post_summary}",
+        f"*Posts:* {post_count}{post_summary}",
         reply_markup=reply_markup,
         parse_mode='Markdown'
     )
 
 async def schedule_single_batch(query, user, batch_id):
     """Schedule a single batch"""
-    posts = Database.get_batch_posts(batch_id)
+    posts = await asyncio.to_thread(Database.get_batch_posts, batch_id)
     
     if not posts:
         await query.edit_message_text("❌ No posts in this batch to schedule.")
         return
     
     # Get scheduling config
-    start_hour, end_hour, interval_hours = Database.get_scheduling_config(user.id)
+    start_hour, end_hour, interval_hours = await asyncio.to_thread(cached_get_scheduling_config, user.id)
     
     # Calculate schedule times
-    from bot.utils import calculate_schedule_times
     schedule_times = calculate_schedule_times(start_hour, end_hour, interval_hours, len(posts))
     
     # Schedule the batch
-    Database.schedule_batch(batch_id, schedule_times)
+    await asyncio.to_thread(Database.schedule_batch, batch_id, schedule_times)
     
-    # Import scheduler and schedule posts
-    # Note: This function needs context parameter to access shared scheduler
-    from bot.scheduler import PostScheduler
-    scheduler = PostScheduler()
-    logger.warning("Using fallback scheduler instance in batch scheduling - jobs may not persist")
+    # Schedule posts on the shared scheduler
+    scheduler = PostScheduler.instance()
     post_ids = [post['id'] for post in posts]
     await scheduler.schedule_posts(post_ids, schedule_times)
     
-    batch = Database.get_user_batches(user.id)
-    batch = next((b for b in batch if b['id'] == batch_id), None)
+    batch = await asyncio.to_thread(cached_get_user_batch, user.id, batch_id)
     
-    keyboard = [[InlineKeyboardButton("🔙 Back to Batches", callback_data="batch_list")]]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    reply_markup = BACK_TO_BATCHES_MARKUP
     
     await query.edit_message_text(
         f"✅ *Batch Scheduled!*\n\n"
@@ -6567,29 +6512,22 @@ async def batch_finish_handler(update: Update, context: ContextTypes.DEFAULT_TYP
         return
     
     batch_id = session_data.get('batch_id')
-    media_items = session_data.get('media_items', [])
+    media_count = _batch_media_count(session_data)
     
-    if not media_items:
+    if not media_count:
         await update.message.reply_text("❌ No media uploaded yet. Upload some media first.")
         return
     
     # Get batch info
-    batches = Database.get_user_batches(user.id)
-    batch = next((b for b in batches if b['id'] == batch_id), None)
+    batch = await asyncio.to_thread(cached_get_user_batch, user.id, batch_id)
     
-    keyboard = [
-        [InlineKeyboardButton("📅 Schedule This Batch", callback_data=f"batch_schedule_{batch_id}")],
-        [InlineKeyboardButton("📦 Create Another Batch", callback_data="batch_create")],
-        [InlineKeyboardButton("📋 View All Batches", callback_data="batch_list")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    reply_markup = _batch_finish_markup(batch_id)
     
     await update.message.reply_text(
         f"✅ *Batch Complete!*\n\n"
         f"*Batch:* {batch['batch_name'] if batch else 'Unknown'}\n"
         f"*Channel:* {batch['channel_name'] if batch else 'Unknown'}\n"
-        f"*Media uploaded:* {len(media_items)}\n\n"
+        f"*Media uploaded:* {media_count}\n\n"
         "What would you like to do next?",
         reply_markup=reply_markup,
         parse_mode='Markdown'
@@ -6599,6 +6537,41 @@ async def batch_finish_handler(update: Update, context: ContextTypes.DEFAULT_TYP
 
 # Additional batch helper functions
 
+def _extract_batch_document(message):
+    """Documents keep their original name so the extension survives"""
+    media_file = message.document
+    return media_file, f"document_{media_file.file_id}_{media_file.file_name or 'file'}"
+
+# Media type -> (media object, base filename) for batch uploads
+MEDIA_EXTRACTORS = {
+    'photo': lambda m: (m.photo[-1], f"photo_{m.photo[-1].file_id}.jpg"),
+    'video': lambda m: (m.video, f"video_{m.video.file_id}.mp4"),
+    'audio': lambda m: (m.audio, f"audio_{m.audio.file_id}.mp3"),
+    'animation': lambda m: (m.animation, f"animation_{m.animation.file_id}.gif"),
+    'document': _extract_batch_document,
+}
+
+def _get_batch_media_file(message, media_type: str):
+    """Return the message's media object and a base filename for it, or (None, None)"""
+    extractor = MEDIA_EXTRACTORS.get(media_type)
+    if not extractor:
+        return None, None
+    return extractor(message)
+
+async def _download_batch_media(context, media_file, original_filename: str, media_type: str) -> str:
+    """Download a batch upload to disk, streaming with a byte array fallback"""
+    file = await context.bot.get_file(media_file.file_id)
+    
+    # Generate unique filename and save with streaming
+    filename = generate_unique_filename(original_filename)
+    
+    try:
+        return await save_media_streaming(file, filename, media_type)
+    except Exception as e:
+        logger.error(f"Batch streaming failed, using fallback: {e}")
+        file_data = await file.download_as_bytearray()
+        return await asyncio.to_thread(save_media, file_data, filename, media_type)
+
 async def handle_batch_media_upload_wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, 
                                   user, mode: str, session_data: dict, media_type: str):
     """Handle media upload for batch modes"""
@@ -6613,37 +6586,12 @@ async def handle_batch_media_upload_wrapper(update: Update, context: ContextType
     
     try:
         # Get the media file based on type
-        if media_type == 'photo':
-            media_file = update.message.photo[-1]
-            original_filename = f"photo_{media_file.file_id}.jpg"
-        elif media_type == 'video':
-            media_file = update.message.video
-            original_filename = f"video_{media_file.file_id}.mp4"
-        elif media_type == 'audio':
-            media_file = update.message.audio
-            original_filename = f"audio_{media_file.file_id}.mp3"
-        elif media_type == 'animation':
-            media_file = update.message.animation
-            original_filename = f"animation_{media_file.file_id}.gif"
-        elif media_type == 'document':
-            media_file = update.message.document
-            original_filename = f"document_{media_file.file_id}_{media_file.file_name or 'file'}"
-        else:
+        media_file, original_filename = _get_batch_media_file(update.message, media_type)
+        if not media_file:
             await update.message.reply_text("Unsupported media type.")
             return
         
-        file = await context.bot.get_file(media_file.file_id)
-        
-        # Generate unique filename and save with streaming
-        from bot.utils import generate_unique_filename, save_media, save_media_streaming
-        filename = generate_unique_filename(original_filename)
-        
-        try:
-            file_path = await save_media_streaming(file, filename, media_type)
-        except Exception as e:
-            logger.error(f"Batch streaming failed, using fallback: {e}")
-            file_data = await file.download_as_bytearray()
-            file_path = save_media(bytes(file_data), filename, media_type)
+        file_path = await _download_batch_media(context, media_file, original_filename, media_type)
         
         if mode == BotStates.BATCH_MODE1_PHOTOS:
             await handle_batch_mode1_media(update, user, file_path, media_type, session_data, batch_id)
@@ -6666,9 +6614,73 @@ async def handle_batch_media_upload_wrapper(update: Update, context: ContextType
         
         await update.message.reply_text(error_message)
 
+async def handle_batch_media_group(update: Update, context: ContextTypes.DEFAULT_TYPE,
+                                   user, media_type: str, media_group_id: str):
+    """Collect album items in Batch Mode 1 so the whole album is saved together"""
+    batch_groups = context.user_data.setdefault('batch_media_groups', {})
+    
+    group = batch_groups.get(media_group_id)
+    if group is None:
+        group = batch_groups[media_group_id] = {'items': []}
+        # Telegram delivers album items back to back, so give the rest a moment to arrive
+        asyncio.create_task(process_batch_media_group_delayed(context, user, media_group_id, 1.0))
+    
+    group['items'].append((update.message, media_type))
 
-# Caption Recovery Handlers (aliases for easy import)
-async def recover_captions_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
+async def process_batch_media_group_delayed(context, user, media_group_id: str, delay: float):
+    """Download a collected Batch Mode 1 album concurrently and add it in one transaction"""
+    await asyncio.sleep(delay)
+    
+    group = context.user_data.get('batch_media_groups', {}).pop(media_group_id, None)
+    if not group or not group['items']:
+        return
+    
+    items = group['items']
+    first_message = items[0][0]
+    
+    # The user may have left batch mode while the album was arriving
+    mode, session_data = Database.get_user_session(user.id)
+    batch_id = session_data.get('batch_id')
+    if mode != BotStates.BATCH_MODE1_PHOTOS or not batch_id:
+        await first_message.reply_text("❌ No batch selected. Please start again.")
+        return
+    
+    try:
+        media = [(_get_batch_media_file(message, media_type), media_type) for message, media_type in items]
+        if any(media_file is None for (media_file, _), _ in media):
+            raise ValueError("Unsupported media type in album")
+        file_paths = await asyncio.gather(*[
+            _download_batch_media(context, media_file, original_filename, media_type)
+            for (media_file, original_filename), media_type in media
+        ])
+        
+        media_types = [media_type for _, media_type in items]
+        post_ids = await asyncio.to_thread(
+            Database.add_posts_to_batch_bulk, user.id, batch_id, list(zip(file_paths, media_types)), 1
+        )
+    except Exception as e:
+        logger.error(f"Error handling batch album upload: {e}")
+        await first_message.reply_text(
+            f"❌ Error processing this album: {str(e)}"
+            "\n\n✅ Your batch progress is safe - previous uploads remain in the batch."
+            "\n\n📤 Continue uploading more files or use /finish when your batch is ready."
+        )
+        return
+    
+    media_count = _batch_media_count(session_data) + len(post_ids)
+    session_data.pop('media_items', None)
+    session_data['media_count'] = media_count
+    Database.update_user_session(user.id, BotStates.BATCH_MODE1_PHOTOS, session_data)
+    
+    await first_message.reply_text(
+        f"✅ Album of {len(post_ids)} items added to batch!\n"
+        f"Total in batch: {media_count}\n\n"
+        f"Continue uploading or use /finish when ready."
+    )
+
+
+# Caption Recovery Handlers (aliases for easy import)
+async def recover_captions_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /recover_captions command"""
     await handle_recover_captions_command(update, context)
 
@@ -6681,7 +6693,7 @@ async def edit_captions_handler(update: Update, context: ContextTypes.DEFAULT_TY
     user = update.effective_user
     
     # Check if user has channels configured
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     if not channels:
         await update.message.reply_text(
@@ -6816,11 +6828,11 @@ No captions were found to delete. All your posts are already without captions.
 async def handle_edit_captions_callback(query, user, data):
     """Handle edit captions callback"""
     if data.startswith("edit_captions_channel_"):
-        channel_id = data.replace("edit_captions_channel_", "")
+        channel_id = data.removeprefix("edit_captions_channel_")
         await start_caption_editing_for_channel(query, user, channel_id)
     elif data.startswith("edit_captions_nav_"):
         # Parse navigation data: edit_captions_nav_{channel_id}_{index}_{action}
-        parts = data.replace("edit_captions_nav_", "").split("_")
+        parts = data.removeprefix("edit_captions_nav_").split("_")
         if len(parts) >= 3:
             channel_id = "_".join(parts[:-2])  # Channel ID might contain underscores
             post_index = int(parts[-2])
@@ -6828,13 +6840,13 @@ async def handle_edit_captions_callback(query, user, data):
             await handle_caption_editing_navigation(query, user, channel_id, post_index, action)
     elif data.startswith("edit_captions_edit_"):
         # Parse edit data: edit_captions_edit_{channel_id}_{post_index}
-        parts = data.replace("edit_captions_edit_", "").split("_")
+        parts = data.removeprefix("edit_captions_edit_").split("_")
         if len(parts) >= 2:
             channel_id = "_".join(parts[:-1])  # Channel ID might contain underscores
             post_index = int(parts[-1])
             await prompt_caption_input(query, user, channel_id, post_index)
     elif data.startswith("edit_captions_done_"):
-        channel_id = data.replace("edit_captions_done_", "")
+        channel_id = data.removeprefix("edit_captions_done_")
         await query.edit_message_text(
             "✅ *Caption Editing Complete*\n\n"
             "All your caption edits have been saved successfully!",
@@ -6883,7 +6895,7 @@ async def show_post_for_caption_editing(query, user, channel_id, post_index, pos
     post = posts_list[post_index]
     
     # Get channel name for display
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     channel_name = next((ch['channel_name'] for ch in channels if ch['channel_id'] == channel_id), "Unknown Channel")
     
     # Format scheduled time
@@ -6892,7 +6904,7 @@ async def show_post_for_caption_editing(query, user, channel_id, post_index, pos
         from .utils import get_kyiv_timezone
         kyiv_tz = get_kyiv_timezone()
         if scheduled_time.tzinfo is None:
-            scheduled_time = kyiv_tz.localize(scheduled_time)
+            scheduled_time = scheduled_time.replace(tzinfo=kyiv_tz)
         else:
             scheduled_time = scheduled_time.astimezone(kyiv_tz)
         time_str = scheduled_time.strftime("%Y-%m-%d %H:%M Kyiv")
@@ -6980,7 +6992,7 @@ async def prompt_caption_input(query, user, channel_id, post_index):
     post = posts_list[post_index]
     
     # Get channel name for display
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     channel_name = next((ch['channel_name'] for ch in channels if ch['channel_id'] == channel_id), "Unknown Channel")
     
     # Get media type icon
@@ -7089,7 +7101,7 @@ async def show_post_for_caption_editing_via_message(update, user, channel_id, po
     post = posts_list[post_index]
     
     # Get channel name for display
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     channel_name = next((ch['channel_name'] for ch in channels if ch['channel_id'] == channel_id), "Unknown Channel")
     
     # Format scheduled time
@@ -7098,7 +7110,7 @@ async def show_post_for_caption_editing_via_message(update, user, channel_id, po
         from .utils import get_kyiv_timezone
         kyiv_tz = get_kyiv_timezone()
         if scheduled_time.tzinfo is None:
-            scheduled_time = kyiv_tz.localize(scheduled_time)
+            scheduled_time = scheduled_time.replace(tzinfo=kyiv_tz)
         else:
             scheduled_time = scheduled_time.astimezone(kyiv_tz)
         time_str = scheduled_time.strftime("%Y-%m-%d %H:%M Kyiv")
@@ -7161,26 +7173,20 @@ async def handle_batch_mode1_media(update: Update, user, file_path: str, media_t
     """Handle media upload in Batch Mode 1"""
     
     # Add media to batch
-    post_id = Database.add_post_to_batch(user.id, file_path, batch_id, media_type=media_type, mode=1)
+    await asyncio.to_thread(Database.add_post_to_batch, user.id, file_path, batch_id, media_type=media_type, mode=1)
     
     # Update session data
-    media_items = session_data.get('media_items', [])
-    media_items.append({
-        'post_id': post_id,
-        'file_path': file_path,
-        'media_type': media_type,
-        'uploaded_at': datetime.now().isoformat()
-    })
-    
-    session_data['media_items'] = media_items
+    media_count = _batch_media_count(session_data) + 1
+    session_data.pop('media_items', None)
+    session_data['media_count'] = media_count
     Database.update_user_session(user.id, BotStates.BATCH_MODE1_PHOTOS, session_data)
     
     # Format media type for display
-    media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+    media_icon = get_media_icon(media_type)
     
     await update.message.reply_text(
-        f"✅ {media_icon} {media_type.title()} {len(media_items)} added to batch!\n"
-        f"Total in batch: {len(media_items)}\n\n"
+        f"✅ {media_icon} {media_type.title()} {media_count} added to batch!\n"
+        f"Total in batch: {media_count}\n\n"
         f"Continue uploading or use /finish when ready."
     )
 
@@ -7193,7 +7199,7 @@ async def handle_batch_mode2_media(update: Update, user, file_path: str, media_t
     Database.update_user_session(user.id, BotStates.BATCH_MODE2_DESCRIPTION, session_data)
     
     # Format media type for display
-    media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+    media_icon = get_media_icon(media_type)
     
     await update.message.reply_text(
         f"📝 {media_icon} {media_type.title()} received! Please send a description (or 'skip'):"
@@ -7214,68 +7220,56 @@ async def handle_batch_mode2_description(update: Update, user, description: str,
     final_description = None if description.lower() == 'skip' else description
     
     # Add media to batch
-    post_id = Database.add_post_to_batch(user.id, file_path, batch_id, media_type=media_type, description=final_description, mode=2)
+    await asyncio.to_thread(Database.add_post_to_batch, user.id, file_path, batch_id, media_type=media_type, description=final_description, mode=2)
     
     # Update session data
-    media_items = session_data.get('media_items', [])
-    media_items.append({
-        'post_id': post_id,
-        'file_path': file_path,
-        'media_type': media_type,
-        'description': final_description,
-        'uploaded_at': datetime.now().isoformat()
-    })
-    
-    session_data['media_items'] = media_items
+    media_count = _batch_media_count(session_data) + 1
+    session_data.pop('media_items', None)
+    session_data['media_count'] = media_count
     session_data['current_media_path'] = None
     session_data['current_media_type'] = None
     Database.update_user_session(user.id, BotStates.BATCH_MODE2_PHOTOS, session_data)
     
     # Format media type for display
-    media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+    media_icon = get_media_icon(media_type)
     desc_text = f'"{final_description}"' if final_description else "no description"
     
     await update.message.reply_text(
-        f"✅ {media_icon} {media_type.title()} {len(media_items)} saved with {desc_text}!\n\n"
+        f"✅ {media_icon} {media_type.title()} {media_count} saved with {desc_text}!\n\n"
         f"Send another media or use /finish when done."
     )
 
 async def schedule_all_batches(query, user):
     """Schedule all pending batches"""
-    batches = Database.get_user_batches(user.id)
-    pending_batches = [b for b in batches if b['status'] == 'pending' and b['post_count'] > 0]
+    pending_batches = await asyncio.to_thread(Database.get_pending_batches_with_posts, user.id)
     
     if not pending_batches:
         await query.edit_message_text("❌ No pending batches to schedule.")
         return
     
-    # Schedule each batch
-    total_scheduled = 0
-    for batch in pending_batches:
-        posts = Database.get_batch_posts(batch['id'])
+    # Load every batch's posts in one query and compute all schedule times up front
+    batch_ids = [batch['id'] for batch in pending_batches]
+    posts_by_batch = await asyncio.to_thread(Database.get_posts_for_batches, batch_ids)
+    start_hour, end_hour, interval_hours = await asyncio.to_thread(cached_get_scheduling_config, user.id)
+    
+    scheduled_batch_ids = []
+    all_post_ids = []
+    all_times = []
+    for batch_id in batch_ids:
+        posts = posts_by_batch[batch_id]
         if posts:
-            # Get scheduling config
-            start_hour, end_hour, interval_hours = Database.get_scheduling_config(user.id)
-            
-            # Calculate schedule times
-            from bot.utils import calculate_schedule_times
             schedule_times = calculate_schedule_times(start_hour, end_hour, interval_hours, len(posts))
-            
-            # Schedule the batch
-            Database.schedule_batch(batch['id'], schedule_times)
-            
-            # Import scheduler and schedule posts
-            # Note: This function needs context parameter to access shared scheduler
-            from bot.scheduler import PostScheduler
-            scheduler = PostScheduler()
-            logger.warning("Using fallback scheduler instance in batch scheduling - jobs may not persist")
-            post_ids = [post['id'] for post in posts]
-            await scheduler.schedule_posts(post_ids, schedule_times)
-            
-            total_scheduled += len(posts)
+            scheduled_batch_ids.append(batch_id)
+            all_post_ids.extend(post['id'] for post in posts)
+            all_times.extend(schedule_times)
     
-    keyboard = [[InlineKeyboardButton("🔙 Back to Batches", callback_data="batch_list")]]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    await asyncio.to_thread(Database.schedule_batches_bulk, user.id, scheduled_batch_ids, all_post_ids, all_times)
+    total_scheduled = len(all_post_ids)
+    
+    scheduler = PostScheduler.instance()
+    await scheduler.schedule_posts(all_post_ids, all_times)
+    
+    reply_markup = BACK_TO_BATCHES_MARKUP
     
     await query.edit_message_text(
         f"✅ *All Batches Scheduled!*\n\n"
@@ -7287,13 +7281,13 @@ async def schedule_all_batches(query, user):
     )
     
     # Clear any remaining pending posts from queue after successful batch scheduling
-    Database.clear_queued_posts(user.id)
+    await asyncio.to_thread(Database.clear_queued_posts, user.id)
 
 async def confirm_clear_all_batches(query, user):
     """Confirm clearing all batches"""
-    batches = Database.get_user_batches(user.id)
+    batch_count, total_posts = await asyncio.to_thread(Database.get_user_batch_totals, user.id)
     
-    if not batches:
+    if not batch_count:
         await query.edit_message_text("❌ No batches to clear.")
         return
     
@@ -7305,12 +7299,10 @@ async def confirm_clear_all_batches(query, user):
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
     
-    total_posts = sum(b['post_count'] for b in batches)
-    
     await query.edit_message_text(
         f"⚠️ *Confirm Clear All Batches*\n\n"
         f"This will delete:\n"
-        f"• {len(batches)} batches\n"
+        f"• {batch_count} batches\n"
         f"• {total_posts} posts\n"
         f"• All media files\n\n"
         "This action cannot be undone. Continue?",
@@ -7320,8 +7312,7 @@ async def confirm_clear_all_batches(query, user):
 
 async def delete_batch_confirm(query, user, batch_id):
     """Confirm batch deletion"""
-    batches = Database.get_user_batches(user.id)
-    batch = next((b for b in batches if b['id'] == batch_id), None)
+    batch = await asyncio.to_thread(cached_get_user_batch, user.id, batch_id)
     
     if not batch:
         await query.edit_message_text("❌ Batch not found.")
@@ -7344,44 +7335,34 @@ async def delete_batch_confirm(query, user, batch_id):
         parse_mode='Markdown'
     )
 
-async def prompt_channel_selection_for_mode(update, user_id: int, channels: list, mode: int):
-    """Show channel selection for mode setup"""
+MODE_NAMES = {1: "Bulk Upload", 2: "Individual Upload", 3: "Guided Captioning"}
+
+def _build_channel_selection(channels: list, mode: int, back_button: InlineKeyboardButton):
+    """Build the channel selection text and keyboard for a mode in a single pass"""
     keyboard = []
-    for channel in channels:
+    lines = [f"📺 *Select Channel for Mode {mode} ({MODE_NAMES.get(mode, 'Upload')}):*\n\n"]
+    for i, channel in enumerate(channels, 1):
         keyboard.append([InlineKeyboardButton(
             f"📺 {channel['channel_name']}", 
             callback_data=f"mode{mode}_channel_{channel['channel_id']}"
         )])
+        lines.append(f"{i}. {channel['channel_name']}\n   ID: `{channel['channel_id']}`\n\n")
     
-    keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="cancel")])
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    
-    mode_names = {1: "Bulk Upload", 2: "Individual Upload", 3: "Guided Captioning"}
-    mode_name = mode_names.get(mode, "Upload")
-    message = f"📺 *Select Channel for Mode {mode} ({mode_name}):*\n\n"
-    for i, channel in enumerate(channels, 1):
-        message += f"{i}. {channel['channel_name']}\n   ID: `{channel['channel_id']}`\n\n"
-    
+    keyboard.append([back_button])
+    return "".join(lines), InlineKeyboardMarkup(keyboard)
+
+async def prompt_channel_selection_for_mode(update, user_id: int, channels: list, mode: int):
+    """Show channel selection for mode setup"""
+    message, reply_markup = _build_channel_selection(
+        channels, mode, InlineKeyboardButton("❌ Cancel", callback_data="cancel")
+    )
     await update.message.reply_text(message, reply_markup=reply_markup, parse_mode='Markdown')
 
 async def prompt_channel_selection_for_mode_inline(query, user_id: int, channels: list, mode: int):
     """Show channel selection for mode setup (inline version)"""
-    keyboard = []
-    for channel in channels:
-        keyboard.append([InlineKeyboardButton(
-            f"📺 {channel['channel_name']}", 
-            callback_data=f"mode{mode}_channel_{channel['channel_id']}"
-        )])
-    
-    keyboard.append([InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")])
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    
-    mode_names = {1: "Bulk Upload", 2: "Individual Upload", 3: "Guided Captioning"}
-    mode_name = mode_names.get(mode, "Upload")
-    message = f"📺 *Select Channel for Mode {mode} ({mode_name}):*\n\n"
-    for i, channel in enumerate(channels, 1):
-        message += f"{i}. {channel['channel_name']}\n   ID: `{channel['channel_id']}`\n\n"
-    
+    message, reply_markup = _build_channel_selection(
+        channels, mode, BACK_TO_MENU_BUTTON
+    )
     await query.edit_message_text(message, reply_markup=reply_markup, parse_mode='Markdown')
 
 async def handle_mode_channel_selection(query, user, mode, channel_id):
@@ -7399,8 +7380,7 @@ async def handle_mode_channel_selection(query, user, mode, channel_id):
             return
         
         # Get channel info (now that we've verified ownership)
-        channels = Database.get_user_channels(user.id)
-        selected_channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+        selected_channel = cached_get_channel(user.id, channel_id)
         
         if not selected_channel:
             logger.warning(f"Channel {channel_id} not found for user {user.id} after security check")
@@ -7520,10 +7500,7 @@ async def handle_clearscheduled_callback(query, user, data):
         
         # Also cancel the scheduled jobs from the scheduler
         try:
-            # Note: This function needs context parameter to access shared scheduler
-            from bot.scheduler import PostScheduler
-            scheduler = PostScheduler()
-            logger.warning("Using fallback scheduler instance for cancellation - may not affect active jobs")
+            scheduler = PostScheduler.instance()
             scheduler.cancel_user_posts(user.id)
         except Exception as e:
             logger.warning(f"Failed to cancel scheduled jobs: {e}")
@@ -7538,7 +7515,7 @@ async def handle_clearscheduled_callback(query, user, data):
     
     elif data == "clearscheduled_select_channel":
         # Show channel selection for clearing specific channel
-        channels = Database.get_user_channels(user.id)
+        channels = cached_get_user_channels(user.id)
         
         if not channels:
             await query.edit_message_text(
@@ -7579,7 +7556,7 @@ async def handle_clearscheduled_callback(query, user, data):
         )
     
     elif data.startswith("clearscheduled_channel_"):
-        channel_id = data.replace("clearscheduled_channel_", "")
+        channel_id = data.removeprefix("clearscheduled_channel_")
         
         # SECURITY CHECK: Verify user owns the channel before clearing posts
         if not Database.user_has_channel(user.id, channel_id):
@@ -7591,8 +7568,7 @@ async def handle_clearscheduled_callback(query, user, data):
             return
         
         # Get channel info
-        channels = Database.get_user_channels(user.id)
-        channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+        channel = cached_get_channel(user.id, channel_id)
         
         if not channel:
             await query.edit_message_text("❌ Channel not found.")
@@ -7614,7 +7590,7 @@ async def retry_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = update.effective_user
     
     # Get all failed posts for the user
-    failed_posts = Database.get_failed_posts(user.id)
+    failed_posts = await asyncio.to_thread(Database.get_failed_posts, user.id)
     
     if not failed_posts:
         await update.message.reply_text(
@@ -7625,17 +7601,16 @@ async def retry_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
     
-    # Group failed posts by channel for better organization
-    posts_by_channel = {}
-    channels = Database.get_user_channels(user.id)
-    channel_names = {ch['channel_id']: ch['channel_name'] for ch in channels}
+    # Group failed posts by channel for better organization, naming only the channels involved
+    posts_by_channel = defaultdict(list)
+    channel_names = await asyncio.to_thread(
+        Database.get_channel_names, user.id, {post['channel_id'] for post in failed_posts}
+    )
     
     for post in failed_posts:
         channel_id = post['channel_id']
         channel_name = channel_names.get(channel_id, f"Channel {channel_id}")
         
-        if channel_name not in posts_by_channel:
-            posts_by_channel[channel_name] = []
         posts_by_channel[channel_name].append(post)
     
     # Create inline keyboard for retry options
@@ -7649,9 +7624,7 @@ async def retry_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 break
             
             media_type = post['media_type'].capitalize()
-            description_preview = (post['description'][:20] + "...") if post['description'] and len(post['description']) > 20 else (post['description'] or "No description")
-            
-            button_text = f"🔄 {media_type} - {description_preview}"
+            button_text = f"🔄 {media_type} - {post['description_preview']}"
             keyboard.append([InlineKeyboardButton(
                 button_text, 
                 callback_data=f"retry_post_{post['id']}"
@@ -7700,120 +7673,133 @@ Choose an option below:
     
     await update.message.reply_text(message, reply_markup=reply_markup, parse_mode='Markdown')
 
-async def handle_retry_callback(query, user, data):
-    """Handle retry-related callback queries"""
-    if data == "retry_all":
-        # Retry all failed posts for the user
-        failed_posts = Database.get_failed_posts(user.id)
-        
-        if not failed_posts:
-            await query.edit_message_text("✅ No failed posts found to retry.")
-            return
-        
-        success_count = 0
-        for post in failed_posts:
-            if Database.retry_failed_post(post['id']):
-                success_count += 1
-        
+async def _dispatch_callback(routes, query, user, data):
+    """Call the first route handler whose prefix matches, passing the data after the prefix"""
+    for prefix, handler in routes:
+        if data.startswith(prefix):
+            return await handler(query, user, data.removeprefix(prefix))
+
+async def _retry_all(query, user, _):
+    """Reset all of the user's failed posts to pending"""
+    failed_posts = await asyncio.to_thread(Database.get_failed_posts, user.id)
+    
+    if not failed_posts:
+        await query.edit_message_text("✅ No failed posts found to retry.")
+        return
+    
+    success_count = await asyncio.to_thread(
+        Database.retry_failed_posts_bulk, [post['id'] for post in failed_posts]
+    )
+    
+    await query.edit_message_text(
+        f"✅ **Retry Complete**\n\n"
+        f"Successfully reset **{success_count}** failed posts to pending status.\n"
+        f"They will be automatically rescheduled and posted.\n\n"
+        f"Use /stats to monitor their progress.",
+        parse_mode='Markdown'
+    )
+
+async def _retry_post(query, user, post_id):
+    """Reset a single failed post to pending"""
+    post_id = int(post_id)
+    
+    if Database.retry_failed_post(post_id):
         await query.edit_message_text(
-            f"✅ **Retry Complete**\n\n"
-            f"Successfully reset **{success_count}** failed posts to pending status.\n"
-            f"They will be automatically rescheduled and posted.\n\n"
-            f"Use /stats to monitor their progress.",
+            f"✅ **Post Retry Successful**\n\n"
+            f"Post #{post_id} has been reset to pending status and will be rescheduled automatically.\n\n"
+            f"Use /stats to monitor its progress.",
             parse_mode='Markdown'
         )
-        
-    elif data.startswith("retry_post_"):
-        post_id = int(data.replace("retry_post_", ""))
-        
-        if Database.retry_failed_post(post_id):
-            await query.edit_message_text(
-                f"✅ **Post Retry Successful**\n\n"
-                f"Post #{post_id} has been reset to pending status and will be rescheduled automatically.\n\n"
-                f"Use /stats to monitor its progress.",
-                parse_mode='Markdown'
-            )
-        else:
-            await query.edit_message_text(
-                f"❌ **Retry Failed**\n\n"
-                f"Could not retry post #{post_id}. It may not exist or is not in failed status.",
-                parse_mode='Markdown'
-            )
-            
-    elif data == "retry_by_channel":
-        # Show channel selection for retry
-        failed_posts = Database.get_failed_posts(user.id)
-        
-        if not failed_posts:
-            await query.edit_message_text("✅ No failed posts found to retry.")
-            return
-        
-        # Group posts by channel
-        posts_by_channel = {}
-        channels = Database.get_user_channels(user.id)
-        channel_names = {ch['channel_id']: ch['channel_name'] for ch in channels}
-        
-        for post in failed_posts:
-            channel_id = post['channel_id']
-            if channel_id not in posts_by_channel:
-                posts_by_channel[channel_id] = []
-            posts_by_channel[channel_id].append(post)
-        
-        # Create keyboard for channel selection
-        keyboard = []
-        for channel_id, posts in posts_by_channel.items():
-            channel_name = channel_names.get(channel_id, f"Channel {channel_id}")
-            post_count = len(posts)
-            keyboard.append([InlineKeyboardButton(
-                f"🔄 {channel_name} ({post_count} posts)", 
-                callback_data=f"retry_channel_{channel_id}"
-            )])
-        
-        keyboard.append([InlineKeyboardButton("🔙 Back", callback_data="retry_back")])
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
+    else:
         await query.edit_message_text(
-            "📺 **Select Channel to Retry**\n\n"
-            "Choose which channel's failed posts to retry:",
-            reply_markup=reply_markup,
+            f"❌ **Retry Failed**\n\n"
+            f"Could not retry post #{post_id}. It may not exist or is not in failed status.",
             parse_mode='Markdown'
         )
-        
-    elif data.startswith("retry_channel_"):
-        channel_id = data.replace("retry_channel_", "")
-        
-        # SECURITY CHECK: Verify user owns the channel before retrying posts
-        if not Database.user_has_channel(user.id, channel_id):
-            logger.error(f"Security violation: User {user.id} attempted to retry posts for channel {channel_id} they don't own")
-            await query.edit_message_text(
-                "❌ *Security Error*\n\nYou don't have access to this channel.",
-                parse_mode='Markdown'
-            )
-            return
-        
-        # Retry all failed posts for specific channel
-        failed_posts = Database.get_failed_posts(user.id, channel_id)
-        
-        if not failed_posts:
-            await query.edit_message_text("✅ No failed posts found for this channel.")
-            return
-        
-        success_count = 0
-        for post in failed_posts:
-            if Database.retry_failed_post(post['id']):
-                success_count += 1
-        
-        # Get channel name
-        channels = Database.get_user_channels(user.id)
-        channel_name = next((ch['channel_name'] for ch in channels if ch['channel_id'] == channel_id), f"Channel {channel_id}")
-        
+
+async def _retry_by_channel(query, user, _):
+    """Show channel selection for retry"""
+    failed_posts, channels = await asyncio.gather(
+        asyncio.to_thread(Database.get_failed_posts, user.id),
+        asyncio.to_thread(cached_get_user_channels, user.id)
+    )
+    
+    if not failed_posts:
+        await query.edit_message_text("✅ No failed posts found to retry.")
+        return
+    
+    # Group posts by channel
+    posts_by_channel = defaultdict(list)
+    channel_names = {ch['channel_id']: ch['channel_name'] for ch in channels}
+    
+    for post in failed_posts:
+        posts_by_channel[post['channel_id']].append(post)
+    
+    # Create keyboard for channel selection
+    keyboard = []
+    for channel_id, posts in posts_by_channel.items():
+        channel_name = channel_names.get(channel_id, f"Channel {channel_id}")
+        post_count = len(posts)
+        keyboard.append([InlineKeyboardButton(
+            f"🔄 {channel_name} ({post_count} posts)", 
+            callback_data=f"retry_channel_{channel_id}"
+        )])
+    
+    keyboard.append([InlineKeyboardButton("🔙 Back", callback_data="retry_back")])
+    reply_markup = InlineKeyboardMarkup(keyboard)
+    
+    await query.edit_message_text(
+        "📺 **Select Channel to Retry**\n\n"
+        "Choose which channel's failed posts to retry:",
+        reply_markup=reply_markup,
+        parse_mode='Markdown'
+    )
+
+async def _retry_channel(query, user, channel_id):
+    """Reset the failed posts of one of the user's channels to pending"""
+    # SECURITY CHECK: Verify user owns the channel before retrying posts
+    if not Database.user_has_channel(user.id, channel_id):
+        logger.error(f"Security violation: User {user.id} attempted to retry posts for channel {channel_id} they don't own")
         await query.edit_message_text(
-            f"✅ **Channel Retry Complete**\n\n"
-            f"Successfully reset **{success_count}** failed posts from **{channel_name}** to pending status.\n"
-            f"They will be automatically rescheduled and posted.\n\n"
-            f"Use /stats to monitor their progress.",
+            "❌ *Security Error*\n\nYou don't have access to this channel.",
             parse_mode='Markdown'
         )
+        return
+    
+    # Retry all failed posts for specific channel
+    failed_posts = await asyncio.to_thread(Database.get_failed_posts, user.id, channel_id)
+    
+    if not failed_posts:
+        await query.edit_message_text("✅ No failed posts found for this channel.")
+        return
+    
+    success_count = await asyncio.to_thread(
+        Database.retry_failed_posts_bulk, [post['id'] for post in failed_posts]
+    )
+    
+    # Get channel name
+    channel = cached_get_channel(user.id, channel_id)
+    channel_name = channel['channel_name'] if channel else f"Channel {channel_id}"
+    
+    await query.edit_message_text(
+        f"✅ **Channel Retry Complete**\n\n"
+        f"Successfully reset **{success_count}** failed posts from **{channel_name}** to pending status.\n"
+        f"They will be automatically rescheduled and posted.\n\n"
+        f"Use /stats to monitor their progress.",
+        parse_mode='Markdown'
+    )
+
+# (prefix, handler) pairs, first match wins: a prefix that extends another goes first
+_RETRY_ROUTES = (
+    ("retry_all", _retry_all),
+    ("retry_post_", _retry_post),
+    ("retry_by_channel", _retry_by_channel),
+    ("retry_channel_", _retry_channel),
+)
+
+async def handle_retry_callback(query, user, data):
+    """Handle retry-related callback queries"""
+    await _dispatch_callback(_RETRY_ROUTES, query, user, data)
 
 async def calendar_view_handler(query, user):
     """Display calendar view with scheduled posts"""
@@ -7824,20 +7810,14 @@ async def calendar_view_handler(query, user):
 
 async def show_calendar_month(query, user, year: int, month: int):
     """Show calendar for specific month with scheduled posts"""
-    from calendar import monthrange
-    
-    # Get posts for the entire month
-    start_date = datetime(year, month, 1)
-    last_day = monthrange(year, month)[1]
-    end_date = datetime(year, month, last_day)
-    
-    posts_by_date = Database.get_posts_by_date_range(user.id, start_date, end_date)
+    # Per-day post counts are all the month grid needs
+    day_counts = await asyncio.to_thread(Database.get_month_day_counts, user.id, year, month)
     
     # Generate calendar view
-    calendar_text = generate_mini_calendar(year, month, posts_by_date)
+    calendar_text = generate_mini_calendar(year, month, day_counts)
     
     # Add summary
-    total_posts = sum(len(posts) for posts in posts_by_date.values())
+    total_posts = sum(day_counts.values())
     calendar_text += f"\n📊 *Total posts this month:* {total_posts}\n"
     
     if total_posts > 0:
@@ -7855,15 +7835,13 @@ async def show_calendar_month(query, user, year: int, month: int):
     ])
     
     # Date selection buttons for days with posts
-    if posts_by_date:
+    if day_counts:
         date_buttons = []
-        for date_str in sorted(posts_by_date.keys())[:12]:  # Limit to 12 buttons
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-            day_num = date_obj.day
-            post_count = len(posts_by_date[date_str])
+        for day in heapq.nsmallest(12, day_counts):  # Limit to 12 buttons
+            post_count = day_counts[day]
             date_buttons.append(InlineKeyboardButton(
-                f"{day_num} ({post_count})", 
-                callback_data=f"cal_day_{date_str}"
+                f"{day.day} ({post_count})", 
+                callback_data=f"cal_day_{day.isoformat()}"
             ))
         
         # Arrange date buttons in rows of 4
@@ -7876,33 +7854,27 @@ async def show_calendar_month(query, user, year: int, month: int):
         InlineKeyboardButton("📊 This Week", callback_data="cal_week")
     ])
     
-    keyboard.append([InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")])
+    keyboard.append([BACK_TO_MENU_BUTTON])
     
     reply_markup = InlineKeyboardMarkup(keyboard)
     
     await query.edit_message_text(calendar_text, reply_markup=reply_markup, parse_mode='Markdown')
 
-async def handle_calendar_callback(query, user, data):
-    """Handle calendar-related callbacks"""
-    if data.startswith("cal_nav_"):
-        # Navigation: cal_nav_YYYY_MM
-        parts = data.split("_")
-        year, month = int(parts[2]), int(parts[3])
-        await show_calendar_month(query, user, year, month)
-        
-    elif data.startswith("cal_day_"):
-        # Day view: cal_day_YYYY-MM-DD
-        date_str = data.replace("cal_day_", "")
-        await show_calendar_day(query, user, date_str)
-        
-    elif data == "cal_today":
-        from .utils import get_current_kyiv_time
-        current_time = get_current_kyiv_time()
-        today_str = current_time.strftime('%Y-%m-%d')
-        await show_calendar_day(query, user, today_str)
-        
-    elif data == "cal_week":
-        await show_calendar_week(query, user)
+async def _calendar_nav(query, user, year_month):
+    """Show another month: cal_nav_YYYY_MM"""
+    year, month = map(int, year_month.split("_"))
+    await show_calendar_month(query, user, year, month)
+
+async def _calendar_today(query, user, _):
+    """Show today's schedule"""
+    from .utils import get_current_kyiv_time
+    current_time = get_current_kyiv_time()
+    today_str = current_time.strftime('%Y-%m-%d')
+    await show_calendar_day(query, user, today_str)
+
+async def _calendar_week(query, user, _):
+    """Show the current week"""
+    await show_calendar_week(query, user)
 
 async def show_calendar_day(query, user, date_str: str):
     """Show detailed schedule for a specific day"""
@@ -7913,8 +7885,7 @@ async def show_calendar_day(query, user, date_str: str):
         return
     
     # Get posts for this specific day
-    posts_by_date = Database.get_posts_by_date_range(user.id, date_obj, date_obj)
-    posts = posts_by_date.get(date_str, [])
+    posts = Database.get_posts_for_date(user.id, date_obj)
     
     # Format the day schedule
     schedule_text = format_daily_schedule(date_str, posts)
@@ -7926,14 +7897,14 @@ async def show_calendar_day(query, user, date_str: str):
             channel = post['channel_name']
             channel_counts[channel] = channel_counts.get(channel, 0) + 1
         
-        schedule_text += "\n*📊 Channels Summary:*\n"
-        for channel, count in channel_counts.items():
-            schedule_text += f"• {channel}: {count} posts\n"
+        schedule_text += "\n*📊 Channels Summary:*\n" + "".join(
+            f"• {channel}: {count} posts\n" for channel, count in channel_counts.items()
+        )
     
     # Navigation buttons
     keyboard = [
         [InlineKeyboardButton("📅 Back to Calendar", callback_data=f"cal_nav_{date_obj.year}_{date_obj.month}")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+        [BACK_TO_MENU_BUTTON]
     ]
     
     reply_markup = InlineKeyboardMarkup(keyboard)
@@ -7955,53 +7926,110 @@ async def show_calendar_week(query, user):
     posts_by_date = Database.get_posts_by_date_range(user.id, week_start, week_end)
     
     # Format week view
-    week_text = f"📅 *Week of {week_start.strftime('%B %d')} - {week_end.strftime('%B %d, %Y')}*\n\n"
+    parts = [f"📅 *Week of {week_start.strftime('%B %d')} - {week_end.strftime('%B %d, %Y')}*\n\n"]
     
-    total_posts = 0
-    for i in range(7):
-        day = week_start + timedelta(days=i)
-        date_str = day.strftime('%Y-%m-%d')
-        day_name = day.strftime('%A')
-        day_posts = posts_by_date.get(date_str, [])
+    total_posts = sum(len(day_posts) for day_posts in posts_by_date.values())
+    week_days = [week_start + timedelta(days=i) for i in range(7)]
+    for day in week_days:
+        day_name = calendar.day_name[day.weekday()]
+        day_posts = posts_by_date.get(day.date(), [])
         
         if day_posts:
-            total_posts += len(day_posts)
-            week_text += f"📅 *{day_name} ({day.day})*: {len(day_posts)} posts\n"
+            parts.append(f"📅 *{day_name} ({day.day})*: {len(day_posts)} posts\n")
             
             # Show first few posts
             for post in day_posts[:3]:
                 time_str = post['scheduled_time'].strftime('%H:%M')
                 icon = get_media_icon(post['media_type'])
-                week_text += f"  🕐 {time_str} {icon} → {post['channel_name'][:20]}\n"
+                parts.append(f"  🕐 {time_str} {icon} → {post['channel_name'][:20]}\n")
             
             if len(day_posts) > 3:
-                week_text += f"  ... and {len(day_posts) - 3} more\n"
-            week_text += "\n"
+                parts.append(f"  ... and {len(day_posts) - 3} more\n")
+            parts.append("\n")
         else:
-            week_text += f"📅 *{day_name} ({day.day})*: No posts\n"
+            parts.append(f"📅 *{day_name} ({day.day})*: No posts\n")
     
-    week_text += f"\n📊 *Total posts this week:* {total_posts}"
+    parts.append(f"\n📊 *Total posts this week:* {total_posts}")
+    week_text = "".join(parts)
     
     # Navigation buttons
     keyboard = [
         [InlineKeyboardButton("📅 Back to Calendar", callback_data=f"cal_nav_{current_time.year}_{current_time.month}")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+        [BACK_TO_MENU_BUTTON]
     ]
     
     reply_markup = InlineKeyboardMarkup(keyboard)
     
     await query.edit_message_text(week_text, reply_markup=reply_markup, parse_mode='Markdown')
 
+# (prefix, handler) pairs, first match wins: a prefix that extends another goes first
+_CALENDAR_ROUTES = (
+    ("cal_nav_", _calendar_nav),
+    ("cal_day_", show_calendar_day),
+    ("cal_today", _calendar_today),
+    ("cal_week", _calendar_week),
+)
+
+async def handle_calendar_callback(query, user, data):
+    """Handle calendar-related callbacks"""
+    await _dispatch_callback(_CALENDAR_ROUTES, query, user, data)
+
 # Bulk Edit Functionality
 
+def _channels_by_post_count(posts_by_channel: dict) -> list:
+    """Channel groups busiest first, so the keyboard order stays the same between renders"""
+    return sorted(posts_by_channel.items(), key=lambda item: (-len(item[1]), item[0]))
+
+# Short and full display names of the bulk-edit mode tags computed in the database
+BULK_EDIT_MODE_NAMES = {
+    "mode1": ("Mode 1", "Mode 1 (Bulk Upload)"),
+    "mode2": ("Mode 2", "Mode 2 (Custom Descriptions)"),
+    "recurring": ("Recurring", "Recurring"),
+    "multibatch": ("Multi-batch", "Multi-batch"),
+}
+
+def _posts_for_mode(user_id: int, mode: str, channel_id: str = None) -> list:
+    """Pick out a user's posts with one bulk-edit mode tag, optionally from one channel"""
+    return [
+        post for post in cached_get_scheduled_posts(user_id)
+        if post['mode_tag'] == mode and (not channel_id or post['channel_id'] == channel_id)
+    ]
+
+def _bulk_edit_info_text(summary: dict, channels) -> str:
+    """Summary of scheduled posts by channel and upload mode for the bulk edit menu"""
+    # Channel breakdown
+    parts = ["*📋 Your scheduled posts:*\n\n", "*📺 By Channel:*\n"]
+    channel_by_id = {ch['channel_id']: ch for ch in channels}
+    for channel_id, post_count in summary['by_channel'].items():
+        channel = channel_by_id.get(channel_id)
+        channel_name = channel['channel_name'] if channel else f"Unknown ({channel_id})"
+        parts.append(f"• {channel_name}: {post_count} posts\n")
+    
+    # Mode breakdown
+    by_mode = summary['by_mode']
+    parts.append("\n*📱 By Upload Mode:*\n")
+    if by_mode.get("mode1"):
+        parts.append(f"• 📸 Mode 1 (Bulk): {by_mode['mode1']} posts\n")
+    if by_mode.get("mode2"):
+        parts.append(f"• 📝 Mode 2 (Custom): {by_mode['mode2']} posts\n")
+    if by_mode.get("recurring"):
+        parts.append(f"• 🔄 Recurring: {by_mode['recurring']} posts\n")
+    if by_mode.get("multibatch"):
+        parts.append(f"• 🔧 Multi-batch: {by_mode['multibatch']} posts\n")
+    
+    return "".join(parts)
+
 async def bulkedit_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /bulkedit command to redistribute scheduled posts"""
     user = update.effective_user
     
-    # Check if user has scheduled posts
-    posts = Database.get_scheduled_posts_for_channel(user.id)
+    # Check if user has scheduled posts; the top menu only needs counts
+    summary, channels = await asyncio.gather(
+        asyncio.to_thread(Database.get_scheduled_post_summary, user.id),
+        asyncio.to_thread(cached_get_user_channels, user.id)
+    )
     
-    if not posts:
+    if not summary['total']:
         await update.message.reply_text(
             "❌ *No scheduled posts found!*\n\n"
             "You need to have posts scheduled before you can bulk edit them.\n"
@@ -8010,9 +8038,6 @@ async def bulkedit_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
     
-    # Get user channels
-    channels = Database.get_user_channels(user.id)
-    
     if not channels:
         await update.message.reply_text(
             "❌ *No channels configured!*\n\n"
@@ -8021,52 +8046,13 @@ async def bulkedit_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
     
-    # Group posts by channel and mode
-    posts_by_channel = {}
-    posts_by_mode = {"mode1": [], "mode2": [], "recurring": [], "multibatch": []}
-    
-    for post in posts:
-        channel_id = post['channel_id']
-        if channel_id not in posts_by_channel:
-            posts_by_channel[channel_id] = []
-        posts_by_channel[channel_id].append(post)
-        
-        # Group by mode (based on description patterns and recurring status)
-        if post.get('is_recurring'):
-            posts_by_mode["recurring"].append(post)
-        elif post.get('description') and len(post['description']) > 50:
-            posts_by_mode["mode2"].append(post)  # Mode 2 typically has custom descriptions
-        elif post.get('batch_id'):
-            posts_by_mode["multibatch"].append(post)
-        else:
-            posts_by_mode["mode1"].append(post)  # Mode 1 typically has auto descriptions or short ones
-    
-    # Build info text with channel and mode breakdown
-    info_text = "*📋 Your scheduled posts:*\n\n"
-    
-    # Channel breakdown
-    info_text += "*📺 By Channel:*\n"
-    for channel_id, channel_posts in posts_by_channel.items():
-        channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
-        channel_name = channel['channel_name'] if channel else f"Unknown ({channel_id})"
-        info_text += f"• {channel_name}: {len(channel_posts)} posts\n"
-    
-    # Mode breakdown
-    info_text += "\n*📱 By Upload Mode:*\n"
-    if posts_by_mode["mode1"]:
-        info_text += f"• 📸 Mode 1 (Bulk): {len(posts_by_mode['mode1'])} posts\n"
-    if posts_by_mode["mode2"]:
-        info_text += f"• 📝 Mode 2 (Custom): {len(posts_by_mode['mode2'])} posts\n"
-    if posts_by_mode["recurring"]:
-        info_text += f"• 🔄 Recurring: {len(posts_by_mode['recurring'])} posts\n"
-    if posts_by_mode["multibatch"]:
-        info_text += f"• 🔧 Multi-batch: {len(posts_by_mode['multibatch'])} posts\n"
+    info_text = _bulk_edit_info_text(summary, channels)
     
     # Create keyboard with all selection options
     keyboard = []
     
     # Option to edit all posts
-    keyboard.append([InlineKeyboardButton(f"🔄 All Posts ({len(posts)})", callback_data="bulkedit_all")])
+    keyboard.append([InlineKeyboardButton(f"🔄 All Posts ({summary['total']})", callback_data="bulkedit_all")])
     
     # Mode-based options
     keyboard.append([InlineKeyboardButton("📱 Select by Upload Mode", callback_data="bulkedit_modes")])
@@ -8074,7 +8060,7 @@ async def bulkedit_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Channel-based options  
     keyboard.append([InlineKeyboardButton("📺 Select by Channel", callback_data="bulkedit_channels")])
     
-    keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="back_to_main")])
+    keyboard.append([CANCEL_BUTTON])
     reply_markup = InlineKeyboardMarkup(keyboard)
     
     message = f"""
@@ -8100,109 +8086,68 @@ async def handle_bulk_edit_callback(query, user, data):
     except Exception as e:
         logger.error(f"Error answering callback query: {e}")
         pass  # Query might already be answered
-        
-    if data == "bulkedit_all":
-        # Redistribute all scheduled posts
-        posts = Database.get_scheduled_posts_for_channel(user.id)
-        await prompt_bulk_edit_settings(query, user, posts, "All Posts")
-    
-    elif data == "bulkedit_modes":
-        # Show mode selection menu
-        await show_mode_selection_menu(query, user)
-        
-    elif data == "bulkedit_channels":
-        # Show channel selection menu
-        await show_channel_selection_menu(query, user)
-    
-    elif data.startswith("bulkedit_mode_"):
-        if data.startswith("bulkedit_mode_all_"):
-            # Redistribute all posts from specific mode
-            mode = data.replace("bulkedit_mode_all_", "")
-            await handle_mode_all_selection(query, user, mode)
-        elif data.startswith("bulkedit_mode_channel_"):
-            # Redistribute posts from specific mode and channel
-            parts = data.replace("bulkedit_mode_channel_", "").split("_", 1)
-            if len(parts) >= 2:
-                mode = parts[0]
-                channel_id = parts[1]
-                await handle_bulk_edit_mode_channel_selection(query, user, mode, channel_id)
-        else:
-            # Show channel selection for specific mode
-            mode = data.replace("bulkedit_mode_", "")
-            await handle_mode_selection(query, user, mode)
+
+    await _dispatch_callback(_BULK_EDIT_ROUTES, query, user, data)
+
+async def _bulk_edit_all(query, user, _):
+    """Redistribute all scheduled posts"""
+    posts = await asyncio.to_thread(cached_get_scheduled_posts, user.id)
+    await prompt_bulk_edit_settings(query, user, posts, "All Posts")
+
+async def _bulk_edit_modes(query, user, _):
+    """Show mode selection menu"""
+    await show_mode_selection_menu(query, user)
+
+async def _bulk_edit_channels(query, user, _):
+    """Show channel selection menu"""
+    await show_channel_selection_menu(query, user)
+
+async def _bulk_edit_mode_channel(query, user, mode_channel):
+    """Redistribute posts from specific mode and channel"""
+    parts = mode_channel.split("_", 1)
+    if len(parts) >= 2:
+        mode = parts[0]
+        channel_id = parts[1]
+        await handle_bulk_edit_mode_channel_selection(query, user, mode, channel_id)
+
+async def _bulk_edit_channel(query, user, channel_id):
+    """Redistribute posts for specific channel"""
+    posts = [post for post in await asyncio.to_thread(cached_get_scheduled_posts, user.id)
+             if post['channel_id'] == channel_id]
     
-    elif data.startswith("bulkedit_channel_"):
-        # Redistribute posts for specific channel
-        channel_id = data.replace("bulkedit_channel_", "")
-        posts = Database.get_scheduled_posts_for_channel(user.id, channel_id)
-        
-        # Get channel name
-        channels = Database.get_user_channels(user.id)
-        channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
-        channel_name = channel['channel_name'] if channel else f"Channel {channel_id}"
-        
-        await prompt_bulk_edit_settings(query, user, posts, channel_name)
+    # Get channel name
+    channel = cached_get_channel(user.id, channel_id)
+    channel_name = channel['channel_name'] if channel else f"Channel {channel_id}"
     
-    elif data == "bulkedit_back":
-        # Go back to main bulk edit menu - restart the bulkedit process  
-        posts = Database.get_scheduled_posts_for_channel(user.id)
-        channels = Database.get_user_channels(user.id)
-        
-        if not posts:
-            await query.edit_message_text(
-                "❌ *No scheduled posts found!*\n\n"
-                "You need to have posts scheduled before you can bulk edit them.",
-                parse_mode='Markdown'
-            )
-            return
-        
-        # Rebuild the main menu (same logic as bulkedit_handler)
-        posts_by_channel = {}
-        posts_by_mode = {"mode1": [], "mode2": [], "recurring": [], "multibatch": []}
-        
-        for post in posts:
-            channel_id = post['channel_id']
-            if channel_id not in posts_by_channel:
-                posts_by_channel[channel_id] = []
-            posts_by_channel[channel_id].append(post)
-            
-            # Group by mode
-            if post.get('is_recurring'):
-                posts_by_mode["recurring"].append(post)
-            elif post.get('description') and len(post['description']) > 50:
-                posts_by_mode["mode2"].append(post)
-            elif post.get('batch_id'):
-                posts_by_mode["multibatch"].append(post)
-            else:
-                posts_by_mode["mode1"].append(post)
-        
-        # Build info text
-        info_text = "*📋 Your scheduled posts:*\n\n"
-        info_text += "*📺 By Channel:*\n"
-        for channel_id, channel_posts in posts_by_channel.items():
-            channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
-            channel_name = channel['channel_name'] if channel else f"Unknown ({channel_id})"
-            info_text += f"• {channel_name}: {len(channel_posts)} posts\n"
-        
-        info_text += "\n*📱 By Upload Mode:*\n"
-        if posts_by_mode["mode1"]:
-            info_text += f"• 📸 Mode 1 (Bulk): {len(posts_by_mode['mode1'])} posts\n"
-        if posts_by_mode["mode2"]:
-            info_text += f"• 📝 Mode 2 (Custom): {len(posts_by_mode['mode2'])} posts\n"
-        if posts_by_mode["recurring"]:
-            info_text += f"• 🔄 Recurring: {len(posts_by_mode['recurring'])} posts\n"
-        if posts_by_mode["multibatch"]:
-            info_text += f"• 🔧 Multi-batch: {len(posts_by_mode['multibatch'])} posts\n"
-        
-        keyboard = [
-            [InlineKeyboardButton(f"🔄 All Posts ({len(posts)})", callback_data="bulkedit_all")],
-            [InlineKeyboardButton("📱 Select by Upload Mode", callback_data="bulkedit_modes")],
-            [InlineKeyboardButton("📺 Select by Channel", callback_data="bulkedit_channels")],
-            [InlineKeyboardButton("❌ Cancel", callback_data="back_to_main")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        message = f"""
+    await prompt_bulk_edit_settings(query, user, posts, channel_name)
+
+async def _bulk_edit_back(query, user, _):
+    """Go back to main bulk edit menu"""
+    summary, channels = await asyncio.gather(
+        asyncio.to_thread(Database.get_scheduled_post_summary, user.id),
+        asyncio.to_thread(cached_get_user_channels, user.id)
+    )
+    
+    if not summary['total']:
+        await query.edit_message_text(
+            "❌ *No scheduled posts found!*\n\n"
+            "You need to have posts scheduled before you can bulk edit them.",
+            parse_mode='Markdown'
+        )
+        return
+    
+    # Rebuild the main menu (same logic as bulkedit_handler)
+    info_text = _bulk_edit_info_text(summary, channels)
+    
+    keyboard = [
+        [InlineKeyboardButton(f"🔄 All Posts ({summary['total']})", callback_data="bulkedit_all")],
+        [InlineKeyboardButton("📱 Select by Upload Mode", callback_data="bulkedit_modes")],
+        [InlineKeyboardButton("📺 Select by Channel", callback_data="bulkedit_channels")],
+        [CANCEL_BUTTON]
+    ]
+    reply_markup = InlineKeyboardMarkup(keyboard)
+    
+    message = f"""
 🔄 *Bulk Edit - Redistribute Posts*
 
 {info_text}
@@ -8214,54 +8159,42 @@ async def handle_bulk_edit_callback(query, user, data):
 
 *Choose selection method:*
 """
-        
-        await query.edit_message_text(message, reply_markup=reply_markup, parse_mode='Markdown')
+    
+    await query.edit_message_text(message, reply_markup=reply_markup, parse_mode='Markdown')
 
 async def show_mode_selection_menu(query, user):
     """Show mode selection menu for bulk edit"""
-    posts = Database.get_scheduled_posts_for_channel(user.id)
-    
-    # Group posts by mode
-    posts_by_mode = {"mode1": [], "mode2": [], "recurring": [], "multibatch": []}
-    
-    for post in posts:
-        if post.get('is_recurring'):
-            posts_by_mode["recurring"].append(post)
-        elif post.get('description') and len(post['description']) > 50:
-            posts_by_mode["mode2"].append(post)
-        elif post.get('batch_id'):
-            posts_by_mode["multibatch"].append(post)
-        else:
-            posts_by_mode["mode1"].append(post)
+    # Same fresh counts as the top bulk edit menu
+    mode_counts = Database.get_scheduled_post_summary(user.id)['by_mode']
     
     keyboard = []
     
-    if posts_by_mode["mode1"]:
+    if mode_counts.get("mode1"):
         keyboard.append([InlineKeyboardButton(
-            f"📸 Mode 1 - Bulk Upload ({len(posts_by_mode['mode1'])} posts)", 
+            f"📸 Mode 1 - Bulk Upload ({mode_counts['mode1']} posts)", 
             callback_data="bulkedit_mode_mode1"
         )])
     
-    if posts_by_mode["mode2"]:
+    if mode_counts.get("mode2"):
         keyboard.append([InlineKeyboardButton(
-            f"📝 Mode 2 - Custom Descriptions ({len(posts_by_mode['mode2'])} posts)", 
+            f"📝 Mode 2 - Custom Descriptions ({mode_counts['mode2']} posts)", 
             callback_data="bulkedit_mode_mode2"
         )])
     
-    if posts_by_mode["recurring"]:
+    if mode_counts.get("recurring"):
         keyboard.append([InlineKeyboardButton(
-            f"🔄 Recurring Posts ({len(posts_by_mode['recurring'])} posts)", 
+            f"🔄 Recurring Posts ({mode_counts['recurring']} posts)", 
             callback_data="bulkedit_mode_recurring"
         )])
     
-    if posts_by_mode["multibatch"]:
+    if mode_counts.get("multibatch"):
         keyboard.append([InlineKeyboardButton(
-            f"🔧 Multi-batch Posts ({len(posts_by_mode['multibatch'])} posts)", 
+            f"🔧 Multi-batch Posts ({mode_counts['multibatch']} posts)", 
             callback_data="bulkedit_mode_multibatch"
         )])
     
-    keyboard.append([InlineKeyboardButton("🔙 Back", callback_data="bulkedit_back")])
-    keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="back_to_main")])
+    keyboard.append([BULKEDIT_BACK_BUTTON])
+    keyboard.append([CANCEL_BUTTON])
     
     reply_markup = InlineKeyboardMarkup(keyboard)
     
@@ -8280,29 +8213,27 @@ Choose which type of posts you want to redistribute:
 
 async def show_channel_selection_menu(query, user):
     """Show channel selection menu for bulk edit"""
-    posts = Database.get_scheduled_posts_for_channel(user.id)
-    channels = Database.get_user_channels(user.id)
+    posts = await asyncio.to_thread(cached_get_scheduled_posts, user.id)
+    channels = cached_get_user_channels(user.id)
     
     # Group posts by channel
-    posts_by_channel = {}
+    posts_by_channel = defaultdict(list)
     for post in posts:
-        channel_id = post['channel_id']
-        if channel_id not in posts_by_channel:
-            posts_by_channel[channel_id] = []
-        posts_by_channel[channel_id].append(post)
+        posts_by_channel[post['channel_id']].append(post)
     
     keyboard = []
     
-    for channel_id, channel_posts in posts_by_channel.items():
-        channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+    channel_by_id = {ch['channel_id']: ch for ch in channels}
+    for channel_id, channel_posts in _channels_by_post_count(posts_by_channel):
+        channel = channel_by_id.get(channel_id)
         channel_name = channel['channel_name'] if channel else f"Channel {channel_id}"
         keyboard.append([InlineKeyboardButton(
             f"📺 {channel_name} ({len(channel_posts)} posts)", 
             callback_data=f"bulkedit_channel_{channel_id}"
         )])
     
-    keyboard.append([InlineKeyboardButton("🔙 Back", callback_data="bulkedit_back")])
-    keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="back_to_main")])
+    keyboard.append([BULKEDIT_BACK_BUTTON])
+    keyboard.append([CANCEL_BUTTON])
     
     reply_markup = InlineKeyboardMarkup(keyboard)
     
@@ -8321,52 +8252,20 @@ async def handle_mode_selection(query, user, mode):
     except Exception:
         pass
         
-    posts = Database.get_scheduled_posts_for_channel(user.id)
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     # Filter posts by mode
-    filtered_posts = []
-    mode_name = ""
-    
-    if mode == "mode1":
-        mode_name = "Mode 1 (Bulk Upload)"
-        for post in posts:
-            if (not post.get('is_recurring') and 
-                not post.get('batch_id') and 
-                (not post.get('description') or len(post['description']) <= 50)):
-                filtered_posts.append(post)
-    
-    elif mode == "mode2":
-        mode_name = "Mode 2 (Custom Descriptions)"
-        for post in posts:
-            if (not post.get('is_recurring') and 
-                not post.get('batch_id') and 
-                post.get('description') and len(post['description']) > 50):
-                filtered_posts.append(post)
-    
-    elif mode == "recurring":
-        mode_name = "Recurring Posts"
-        for post in posts:
-            if post.get('is_recurring'):
-                filtered_posts.append(post)
-    
-    elif mode == "multibatch":
-        mode_name = "Multi-batch Posts"
-        for post in posts:
-            if post.get('batch_id'):
-                filtered_posts.append(post)
+    filtered_posts = _posts_for_mode(user.id, mode)
+    short_name, mode_name = BULK_EDIT_MODE_NAMES.get(mode, ("", ""))
     
     if not filtered_posts:
         await query.answer("❌ No posts found for this mode!", show_alert=True)
         return
     
     # Group the filtered posts by channel
-    posts_by_channel = {}
+    posts_by_channel = defaultdict(list)
     for post in filtered_posts:
-        channel_id = post['channel_id']
-        if channel_id not in posts_by_channel:
-            posts_by_channel[channel_id] = []
-        posts_by_channel[channel_id].append(post)
+        posts_by_channel[post['channel_id']].append(post)
     
     # Create keyboard with channel options for this mode
     keyboard = []
@@ -8378,16 +8277,17 @@ async def handle_mode_selection(query, user, mode):
     )])
     
     # Individual channel options for this mode
-    for channel_id, channel_posts in posts_by_channel.items():
-        channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+    channel_by_id = {ch['channel_id']: ch for ch in channels}
+    for channel_id, channel_posts in _channels_by_post_count(posts_by_channel):
+        channel = channel_by_id.get(channel_id)
         channel_name = channel['channel_name'] if channel else f"Channel {channel_id}"
         keyboard.append([InlineKeyboardButton(
-            f"📺 {channel_name} ({len(channel_posts)} {mode_name.split('(')[0].strip()} posts)", 
+            f"📺 {channel_name} ({len(channel_posts)} {short_name} posts)", 
             callback_data=f"bulkedit_mode_channel_{mode}_{channel_id}"
         )])
     
-    keyboard.append([InlineKeyboardButton("🔙 Back to Modes", callback_data="bulkedit_modes")])
-    keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="back_to_main")])
+    keyboard.append([BACK_TO_MODES_BUTTON])
+    keyboard.append([CANCEL_BUTTON])
     
     reply_markup = InlineKeyboardMarkup(keyboard)
     
@@ -8406,39 +8306,9 @@ Choose which posts to redistribute:
 
 async def handle_mode_all_selection(query, user, mode):
     """Handle selection of all posts from a specific mode"""
-    posts = Database.get_scheduled_posts_for_channel(user.id)
-    
     # Filter posts by mode (same logic as handle_mode_selection)
-    filtered_posts = []
-    mode_name = ""
-    
-    if mode == "mode1":
-        mode_name = "All Mode 1 (Bulk Upload) Posts"
-        for post in posts:
-            if (not post.get('is_recurring') and 
-                not post.get('batch_id') and 
-                (not post.get('description') or len(post['description']) <= 50)):
-                filtered_posts.append(post)
-    
-    elif mode == "mode2":
-        mode_name = "All Mode 2 (Custom Descriptions) Posts"
-        for post in posts:
-            if (not post.get('is_recurring') and 
-                not post.get('batch_id') and 
-                post.get('description') and len(post['description']) > 50):
-                filtered_posts.append(post)
-    
-    elif mode == "recurring":
-        mode_name = "All Recurring Posts"
-        for post in posts:
-            if post.get('is_recurring'):
-                filtered_posts.append(post)
-    
-    elif mode == "multibatch":
-        mode_name = "All Multi-batch Posts"
-        for post in posts:
-            if post.get('batch_id'):
-                filtered_posts.append(post)
+    filtered_posts = _posts_for_mode(user.id, mode)
+    mode_name = f"All {BULK_EDIT_MODE_NAMES[mode][1]} Posts" if mode in BULK_EDIT_MODE_NAMES else ""
     
     if not filtered_posts:
         await query.answer("❌ No posts found for this mode!", show_alert=True)
@@ -8448,51 +8318,50 @@ async def handle_mode_all_selection(query, user, mode):
 
 async def handle_bulk_edit_mode_channel_selection(query, user, mode, channel_id):
     """Handle selection of posts from specific mode and channel for bulk editing"""
-    posts = Database.get_scheduled_posts_for_channel(user.id, channel_id)
-    channels = Database.get_user_channels(user.id)
-    
     # Filter posts by mode and channel
-    filtered_posts = []
-    mode_name = ""
-    
-    # Get channel name
-    channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
-    channel_name = channel['channel_name'] if channel else f"Channel {channel_id}"
-    
-    if mode == "mode1":
-        mode_name = f"Mode 1 Posts from {channel_name}"
-        for post in posts:
-            if (not post.get('is_recurring') and 
-                not post.get('batch_id') and 
-                (not post.get('description') or len(post['description']) <= 50)):
-                filtered_posts.append(post)
-    
-    elif mode == "mode2":
-        mode_name = f"Mode 2 Posts from {channel_name}"
-        for post in posts:
-            if (not post.get('is_recurring') and 
-                not post.get('batch_id') and 
-                post.get('description') and len(post['description']) > 50):
-                filtered_posts.append(post)
-    
-    elif mode == "recurring":
-        mode_name = f"Recurring Posts from {channel_name}"
-        for post in posts:
-            if post.get('is_recurring'):
-                filtered_posts.append(post)
-    
-    elif mode == "multibatch":
-        mode_name = f"Multi-batch Posts from {channel_name}"
-        for post in posts:
-            if post.get('batch_id'):
-                filtered_posts.append(post)
+    filtered_posts = _posts_for_mode(user.id, mode, channel_id)
     
     if not filtered_posts:
         await query.answer("❌ No posts found for this mode and channel combination!", show_alert=True)
         return
     
+    # Channel name is only needed for the prompt label
+    channel = cached_get_channel(user.id, channel_id)
+    channel_name = channel['channel_name'] if channel else f"Channel {channel_id}"
+    mode_name = f"{BULK_EDIT_MODE_NAMES[mode][0]} Posts from {channel_name}" if mode in BULK_EDIT_MODE_NAMES else ""
+    
     await prompt_bulk_edit_settings(query, user, filtered_posts, mode_name)
 
+# Longer prefixes first: bulkedit_mode_ would also match the two after it
+_BULK_EDIT_ROUTES = (
+    ("bulkedit_all", _bulk_edit_all),
+    ("bulkedit_modes", _bulk_edit_modes),
+    ("bulkedit_channels", _bulk_edit_channels),
+    ("bulkedit_mode_all_", handle_mode_all_selection),
+    ("bulkedit_mode_channel_", _bulk_edit_mode_channel),
+    ("bulkedit_mode_", handle_mode_selection),
+    ("bulkedit_channel_", _bulk_edit_channel),
+    ("bulkedit_back", _bulk_edit_back),
+)
+
+# Fixed parts of the bulk-edit prompt; only the scope, count and defaults change per user
+BULK_EDIT_PROMPT_EXAMPLES = """
+*Examples:*
+• `10 20` - 10 AM to 8 PM, auto intervals (starting tomorrow)
+• `10 20 2` - 10 AM to 8 PM, every 2 hours (starting tomorrow)
+• `10 20 2025-07-25` - 10 AM to 8 PM, auto intervals, July 25th
+• `10 20 2 2025-07-25` - 10 AM to 8 PM, every 2 hours, July 25th
+• `9 18 1` - 9 AM to 6 PM, every 1 hour (starting tomorrow)
+"""
+BULK_EDIT_PROMPT_HELP = """
+*⚡ How it works:*
+• Auto intervals: Posts spread evenly across time range
+• Fixed intervals: Posts every X hours within range
+• End hour is inclusive (last post can be right at that time)
+• If no date specified, starts tomorrow
+• Times are in Kyiv timezone
+"""
+
 async def prompt_bulk_edit_settings(query, user, posts, scope_name):
     """Prompt user for bulk edit time range settings"""
     try:
@@ -8518,7 +8387,7 @@ async def prompt_bulk_edit_settings(query, user, posts, scope_name):
         return
     
     # Get current scheduling config as default
-    start_hour, end_hour, interval_hours = Database.get_scheduling_config(user.id)
+    start_hour, end_hour, interval_hours = cached_get_scheduling_config(user.id)
     
     message = f"""
 ⏰ *Bulk Edit: {scope_name}*
@@ -8527,28 +8396,11 @@ async def prompt_bulk_edit_settings(query, user, posts, scope_name):
 
 *Enter your schedule parameters:*
 `start_hour end_hour [interval] [YYYY-MM-DD]`
-
-*Examples:*
-• `10 20` - 10 AM to 8 PM, auto intervals (starting tomorrow)
-• `10 20 2` - 10 AM to 8 PM, every 2 hours (starting tomorrow)
-• `10 20 2025-07-25` - 10 AM to 8 PM, auto intervals, July 25th
-• `10 20 2 2025-07-25` - 10 AM to 8 PM, every 2 hours, July 25th
-• `9 18 1` - 9 AM to 6 PM, every 1 hour (starting tomorrow)
-
+""" + BULK_EDIT_PROMPT_EXAMPLES + f"""
 *Current default:* `{start_hour} {end_hour} {interval_hours}`
-
-*⚡ How it works:*
-• Auto intervals: Posts spread evenly across time range
-• Fixed intervals: Posts every X hours within range
-• End hour is inclusive (last post can be right at that time)
-• If no date specified, starts tomorrow
-• Times are in Kyiv timezone
-"""
-    
-    keyboard = [[InlineKeyboardButton("❌ Cancel", callback_data="back_to_main")]]
-    reply_markup = InlineKeyboardMarkup(keyboard)
+""" + BULK_EDIT_PROMPT_HELP
     
-    await query.edit_message_text(message, reply_markup=reply_markup, parse_mode='Markdown')
+    await query.edit_message_text(message, reply_markup=CANCEL_MARKUP, parse_mode='Markdown')
 
 async def handle_bulk_edit_input(update: Update, user, text: str, session_data: dict):
     """Handle bulk edit time range, interval, and date input"""
@@ -8559,7 +8411,7 @@ async def handle_bulk_edit_input(update: Update, user, text: str, session_data:
         return
     
     # Get user's default schedule window configuration
-    default_start, default_end, default_interval = Database.get_scheduling_config(user.id)
+    default_start, default_end, default_interval = cached_get_scheduling_config(user.id)
     
     # Enforce default schedule window constraints
     if start_hour < default_start or end_hour > default_end:
@@ -8575,7 +8427,8 @@ async def handle_bulk_edit_input(update: Update, user, text: str, session_data:
         return
     
     # Get posts from session
-    post_ids = session_data.get('posts', [])
+    # Sessions are stored as JSON, so the ids come back as a list
+    post_ids = set(session_data.get('posts', []))
     scope_name = session_data.get('scope', 'Posts')
     
     if not post_ids:
@@ -8583,43 +8436,43 @@ async def handle_bulk_edit_input(update: Update, user, text: str, session_data:
         Database.update_user_session(user.id, BotStates.IDLE)
         return
     
-    # Get posts details
-    posts = Database.get_scheduled_posts_for_channel(user.id)
-    posts_to_update = [post for post in posts if post['id'] in post_ids]
+    # Drop posts that were sent or deleted since the scope was chosen
+    ids_to_update = Database.get_scheduled_post_ids(user.id, post_ids)
     
-    if not posts_to_update:
+    if not ids_to_update:
         await update.message.reply_text("❌ No valid posts found to update.")
         Database.update_user_session(user.id, BotStates.IDLE)
         return
     
     # Calculate new evenly distributed schedule
     interval_to_use = interval_hours if interval_hours > 0 else None
-    new_schedule_times = calculate_evenly_distributed_schedule(start_hour, end_hour, len(posts_to_update), start_date, interval_to_use)
+    new_schedule_times = calculate_evenly_distributed_schedule(start_hour, end_hour, len(ids_to_update), start_date, interval_to_use)
     
     # Prepare updates
-    post_schedule_updates = []
-    for i, post in enumerate(posts_to_update):
-        if i < len(new_schedule_times):
-            post_schedule_updates.append((post['id'], new_schedule_times[i]))
+    post_schedule_updates = list(zip(ids_to_update, new_schedule_times))
     
     # Execute bulk update
     updated_count = Database.bulk_update_post_schedules(post_schedule_updates)
     
     if updated_count > 0:
-        # Note: Database is already updated with new scheduled times.
-        # The post monitoring system (runs every 5 minutes) will automatically detect 
-        # posts that have scheduled_time but no active APScheduler job, and reschedule them.
-        # This is more reliable than trying to access the scheduler from a message handler.
-        logger.info(f"Bulk edit: Updated {len(post_schedule_updates)} posts in database. Monitor will reschedule them.")
+        # Move the existing jobs right away; a job left at its old time would still fire there,
+        # and the post monitor only picks up posts that have no job at all
+        try:
+            await PostScheduler.instance().reschedule_posts(post_schedule_updates)
+        except Exception as e:
+            logger.error(f"Bulk edit: Failed to reschedule jobs, monitor will pick them up: {e}")
+        logger.info(f"Bulk edit: Updated {len(post_schedule_updates)} posts in database.")
     
     # Generate preview of new schedule
-    preview_text = "\n*📅 New Schedule Preview:*\n"
-    for i, (post_id, new_time) in enumerate(post_schedule_updates[:5]):  # Show first 5
-        time_str = new_time.strftime("%Y-%m-%d %H:%M")
-        preview_text += f"• Post #{post_id}: {time_str}\n"
+    preview_parts = ["\n*📅 New Schedule Preview:*\n"]
+    preview_parts.extend(
+        f"• Post #{post_id}: {new_time.strftime('%Y-%m-%d %H:%M')}\n"
+        for post_id, new_time in post_schedule_updates[:5]  # Show first 5
+    )
     
     if len(post_schedule_updates) > 5:
-        preview_text += f"... and {len(post_schedule_updates) - 5} more posts\n"
+        preview_parts.append(f"... and {len(post_schedule_updates) - 5} more posts\n")
+    preview_text = "".join(preview_parts)
     
     # Create success message with date and interval info
     date_info = "starting tomorrow" if start_date is None else f"starting {start_date.strftime('%Y-%m-%d')}"
@@ -8632,21 +8485,14 @@ async def handle_bulk_edit_input(update: Update, user, text: str, session_data:
 *⏰ Time Range:* {start_hour}:00 - {end_hour}:00 (Kyiv time)
 *⏱️ Interval:* {interval_info}
 *📅 Start Date:* {date_info.title()}
-*📝 Posts Updated:* {updated_count} of {len(posts_to_update)}
+*📝 Posts Updated:* {updated_count} of {len(ids_to_update)}
 
 {preview_text}
 
 *🎯 Result:* Posts are now distributed with {interval_info} across your time window, {date_info}.
 """
     
-    keyboard = [
-        [InlineKeyboardButton("📅 View Calendar", callback_data="main_calendar")],
-        [InlineKeyboardButton("📊 View Statistics", callback_data="main_stats")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    
-    await update.message.reply_text(success_message, reply_markup=reply_markup, parse_mode='Markdown')
+    await update.message.reply_text(success_message, reply_markup=SCHEDULE_UPDATED_MARKUP, parse_mode='Markdown')
     
     # Reset user session
     Database.update_user_session(user.id, BotStates.IDLE)
@@ -8670,7 +8516,7 @@ async def backup_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     keyboard = [
         [InlineKeyboardButton("📦 Create New Backup", callback_data="backup_create")],
         [InlineKeyboardButton("📋 View Existing Backups", callback_data="backup_list")],
-        [InlineKeyboardButton("❌ Cancel", callback_data="back_to_main")]
+        [CANCEL_BUTTON]
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
     
@@ -8710,7 +8556,7 @@ async def restore_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
             callback_data=callback_data
         )])
     
-    keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="back_to_main")])
+    keyboard.append([CANCEL_BUTTON])
     reply_markup = InlineKeyboardMarkup(keyboard)
     
     await update.message.reply_text(
@@ -8768,7 +8614,7 @@ async def handle_backup_callback(query, user, data):
             )])
         
         keyboard.append([InlineKeyboardButton("🔙 Back", callback_data="backup_menu")])
-        keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="back_to_main")])
+        keyboard.append([CANCEL_BUTTON])
         reply_markup = InlineKeyboardMarkup(keyboard)
         
         await query.edit_message_text(
@@ -8780,7 +8626,7 @@ async def handle_backup_callback(query, user, data):
         )
     
     elif data.startswith("backup_view_"):
-        backup_name = data.replace("backup_view_", "")
+        backup_name = data.removeprefix("backup_view_")
         backups = Database.get_user_backups(user.id)
         backup = next((b for b in backups if b['name'] == backup_name), None)
         
@@ -8789,7 +8635,7 @@ async def handle_backup_callback(query, user, data):
                 [InlineKeyboardButton("🔄 Restore This Backup", callback_data=f"restore_select_{backup_name}")],
                 [InlineKeyboardButton("🗑️ Delete Backup", callback_data=f"backup_delete_{backup_name}")],
                 [InlineKeyboardButton("🔙 Back to List", callback_data="backup_list")],
-                [InlineKeyboardButton("❌ Cancel", callback_data="back_to_main")]
+                [CANCEL_BUTTON]
             ]
             reply_markup = InlineKeyboardMarkup(keyboard)
             
@@ -8806,7 +8652,7 @@ async def handle_backup_callback(query, user, data):
             await query.edit_message_text("❌ Backup not found.")
     
     elif data.startswith("backup_delete_"):
-        backup_name = data.replace("backup_delete_", "")
+        backup_name = data.removeprefix("backup_delete_")
         
         # Show confirmation
         keyboard = [
@@ -8824,7 +8670,7 @@ async def handle_backup_callback(query, user, data):
         )
     
     elif data.startswith("backup_confirm_delete_"):
-        backup_name = data.replace("backup_confirm_delete_", "")
+        backup_name = data.removeprefix("backup_confirm_delete_")
         success = Database.delete_backup(user.id, backup_name)
         
         if success:
@@ -8847,7 +8693,7 @@ async def handle_backup_callback(query, user, data):
         keyboard = [
             [InlineKeyboardButton("📦 Create New Backup", callback_data="backup_create")],
             [InlineKeyboardButton("📋 View Existing Backups", callback_data="backup_list")],
-            [InlineKeyboardButton("❌ Cancel", callback_data="back_to_main")]
+            [CANCEL_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
@@ -8867,7 +8713,7 @@ async def handle_restore_callback(query, user, data):
         pass
     
     if data.startswith("restore_select_"):
-        backup_name = data.replace("restore_select_", "")
+        backup_name = data.removeprefix("restore_select_")
         
         # Check current scheduled posts
         current_posts = Database.get_scheduled_posts_for_channel(user.id)
@@ -8881,7 +8727,7 @@ async def handle_restore_callback(query, user, data):
             keyboard.insert(0, [InlineKeyboardButton("🔄 Replace Current Schedule", callback_data=f"restore_replace_{backup_name}")])
             keyboard.insert(1, [InlineKeyboardButton("🔄 Replace + Include Missing Files", callback_data=f"restore_replace_missing_{backup_name}")])
         
-        keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="back_to_main")])
+        keyboard.append([CANCEL_BUTTON])
         reply_markup = InlineKeyboardMarkup(keyboard)
         
         current_info = f"{len(current_posts)} posts" if current_posts else "No posts"
@@ -8915,20 +8761,13 @@ async def handle_restore_callback(query, user, data):
         if success:
             mode_text = "replaced" if replace_mode else "added to"
             
-            keyboard = [
-                [InlineKeyboardButton("📅 View Calendar", callback_data="main_calendar")],
-                [InlineKeyboardButton("📊 View Statistics", callback_data="main_stats")],
-                [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
             await query.edit_message_text(
                 f"✅ *Backup Restored Successfully!*\n\n"
                 f"*Backup:* {backup_name}\n"
                 f"*Result:* {message}\n"
                 f"*Mode:* Posts {mode_text} your schedule\n\n"
                 f"Your posts have been restored and will be posted according to their original schedule.",
-                reply_markup=reply_markup,
+                reply_markup=SCHEDULE_UPDATED_MARKUP,
                 parse_mode='Markdown'
             )
         else:
@@ -8962,7 +8801,7 @@ async def handle_backup_name_input(update: Update, user, text: str):
         keyboard = [
             [InlineKeyboardButton("📋 View Backups", callback_data="backup_list")],
             [InlineKeyboardButton("📦 Create Another", callback_data="backup_create")],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+            [BACK_TO_MENU_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
@@ -8995,7 +8834,7 @@ async def overdue_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     if not overdue_posts:
         keyboard = [
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+            [BACK_TO_MENU_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
@@ -9019,7 +8858,7 @@ async def overdue_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         channels_with_overdue[channel_id]['posts'].append(post)
     
     # Get channel names
-    user_channels = Database.get_user_channels(user.id)
+    user_channels = cached_get_user_channels(user.id)
     channel_names = {channel['channel_id']: channel['channel_name'] for channel in user_channels}
     
     for channel_id in channels_with_overdue:
@@ -9042,7 +8881,7 @@ async def overdue_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     keyboard.extend([
         [InlineKeyboardButton("🔄 Reschedule All", callback_data="overdue_reschedule_all")],
         [InlineKeyboardButton("📬 Post All Now", callback_data="overdue_post_all")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+        [BACK_TO_MENU_BUTTON]
     ])
     
     reply_markup = InlineKeyboardMarkup(keyboard)
@@ -9075,7 +8914,7 @@ Choose an option below:
 
 async def handle_overdue_callback(query, user, data):
     """Handle overdue post management callbacks"""
-    action = data.replace("overdue_", "")
+    action = data.removeprefix("overdue_")
     
     if action == "reschedule_all":
         # Reschedule all overdue posts
@@ -9090,7 +8929,7 @@ async def handle_overdue_callback(query, user, data):
         if updated_count > 0:
             keyboard = [
                 [InlineKeyboardButton("📊 View Stats", callback_data="main_stats")],
-                [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+                [BACK_TO_MENU_BUTTON]
             ]
             reply_markup = InlineKeyboardMarkup(keyboard)
             
@@ -9137,10 +8976,7 @@ async def handle_overdue_callback(query, user, data):
         failed_count = 0
         
         # Actually post all overdue posts immediately using scheduler
-        # Note: This callback function needs access to context to get the shared scheduler
-        from .scheduler import PostScheduler
-        scheduler = PostScheduler()
-        logger.warning("Using fallback scheduler instance for overdue posting - using private method")
+        scheduler = PostScheduler.instance()
         
         for post in overdue_posts:
             try:
@@ -9153,7 +8989,7 @@ async def handle_overdue_callback(query, user, data):
         
         keyboard = [
             [InlineKeyboardButton("📊 View Stats", callback_data="main_stats")],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+            [BACK_TO_MENU_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
@@ -9172,15 +9008,13 @@ async def handle_overdue_callback(query, user, data):
     
     elif action.startswith("post_channel_"):
         # Post all overdue posts for a specific channel immediately
-        channel_id = action.replace("post_channel_", "")
+        channel_id = action.removeprefix("post_channel_")
         overdue_posts = Database.get_overdue_posts(user.id, channel_id)
         if not overdue_posts:
             await query.edit_message_text("✅ No overdue posts found for this channel.")
             return
 
-        from .scheduler import PostScheduler
-        scheduler = PostScheduler()
-        logger.warning("Using fallback scheduler instance for channel overdue posting")
+        scheduler = PostScheduler.instance()
         posted_count = 0
         failed_count = 0
         for post in overdue_posts:
@@ -9193,7 +9027,7 @@ async def handle_overdue_callback(query, user, data):
 
         keyboard = [
             [InlineKeyboardButton("🔄 Refresh Overdue", callback_data="overdue_refresh")],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+            [BACK_TO_MENU_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         status_message = f"✅ *Channel Posting Complete*\n\n"
@@ -9206,7 +9040,7 @@ async def handle_overdue_callback(query, user, data):
     elif action.startswith("post_") and not action == "post_all":
         # Post a specific overdue post immediately
         try:
-            post_id = int(action.replace("post_", ""))
+            post_id = int(action.removeprefix("post_"))
         except ValueError:
             logger.error(f"Invalid overdue post action: {action}")
             await query.edit_message_text("❌ Invalid action. Please try again.")
@@ -9214,14 +9048,12 @@ async def handle_overdue_callback(query, user, data):
         
         try:
             # Actually post the content to Telegram instead of just marking as posted
-            from .scheduler import PostScheduler
-            scheduler = PostScheduler()
-            logger.warning("Using fallback scheduler instance for individual overdue posting")
+            scheduler = PostScheduler.instance()
             await scheduler._post_to_channel(post_id)
             
             keyboard = [
                 [InlineKeyboardButton("🔄 Refresh Overdue", callback_data="overdue_refresh")],
-                [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+                [BACK_TO_MENU_BUTTON]
             ]
             reply_markup = InlineKeyboardMarkup(keyboard)
             
@@ -9244,7 +9076,7 @@ async def handle_overdue_callback(query, user, data):
     
     elif action.startswith("reschedule_channel_"):
         # Reschedule all overdue posts for a specific channel
-        channel_id = action.replace("reschedule_channel_", "")
+        channel_id = action.removeprefix("reschedule_channel_")
         overdue_posts = Database.get_overdue_posts(user.id, channel_id)
         if not overdue_posts:
             await query.edit_message_text("✅ No overdue posts found for this channel.")
@@ -9253,7 +9085,7 @@ async def handle_overdue_callback(query, user, data):
         updated_count = Database.reschedule_overdue_posts_to_next_slots(user.id, post_ids, channel_id)
         keyboard = [
             [InlineKeyboardButton("🔄 Refresh Overdue", callback_data="overdue_refresh")],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+            [BACK_TO_MENU_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         if updated_count > 0:
@@ -9267,7 +9099,7 @@ async def handle_overdue_callback(query, user, data):
     elif action.startswith("reschedule_"):
         # Reschedule a specific overdue post
         try:
-            post_id = int(action.replace("reschedule_", ""))
+            post_id = int(action.removeprefix("reschedule_"))
         except ValueError:
             logger.error(f"Invalid overdue reschedule action: {action}")
             await query.edit_message_text("❌ Invalid action. Please try again.")
@@ -9278,7 +9110,7 @@ async def handle_overdue_callback(query, user, data):
         if updated_count > 0:
             keyboard = [
                 [InlineKeyboardButton("🔄 Refresh Overdue", callback_data="overdue_refresh")],
-                [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+                [BACK_TO_MENU_BUTTON]
             ]
             reply_markup = InlineKeyboardMarkup(keyboard)
             
@@ -9301,7 +9133,7 @@ async def handle_overdue_callback(query, user, data):
         # Return to main overdue view - need to create a new message since we can't call command handler
         keyboard = [
             [InlineKeyboardButton("🔄 Check Overdue", callback_data="overdue_refresh")],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+            [BACK_TO_MENU_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
@@ -9316,7 +9148,7 @@ async def handle_overdue_callback(query, user, data):
         # Refresh the overdue view - simulate calling the handler
         keyboard = [
             [InlineKeyboardButton("🔄 Check Again", callback_data="overdue_refresh")],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+            [BACK_TO_MENU_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
@@ -9329,7 +9161,7 @@ async def handle_overdue_callback(query, user, data):
     
     elif action.startswith("channel_"):
         # Show individual overdue posts for a specific channel
-        channel_id = action.replace("channel_", "")
+        channel_id = action.removeprefix("channel_")
         await show_channel_overdue_posts(query, user, channel_id)
 
 async def show_channel_overdue_posts(query, user, channel_id: str):
@@ -9352,7 +9184,7 @@ async def show_channel_overdue_posts(query, user, channel_id: str):
         return
     
     # Get channel name
-    user_channels = Database.get_user_channels(user.id)
+    user_channels = cached_get_user_channels(user.id)
     channel_name = channel_id
     for channel in user_channels:
         if channel['channel_id'] == channel_id:
@@ -9409,7 +9241,7 @@ async def handle_main_overdue_callback(query, user):
     
     if not overdue_posts:
         keyboard = [
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+            [BACK_TO_MENU_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
@@ -9430,7 +9262,7 @@ async def handle_main_overdue_callback(query, user):
         channels_with_overdue[channel_id].append(post)
     
     # Get channel names
-    user_channels = Database.get_user_channels(user.id)
+    user_channels = cached_get_user_channels(user.id)
     channel_names = {channel['channel_id']: channel['channel_name'] for channel in user_channels}
     
     # Create inline keyboard for channel selection
@@ -9449,7 +9281,7 @@ async def handle_main_overdue_callback(query, user):
     keyboard.extend([
         [InlineKeyboardButton("🔄 Reschedule All", callback_data="overdue_reschedule_all")],
         [InlineKeyboardButton("📬 Post All Now", callback_data="overdue_post_all")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+        [BACK_TO_MENU_BUTTON]
     ])
     
     reply_markup = InlineKeyboardMarkup(keyboard)
@@ -9488,7 +9320,7 @@ async def handle_reschedule_callback(query, user):
     from telegram import InlineKeyboardButton, InlineKeyboardMarkup
     
     # Check if user has channels configured
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     if not channels:
         await query.edit_message_text(
@@ -9503,7 +9335,7 @@ async def handle_reschedule_callback(query, user):
     
     if not pending_posts:
         keyboard = [
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+            [BACK_TO_MENU_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
@@ -9520,7 +9352,7 @@ async def handle_reschedule_callback(query, user):
     keyboard = [
         [InlineKeyboardButton("🔁 All Posts", callback_data="reschedule_all")],
         [InlineKeyboardButton("⚙️ Custom Hours", callback_data="reschedule_custom")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+        [BACK_TO_MENU_BUTTON]
     ]
     
     reply_markup = InlineKeyboardMarkup(keyboard)
@@ -9549,7 +9381,7 @@ async def handle_reschedule_action_callback(query, user, data, context):
     """Handle reschedule action callbacks"""
     from bot.database import Database
     
-    action = data.replace("reschedule_", "")
+    action = data.removeprefix("reschedule_")
     
     if action == "all":
         # Reschedule all posts with default settings
@@ -9577,7 +9409,7 @@ async def handle_reschedule_action_callback(query, user, data, context):
                 
                 keyboard = [
                     [InlineKeyboardButton("📊 View Stats", callback_data="main_stats")],
-                    [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+                    [BACK_TO_MENU_BUTTON]
                 ]
                 reply_markup = InlineKeyboardMarkup(keyboard)
                 
@@ -9594,7 +9426,7 @@ All your pending posts have been rescheduled with the new times starting from to
 """
             else:
                 keyboard = [
-                    [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+                    [BACK_TO_MENU_BUTTON]
                 ]
                 reply_markup = InlineKeyboardMarkup(keyboard)
                 
@@ -9609,7 +9441,7 @@ No pending posts were found to reschedule.
         except Exception as e:
             logger.error(f"Error during reschedule: {e}")
             keyboard = [
-                [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+                [BACK_TO_MENU_BUTTON]
             ]
             reply_markup = InlineKeyboardMarkup(keyboard)
             
@@ -9717,7 +9549,7 @@ async def handle_reschedule_settings_input(update, user, text, context):
         
         keyboard = [
             [InlineKeyboardButton("📊 View Stats", callback_data="main_stats")],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+            [BACK_TO_MENU_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
@@ -9754,7 +9586,7 @@ No pending posts were found to reschedule.
         Database.update_user_session(user.id, "idle", {})
         
         keyboard = [
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+            [BACK_TO_MENU_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
@@ -9785,7 +9617,7 @@ async def settings_handler(update, context):
             InlineKeyboardButton(f"Threshold: {threshold} posts", callback_data="settings_threshold_info"),
             InlineKeyboardButton("➕", callback_data="settings_threshold_inc")
         ],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+        [BACK_TO_MENU_BUTTON]
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
     
@@ -9824,7 +9656,7 @@ Use the buttons below to adjust your settings:
 
 async def handle_settings_callback(query, user, data):
     """Handle settings callback interactions"""
-    action = data.replace("settings_", "")
+    action = data.removeprefix("settings_")
     
     if action == "toggle_reminder":
         # Toggle reminder status
@@ -9845,7 +9677,7 @@ async def handle_settings_callback(query, user, data):
                 InlineKeyboardButton(f"Threshold: {threshold} posts", callback_data="settings_threshold_info"),
                 InlineKeyboardButton("➕", callback_data="settings_threshold_inc")
             ],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+            [BACK_TO_MENU_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
@@ -9901,7 +9733,7 @@ Use the buttons below to adjust your settings:
                 InlineKeyboardButton(f"Threshold: {new_threshold} posts", callback_data="settings_threshold_info"),
                 InlineKeyboardButton("➕", callback_data="settings_threshold_inc")
             ],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+            [BACK_TO_MENU_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
@@ -9957,7 +9789,7 @@ Use the buttons below to adjust your settings:
                 InlineKeyboardButton(f"Threshold: {new_threshold} posts", callback_data="settings_threshold_info"),
                 InlineKeyboardButton("➕", callback_data="settings_threshold_inc")
             ],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+            [BACK_TO_MENU_BUTTON]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
@@ -10011,7 +9843,7 @@ async def editposts_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     logger.info(f"editposts_handler called for user {user.id}")
     
     # Get user's channels
-    channels = Database.get_user_channels(user.id)
+    channels = cached_get_user_channels(user.id)
     
     if not channels:
         await update.message.reply_text(
@@ -10033,7 +9865,7 @@ async def editposts_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
             callback_data=f"editposts_channel_{channel['channel_id']}"
         )])
     
-    keyboard.append([InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")])
+    keyboard.append([BACK_TO_MENU_BUTTON])
     reply_markup = InlineKeyboardMarkup(keyboard)
     
     await update.message.reply_text(
@@ -10061,8 +9893,7 @@ async def handle_editposts_channel_selection(query, user, channel_id):
             return
         
         # Get channel info
-        channels = Database.get_user_channels(user.id)
-        channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+        channel = cached_get_channel(user.id, channel_id)
         channel_name = channel['channel_name'] if channel else channel_id
         
         # Get Mode 2 posts for this channel
@@ -10185,8 +10016,7 @@ async def handle_editposts_navigation(query, user, new_index):
             return
         
         # Get channel name
-        channels = Database.get_user_channels(user.id)
-        channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+        channel = cached_get_channel(user.id, channel_id)
         channel_name = channel['channel_name'] if channel else channel_id
         
         await show_edit_post_details(query, user, post, new_index, len(post_ids), channel_name)
@@ -10288,7 +10118,7 @@ async def handle_editposts_media(query, user, post_id):
         Database.update_user_session(user.id, BotStates.EDIT_POST_MEDIA, session_data)
         
         media_type = post['media_type'] or 'photo'
-        media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+        media_icon = get_media_icon(media_type)
         
         message = f"🖼️ *Replace Media - Post #{post_id}*\n\n"
         message += f"*Current Media:* {media_icon} {media_type.title()}\n\n"
@@ -10383,8 +10213,7 @@ async def handle_editposts_schedule_quick(query, user, post_id, hours, context):
             if session_data and 'edit_post_ids' in session_data:
                 current_index = session_data.get('edit_current_index', 0)
                 channel_id = session_data.get('edit_channel_id')
-                channels = Database.get_user_channels(user.id)
-                channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+                channel = cached_get_channel(user.id, channel_id)
                 channel_name = channel['channel_name'] if channel else channel_id
                 
                 # Get updated post
@@ -10471,10 +10300,7 @@ async def handle_editposts_confirm_delete(query, user, post_id, context):
             if context and context.application and context.application.bot_data:
                 scheduler = context.application.bot_data.get('scheduler')
                 if scheduler:
-                    try:
-                        scheduler.scheduler.remove_job(f"post_{post_id}")
-                    except:
-                        pass  # Job might not exist
+                    await scheduler.cancel_post_job(post_id)
             
             # Delete media file
             file_path = post.get('file_path')
@@ -10514,8 +10340,7 @@ async def handle_editposts_confirm_delete(query, user, post_id, context):
                     # Show next post
                     next_post = Database.get_post_by_id(post_ids[current_index])
                     channel_id = session_data.get('edit_channel_id')
-                    channels = Database.get_user_channels(user.id)
-                    channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+                    channel = cached_get_channel(user.id, channel_id)
                     channel_name = channel['channel_name'] if channel else channel_id
                     
                     await show_edit_post_details(query, user, next_post, current_index, len(post_ids), channel_name)
@@ -10541,8 +10366,7 @@ async def handle_editposts_cancel(query, user, post_id):
             
             post = Database.get_post_by_id(post_id)
             if post:
-                channels = Database.get_user_channels(user.id)
-                channel = next((ch for ch in channels if ch['channel_id'] == channel_id), None)
+                channel = cached_get_channel(user.id, channel_id)
                 channel_name = channel['channel_name'] if channel else channel_id
                 
                 await show_edit_post_details(query, user, post, current_index, len(session_data['edit_post_ids']), channel_name)
@@ -10559,7 +10383,7 @@ async def handle_editposts_cancel(query, user, post_id):
 async def show_editposts_menu(query, user):
     """Show the main edit posts menu with channel selection"""
     try:
-        channels = Database.get_user_channels(user.id)
+        channels = cached_get_user_channels(user.id)
         
         if not channels:
             await query.edit_message_text(
@@ -10579,7 +10403,7 @@ async def show_editposts_menu(query, user):
                 callback_data=f"editposts_channel_{channel['channel_id']}"
             )])
         
-        keyboard.append([InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")])
+        keyboard.append([BACK_TO_MENU_BUTTON])
         reply_markup = InlineKeyboardMarkup(keyboard)
         
         await query.edit_message_text(
@@ -10651,7 +10475,7 @@ async def handle_editposts_input(update: Update, user, session_data: dict, conte
             # Parse the datetime
             tz = get_kyiv_timezone()
             new_time = datetime.strptime(text, "%Y-%m-%d %H:%M")
-            new_time = tz.localize(new_time)
+            new_time = new_time.replace(tzinfo=tz)
             
             # Update the post
             success = Database.update_post_schedule(editing_post_id, new_time)
@@ -10705,7 +10529,7 @@ async def handle_mode3_media_upload(update: Update, user, file_path: str, media_
     session_data['media_items'] = media_items
     Database.update_user_session(user.id, BotStates.MODE3_UPLOADING, session_data)
     
-    media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+    media_icon = get_media_icon(media_type)
     
     keyboard = [[InlineKeyboardButton("✅ Done Uploading", callback_data="mode3_done_uploading")]]
     reply_markup = InlineKeyboardMarkup(keyboard)
@@ -10761,7 +10585,7 @@ async def show_mode3_caption_prompt(query_or_message, user, session_data: dict,
     file_path = item['file_path']
     media_type = item['media_type']
     
-    media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+    media_icon = get_media_icon(media_type)
     
     keyboard = [
         [InlineKeyboardButton("⏭️ Skip (No Caption)", callback_data="mode3_skip_caption")],
@@ -10960,13 +10784,12 @@ async def finish_mode3_captioning(query_or_message, user, session_data: dict):
     saved_posts = [item for item in media_items if 'post_id' in item]
     
     # Get channel name
-    channels = Database.get_user_channels(user.id)
-    channel = next((ch for ch in channels if ch['channel_id'] == selected_channel_id), None)
+    channel = cached_get_channel(user.id, selected_channel_id)
     channel_name = channel['channel_name'] if channel else selected_channel_id
     
     keyboard = [
         [InlineKeyboardButton("📅 Schedule Posts", callback_data="mode3_schedule")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+        [BACK_TO_MENU_BUTTON]
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
     
@@ -11066,7 +10889,7 @@ async def handle_mode3_cancel(query, user):
     
     # Show main menu
     keyboard = [
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]
+        [BACK_TO_MENU_BUTTON]
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
     
@@ -11104,7 +10927,7 @@ async def handle_editposts_media_input(update: Update, user, file_path: str, med
         if 'edit_post_ids' in old_session:
             Database.update_user_session(user.id, BotStates.EDIT_POSTS_MENU, old_session)
         
-        media_icon = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}.get(media_type, '📁')
+        media_icon = get_media_icon(media_type)
         
         await update.message.reply_text(
             f"✅ *Media Replaced Successfully!*\n\n"
@@ -11126,8 +10949,7 @@ async def show_recurring_posts_menu(query, user):
         recurring_posts = Database.get_user_recurring_posts(user.id)
         
         if not recurring_posts:
-            keyboard = [[InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = BACK_TO_MAIN_MARKUP
             
             await query.edit_message_text(
                 "🔄 *No Recurring Posts*\n\n"
@@ -11153,7 +10975,7 @@ async def show_recurring_posts_menu(query, user):
                 callback_data=f"recur_manage_ch_{channel_id}"
             )])
         
-        keyboard.append([InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_main")])
+        keyboard.append([BACK_TO_MENU_BUTTON])
         reply_markup = InlineKeyboardMarkup(keyboard)
         
         await query.edit_message_text(
@@ -11230,8 +11052,7 @@ async def show_recurring_post_detail(query, user, post: dict, index: int, total:
         caption_text = escape_markdown(description[:100] + "..." if len(description) > 100 else description) if description else "_No caption_"
         next_text = next_post.strftime('%Y-%m-%d %H:%M') if next_post else "Not scheduled"
         
-        media_icons = {'photo': '📸', 'video': '🎥', 'audio': '🎵', 'animation': '🎬', 'document': '📄'}
-        media_icon = media_icons.get(media_type, '📁')
+        media_icon = get_media_icon(media_type)
         
         nav_buttons = []
         if index > 0:
@@ -11507,7 +11328,7 @@ async def handle_recurring_set_end(query, user, post_id: int, end_type: str, con
             success = Database.update_recurring_post_end_condition(post_id, None, None, user_id=user.id)
             msg = "End condition set to: Never"
         elif end_type.startswith("count_"):
-            count = int(end_type.replace("count_", ""))
+            count = int(end_type.removeprefix("count_"))
             success = Database.update_recurring_post_end_condition(post_id, count, None, user_id=user.id)
             msg = f"End condition set to: {count} times"
         elif end_type == "date":
@@ -11674,7 +11495,6 @@ async def handle_recurring_caption_input(update: Update, user, text: str, sessio
 
 async def handle_recurring_end_date_input(update: Update, user, text: str, session_data: dict):
     """Handle end date input for recurring post editing"""
-    from datetime import datetime
     from bot.utils import get_kyiv_timezone
     
     post_id = session_data.get('editing_recurring_id')
@@ -11684,21 +11504,7 @@ async def handle_recurring_end_date_input(update: Update, user, text: str, sessi
     
     date_str = text.strip()
     
-    date_formats = [
-        "%Y-%m-%d %H:%M",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
-        "%m/%d/%Y %H:%M",
-        "%d.%m.%Y %H:%M"
-    ]
-    
-    end_date = None
-    for fmt in date_formats:
-        try:
-            end_date = datetime.strptime(date_str, fmt)
-            break
-        except ValueError:
-            continue
+    end_date = _parse_end_date(date_str)
     
     if not end_date:
         await update.message.reply_text(
@@ -11710,7 +11516,7 @@ async def handle_recurring_end_date_input(update: Update, user, text: str, sessi
         return True
     
     kyiv_tz = get_kyiv_timezone()
-    end_date = kyiv_tz.localize(end_date)
+    end_date = end_date.replace(tzinfo=kyiv_tz)
     
     current_time = get_current_kyiv_time()
     if end_date <= current_time:
@@ -3,32 +3,74 @@ Post scheduler for handling automatic posting
 """
 
 import asyncio
+import json
 import logging
 import os
+import re
 from datetime import datetime, timedelta
-from typing import Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.triggers.date import DateTrigger
-import pytz
 
-from telegram import Bot
+from telegram import Bot, InputFile, InputMediaPhoto, InputMediaVideo, MessageEntity
 from telegram.error import TelegramError
 from telegram.request import HTTPXRequest
 
 from .database import Database
+from . import db_cache
 from .utils import get_kyiv_timezone, get_current_kyiv_time, cleanup_old_media_files, cleanup_empty_directories
-from config import BOT_TOKEN, CHANNEL_ID, UPLOADS_DIR, DATA_DIR
+from config import (
+    BOT_TOKEN, CHANNEL_ID, UPLOADS_DIR, DATA_DIR,
+    SCHEDULER_CONNECTION_POOL_SIZE, SCHEDULER_POOL_TIMEOUT
+)
 
 logger = logging.getLogger(__name__)
 
+# Telegram accepts roughly one message per second in a single chat
+CHANNEL_SEND_INTERVAL_SECONDS = 1.0
+
+# Telegram allows about 30 messages per second per bot overall; stay a little under
+OVERALL_SEND_INTERVAL_SECONDS = 1 / 25
+
+# Ids of per-post jobs, as opposed to system jobs such as 'post_monitor'
+_POST_JOB_ID_RE = re.compile(r'^post_(\d+)$')
+
+# Reminders in flight at once; the overall send budget still paces the messages
+REMINDER_SEND_CONCURRENCY = 25
+
+# Kyiv zone shared by every job and scheduled time
+KYIV_TZ = get_kyiv_timezone()
+
+# Posts due within this window wait on a plain event loop timer instead of a job
+POST_TIMER_HORIZON_SECONDS = 7 * 24 * 3600
+
+def _read_media_file(file_path: str) -> Optional[bytes]:
+    """Read a media file, or return None if it no longer exists"""
+    try:
+        return Path(file_path).read_bytes()
+    except FileNotFoundError:
+        return None
+
 class PostScheduler:
+    # Shared instance used by the application and by handlers without context access
+    _instance = None
+    
+    @classmethod
+    def instance(cls) -> 'PostScheduler':
+        """Return the shared scheduler, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
     def __init__(self):
-        self.scheduler = AsyncIOScheduler(timezone=get_kyiv_timezone())
+        self.scheduler = AsyncIOScheduler(timezone=KYIV_TZ)
         
         # Create HTTP request with improved connection pooling
         request = HTTPXRequest(
-            connection_pool_size=50,   # Increased for heavy file posting
-            pool_timeout=120.0,        # Extended timeout for large files
+            connection_pool_size=SCHEDULER_CONNECTION_POOL_SIZE,  # Increased for heavy file posting
+            pool_timeout=SCHEDULER_POOL_TIMEOUT,                  # Extended timeout for large files
             read_timeout=600.0,        # 10 minutes for large file uploads
             write_timeout=600.0,       # 10 minutes for large file uploads 
             connect_timeout=60.0       # 1 minute connection timeout
@@ -36,6 +78,27 @@ class PostScheduler:
         
         self.bot = Bot(token=BOT_TOKEN, request=request)
         
+        # Bot method and its file parameter for each stored media type
+        self._media_senders = {
+            'photo': (self.bot.send_photo, 'photo'),
+            'video': (self.bot.send_video, 'video'),
+            'audio': (self.bot.send_audio, 'audio'),
+            'animation': (self.bot.send_animation, 'animation'),
+            # Sent as documents to keep the original quality and file size
+            'document': (self.bot.send_document, 'document'),
+            'document_image': (self.bot.send_document, 'document'),
+            'document_video': (self.bot.send_document, 'document'),
+        }
+        
+        # Event loop time at which each channel may receive its next post
+        self._next_send_at = {}
+        # Event loop time at which any channel may receive the next post
+        self._next_overall_send_at = 0.0
+        
+        # Loop timers of posts due soon, and the posting tasks they have started
+        self._timers: Dict[int, asyncio.TimerHandle] = {}
+        self._post_tasks = set()
+        
     def start(self):
         """Start the scheduler"""
         self.scheduler.start()
@@ -50,7 +113,7 @@ class PostScheduler:
             'cron',
             hour=3,
             minute=0,
-            timezone=get_kyiv_timezone(),
+            timezone=KYIV_TZ,
             id='daily_cleanup'
         )
         logger.info("Scheduled daily media cleanup at 3:00 AM Kyiv time")
@@ -60,7 +123,7 @@ class PostScheduler:
             self._check_and_send_reminders,
             'interval',
             hours=1,
-            timezone=get_kyiv_timezone(),
+            timezone=KYIV_TZ,
             id='reminder_check'
         )
         logger.info("Scheduled hourly check for post reminders")
@@ -70,13 +133,16 @@ class PostScheduler:
             self._monitor_scheduled_posts,
             'interval',
             minutes=5,
-            timezone=get_kyiv_timezone(),
+            timezone=KYIV_TZ,
             id='post_monitor'
         )
         logger.info("Scheduled post monitoring every 5 minutes")
     
     def stop(self):
         """Stop the scheduler"""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
         self.scheduler.shutdown()
         logger.info("Post scheduler stopped")
     
@@ -90,78 +156,126 @@ class PostScheduler:
                 scheduled_time = post['scheduled_time']
                 if scheduled_time.tzinfo is None:
                     # Database times without timezone info are assumed to be in Kyiv timezone
-                    kyiv_tz = get_kyiv_timezone()
-                    scheduled_time = kyiv_tz.localize(scheduled_time)
+                    scheduled_time = scheduled_time.replace(tzinfo=KYIV_TZ)
                 
                 self._schedule_single_post(post['id'], scheduled_time)
     
     async def schedule_posts(self, post_ids: list, scheduled_times: list):
-        """Schedule multiple posts with delays to prevent connection pool exhaustion"""
+        """Schedule multiple posts and store their times in one transaction"""
         logger.info(f"schedule_posts called with {len(post_ids)} posts")
         
         if len(post_ids) != len(scheduled_times):
             raise ValueError("Number of posts and scheduled times must match")
         
-        conn = Database.get_connection()
-        cursor = conn.cursor()
-        
         scheduled_count = 0
-        for i, (post_id, scheduled_time) in enumerate(zip(post_ids, scheduled_times)):
+        for post_id, scheduled_time in zip(post_ids, scheduled_times):
             logger.info(f"Scheduling post {post_id} for {scheduled_time}")
             self._schedule_single_post(post_id, scheduled_time)
             
             # Verify job was created
             job_id = f"post_{post_id}"
-            if self.scheduler.get_job(job_id):
+            if self._has_post_job(post_id):
                 scheduled_count += 1
                 logger.info(f"Job {job_id} confirmed in scheduler")
             else:
                 logger.warning(f"Job {job_id} NOT found in scheduler after scheduling")
-            
-            # Update the database with the scheduled time
-            cursor.execute(
+        
+        # Adding jobs only touches the in-memory job store, so no pacing is needed;
+        # the scheduled times are written back in a single statement
+        with Database.connection() as conn:
+            conn.executemany(
                 'UPDATE posts SET scheduled_time = ? WHERE id = ?',
-                (scheduled_time.isoformat(), post_id)
+                [(scheduled_time.isoformat(), post_id)
+                 for post_id, scheduled_time in zip(post_ids, scheduled_times)]
             )
-            
-            # Add a small delay between scheduling operations to prevent overwhelming the connection pool
-            if i < len(post_ids) - 1:  # Don't wait after the last one
-                await asyncio.sleep(0.1)  # 100ms delay between scheduling operations
-        
-        conn.commit()
-        conn.close()
+            owner_ids = Database.get_post_owner_ids(conn, post_ids)
+            conn.commit()
+        db_cache.invalidate_scheduled_posts(*owner_ids)
         logger.info(f"Scheduled {len(post_ids)} posts")
     
-    def _schedule_single_post(self, post_id: int, scheduled_time: datetime):
-        """Schedule a single post with proper timezone handling"""
+    def _schedule_single_post(self, post_id: int, scheduled_time: datetime) -> bool:
+        """Schedule a single post with proper timezone handling, returning whether it was scheduled"""
         job_id = f"post_{post_id}"
         
         # Ensure scheduled_time is timezone-aware
         if scheduled_time.tzinfo is None:
             # If timezone-naive, assume it's in Kyiv timezone
-            kyiv_tz = get_kyiv_timezone()
-            scheduled_time = kyiv_tz.localize(scheduled_time)
+            scheduled_time = scheduled_time.replace(tzinfo=KYIV_TZ)
         
         # Check if the time is in the past
         current_time = get_current_kyiv_time()
         if scheduled_time <= current_time:
             logger.warning(f"Post {post_id} scheduled for past time {scheduled_time}, skipping")
-            return
+            return False
         
-        # Remove existing job if it exists
-        if self.scheduler.get_job(job_id):
-            self.scheduler.remove_job(job_id)
+        # Drop any earlier timer or job so the post only fires once
+        self._unschedule_post(post_id)
         
-        # Add new job with timezone-aware datetime
-        self.scheduler.add_job(
-            self._post_to_channel,
-            trigger=DateTrigger(run_date=scheduled_time),
-            args=[post_id],
-            id=job_id,
-            replace_existing=True
-        )
+        delay = (scheduled_time - current_time).total_seconds()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
+        if loop and delay < POST_TIMER_HORIZON_SECONDS:
+            # Near posts skip the job store; the post monitor re-adds any lost on restart
+            self._timers[post_id] = loop.call_later(delay, self._fire_post_timer, post_id)
+        else:
+            self.scheduler.add_job(
+                self._post_to_channel,
+                trigger=DateTrigger(run_date=scheduled_time),
+                args=[post_id],
+                id=job_id,
+                replace_existing=True
+            )
         
         logger.info(f"Scheduled post {post_id} for {scheduled_time}")
+        return True
+    
+    def _fire_post_timer(self, post_id: int):
+        """Start sending a post once its loop timer runs out"""
+        self._timers.pop(post_id, None)
+        task = asyncio.create_task(self._post_to_channel(post_id))
+        # The loop only keeps weak references to tasks
+        self._post_tasks.add(task)
+        task.add_done_callback(self._post_tasks.discard)
+    
+    def _unschedule_post(self, post_id: int) -> bool:
+        """Cancel a post's pending timer or job, returning whether it had one"""
+        timer = self._timers.pop(post_id, None)
+        if timer:
+            timer.cancel()
+            return True
+        
+        try:
+            self.scheduler.remove_job(f"post_{post_id}")
+            return True
+        except JobLookupError:
+            return False
+    
+    def _has_post_job(self, post_id: int) -> bool:
+        """Check whether a post is waiting on a timer or a job"""
+        return post_id in self._timers or self.scheduler.get_job(f"post_{post_id}") is not None
+    
+    async def _wait_for_channel_slot(self, channel_id: str):
+        """Space out posts to the same channel, then take a slot in the bot's overall send budget"""
+        now = asyncio.get_running_loop().time()
+        # Reserve the slot before sleeping so concurrent posts queue up behind each other
+        send_at = max(now, self._next_send_at.get(channel_id, now))
+        self._next_send_at[channel_id] = send_at + CHANNEL_SEND_INTERVAL_SECONDS
+        if send_at > now:
+            await asyncio.sleep(send_at - now)
+        
+        # Reserved only once the channel is free, so a busy channel never holds up the others
+        await self._wait_for_overall_slot()
+    
+    async def _wait_for_overall_slot(self):
+        """Keep all outgoing messages together under Telegram's per-bot rate limit"""
+        now = asyncio.get_running_loop().time()
+        send_at = max(now, self._next_overall_send_at)
+        self._next_overall_send_at = send_at + OVERALL_SEND_INTERVAL_SECONDS
+        if send_at > now:
+            await asyncio.sleep(send_at - now)
     
     async def _post_to_channel(self, post_id: int):
         """Post a single message to the channel with enhanced error handling and recovery"""
@@ -173,9 +287,6 @@ class PostScheduler:
 
         while retry_count <= max_retries:
             try:
-                # Add a small delay at the start to prevent overwhelming Telegram API
-                await asyncio.sleep(1.0)  # 1 second delay before each post
-                
                 # Get complete post details from database using new get_post_by_id method
                 post_data = Database.get_post_by_id(post_id)
                 
@@ -195,8 +306,6 @@ class PostScheduler:
                 caption_entities = None
                 if caption_entities_json:
                     try:
-                        import json
-                        from telegram import MessageEntity
                         entities_data = json.loads(caption_entities_json)
                         caption_entities = [
                             MessageEntity(
@@ -238,6 +347,7 @@ class PostScheduler:
                     return
                     
                 target_channel = channel_id
+                await self._wait_for_channel_slot(target_channel)
                 
                 # Handle album posts separately
                 if media_type == 'album' and media_bundle_json:
@@ -261,87 +371,28 @@ class PostScheduler:
                     )
                     return
                 
+                # Read the file off the event loop; the bot would otherwise read it
+                # synchronously while building the upload
+                media_bytes = await asyncio.to_thread(Path(actual_file_path).read_bytes)
+                media_file = InputFile(media_bytes, filename=os.path.basename(actual_file_path))
+                
                 # Send media to channel based on type
                 # Use caption_entities for native Telegram formatting (bold/italic from menu)
                 # No parse_mode when entities are absent to avoid HTML parsing issues with special chars like </3
-                with open(actual_file_path, 'rb') as media_file:
-                    if media_type == 'photo':
-                        logger.info(f"Post {post_id}: Sending photo with caption='{description}' to {target_channel}")
-                        await self.bot.send_photo(
-                            chat_id=target_channel,
-                            photo=media_file,
-                            caption=description,
-                            caption_entities=caption_entities
-                        )
-                    elif media_type == 'video':
-                        logger.info(f"Post {post_id}: Sending video with caption='{description}' to {target_channel}")
-                        await self.bot.send_video(
-                            chat_id=target_channel,
-                            video=media_file,
-                            caption=description,
-                            caption_entities=caption_entities
-                        )
-                    elif media_type == 'audio':
-                        await self.bot.send_audio(
-                            chat_id=target_channel,
-                            audio=media_file,
-                            caption=description,
-                            caption_entities=caption_entities
-                        )
-                    elif media_type == 'animation':
-                        await self.bot.send_animation(
-                            chat_id=target_channel,
-                            animation=media_file,
-                            caption=description,
-                            caption_entities=caption_entities
-                        )
-                    elif media_type in ['document', 'document_image', 'document_video']:
-                        # Send as document to preserve original quality and file size
-                        logger.info(f"Post {post_id}: Sending document with caption='{description}' to {target_channel}")
-                        await self.bot.send_document(
-                            chat_id=target_channel,
-                            document=media_file,
-                            caption=description,
-                            caption_entities=caption_entities
-                        )
-                    else:
-                        # Default to document for unknown types (preserves quality)
-                        await self.bot.send_document(
-                            chat_id=target_channel,
-                            document=media_file,
-                            caption=description,
-                            caption_entities=caption_entities
-                        )
-                
-                # Check if this is a recurring post by querying the specific post
-                conn = Database.get_connection()
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT is_recurring, recurring_interval_hours, recurring_end_date, 
-                           recurring_count, recurring_posted_count
-                    FROM posts 
-                    WHERE id = ?
-                ''', (post_id,))
-                
-                recurring_row = cursor.fetchone()
-                conn.close()
+                # Unknown types go out as documents to preserve quality
+                send_media, media_param = self._media_senders.get(media_type, self._media_senders['document'])
+                logger.info(f"Post {post_id}: Sending {media_type} with caption='{description}' to {target_channel}")
+                await send_media(
+                    chat_id=target_channel,
+                    caption=description,
+                    caption_entities=caption_entities,
+                    **{media_param: media_file}
+                )
                 
-                if recurring_row and recurring_row[0]:  # is_recurring is True
-                    is_recurring, interval_hours, end_date, total_count, posted_count = recurring_row
-                    current_post = {
-                        'id': post_id,
-                        'is_recurring': is_recurring,
-                        'recurring_interval_hours': interval_hours,
-                        'recurring_end_date': end_date,
-                        'recurring_count': total_count,
-                        'recurring_posted_count': posted_count,
-                        'user_id': user_id,
-                        'file_path': file_path,
-                        'media_type': media_type,
-                        'description': description,
-                        'channel_id': channel_id
-                    }
-                    await self._handle_recurring_post(current_post)
+                # The recurring settings came with the post row read above
+                is_recurring = post_data['is_recurring']
+                if is_recurring:
+                    await self._handle_recurring_post(post_data)
                 else:
                     # Mark as posted for non-recurring posts
                     try:
@@ -365,7 +416,7 @@ class PostScheduler:
                 
                 # Notify user
                 try:
-                    recurring_text = " (recurring)" if recurring_row and recurring_row[0] else ""
+                    recurring_text = " (recurring)" if is_recurring else ""
                     await self.bot.send_message(
                         chat_id=user_id,
                         text=f"✅ Post #{post_id} has been successfully published to the channel!{recurring_text}"
@@ -418,21 +469,21 @@ class PostScheduler:
                     Database.mark_post_as_failed(post_id, f"Unexpected error: {e}")
                     break
     
+    def _remove_post_jobs(self, post_ids):
+        """Remove the timers or jobs of the given posts, skipping posts that have none"""
+        for post_id in post_ids:
+            self._unschedule_post(post_id)
+    
     def cancel_user_posts(self, user_id: int):
         """Cancel all scheduled posts for a user"""
-        pending_posts = Database.get_pending_posts(user_id)
-        
-        for post in pending_posts:
-            job_id = f"post_{post['id']}"
-            if self.scheduler.get_job(job_id):
-                self.scheduler.remove_job(job_id)
+        self._remove_post_jobs(Database.get_pending_post_ids(user_id))
         
         Database.clear_user_posts(user_id)
         logger.info(f"Cancelled all posts for user {user_id}")
     
     def get_scheduled_jobs_count(self) -> int:
-        """Get number of scheduled jobs"""
-        return len(self.scheduler.get_jobs())
+        """Get number of scheduled jobs, counting post timers"""
+        return len(self.scheduler.get_jobs()) + len(self._timers)
     
     async def _daily_cleanup(self):
         """Perform daily cleanup of old media files"""
@@ -455,63 +506,39 @@ class PostScheduler:
         try:
             logger.info("Running scheduled post monitoring...")
             
-            # Get posts that should have been posted but weren't
-            overdue_posts = []
+            # One scan of pending posts finds both overdue ones and ones missing a job
+            current_time = get_current_kyiv_time()
             try:
-                # Get all users and check their overdue posts
-                conn = Database.get_connection()
-                cursor = conn.cursor()
-                cursor.execute('SELECT DISTINCT user_id FROM posts WHERE status = "pending" AND scheduled_time IS NOT NULL')
-                user_ids = [row[0] for row in cursor.fetchall()]
-                conn.close()
-                
-                for user_id in user_ids:
-                    user_overdue = Database.get_overdue_posts(user_id)
-                    overdue_posts.extend(user_overdue)
+                pending_posts = Database.get_pending_post_schedules()
             except Exception as e:
-                logger.error(f"Error fetching overdue posts: {e}")
-                
-            # Also check for posts that have jobs but weren't detected as overdue
-            job_posts = set()
-            for job in self.scheduler.get_jobs():
-                if job.id.startswith('post_'):
-                    try:
-                        # Extract the part after 'post_' and ensure it's a valid integer
-                        post_id_str = job.id.replace('post_', '')
-                        # Only process if it's actually a number (skip system jobs like 'post_monitor')
-                        if post_id_str.isdigit():
-                            post_id = int(post_id_str)
-                            job_posts.add(post_id)
-                    except ValueError:
-                        # Skip invalid job IDs (like 'post_monitor', 'post_cleanup', etc.)
-                        continue
+                logger.error(f"Error fetching pending posts: {e}")
+                pending_posts = []
             
-            # Get all pending posts that should have active jobs
-            conn = Database.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT id, scheduled_time FROM posts 
-                WHERE status = 'pending' AND scheduled_time IS NOT NULL
-            ''')
-            pending_posts_with_times = cursor.fetchall()
-            conn.close()
+            # Split into posts that should have been posted but weren't, and upcoming ones
+            overdue_posts = []
+            future_posts = []
+            for post in pending_posts:
+                if post['scheduled_time'] is None:
+                    continue  # Unparseable time
+                if post['scheduled_time'] <= current_time:
+                    overdue_posts.append(post)
+                else:
+                    future_posts.append(post)
+                
+            # Also check for posts that have jobs but weren't detected as overdue;
+            # system jobs like 'post_monitor' don't match the pattern
+            job_posts = {int(match.group(1)) for job in self.scheduler.get_jobs()
+                         if (match := _POST_JOB_ID_RE.match(job.id))}
+            job_posts.update(self._timers)
             
-            for post_id, scheduled_time_str in pending_posts_with_times:
-                if post_id not in job_posts and scheduled_time_str:
-                    # Post has a scheduled time but no active job - reschedule it
-                    try:
-                        scheduled_time = datetime.fromisoformat(scheduled_time_str)
-                        if scheduled_time.tzinfo is None:
-                            kyiv_tz = get_kyiv_timezone()
-                            scheduled_time = kyiv_tz.localize(scheduled_time)
-                        
-                        # Only reschedule if it's in the future
-                        current_time = get_current_kyiv_time()
-                        if scheduled_time > current_time:
-                            self._schedule_single_post(post_id, scheduled_time)
-                            logger.info(f"Rescheduled missing job for post {post_id}")
-                    except Exception as e:
-                        logger.error(f"Error rescheduling post {post_id}: {e}")
+            # Only future posts without an active job are rescheduled here
+            missing_posts = [post for post in future_posts if post['id'] not in job_posts]
+            for post in missing_posts:
+                try:
+                    self._schedule_single_post(post['id'], post['scheduled_time'])
+                    logger.info(f"Rescheduled missing job for post {post['id']}")
+                except Exception as e:
+                    logger.error(f"Error rescheduling post {post['id']}: {e}")
             
             if overdue_posts:
                 logger.warning(f"Found {len(overdue_posts)} overdue posts")
@@ -519,13 +546,9 @@ class PostScheduler:
                 for post in overdue_posts:
                     post_id = post['id']
                     user_id = post['user_id']
-                    scheduled_time = post['scheduled_time']
-                    
-                    # Check if job exists in scheduler
-                    job_id = f"post_{post_id}"
-                    job = self.scheduler.get_job(job_id)
                     
-                    if not job:
+                    # Check if a timer or job exists for the post
+                    if not self._has_post_job(post_id):
                         # Check how many times this post has already been rescheduled
                         current_retry = Database.increment_retry_count(post_id)
                         max_monitor_reschedules = 5
@@ -585,7 +608,7 @@ class PostScheduler:
                 self.scheduler.start()
             
             # Log monitoring stats
-            job_count = len(self.scheduler.get_jobs())
+            job_count = self.get_scheduled_jobs_count()
             logger.info(f"Post monitor completed. Active jobs: {job_count}, Overdue posts: {len(overdue_posts)}")
             
         except Exception as e:
@@ -596,39 +619,46 @@ class PostScheduler:
         try:
             logger.info("Checking for users who need post reminders...")
             
-            # Get users who need reminders
+            # Get users who need reminders, with their thresholds for context
             users_to_remind = Database.get_users_for_reminders()
+            semaphore = asyncio.Semaphore(REMINDER_SEND_CONCURRENCY)
             
-            for user_id, post_count in users_to_remind:
-                try:
-                    # Get reminder settings for context
-                    enabled, threshold, _ = Database.get_reminder_settings(user_id)
-                    
-                    # Send reminder message
-                    message = (
-                        f"⚠️ *Low Post Alert!*\n\n"
-                        f"You currently have only *{post_count}* unscheduled posts remaining.\n\n"
-                        f"Your reminder threshold is set to {threshold} posts.\n"
-                        f"Consider uploading more content to maintain consistent posting!\n\n"
-                        f"Use /mode1 or /mode2 to upload new posts.\n"
-                        f"Use /settings to adjust reminder preferences."
-                    )
-                    
-                    await self.bot.send_message(
-                        chat_id=user_id,
-                        text=message,
-                        parse_mode='Markdown'
-                    )
-                    
-                    # Update last reminder sent
-                    Database.update_last_reminder_sent(user_id)
-                    logger.info(f"Sent reminder to user {user_id} (posts: {post_count})")
-                    
-                except Exception as e:
-                    logger.error(f"Error sending reminder to user {user_id}: {e}")
+            async def send_reminder(user_id: int, post_count: int, threshold: int) -> bool:
+                async with semaphore:
+                    try:
+                        # Send reminder message
+                        message = (
+                            f"⚠️ *Low Post Alert!*\n\n"
+                            f"You currently have only *{post_count}* unscheduled posts remaining.\n\n"
+                            f"Your reminder threshold is set to {threshold} posts.\n"
+                            f"Consider uploading more content to maintain consistent posting!\n\n"
+                            f"Use /mode1 or /mode2 to upload new posts.\n"
+                            f"Use /settings to adjust reminder preferences."
+                        )
+                        
+                        await self._wait_for_overall_slot()
+                        await self.bot.send_message(
+                            chat_id=user_id,
+                            text=message,
+                            parse_mode='Markdown'
+                        )
+                        logger.info(f"Sent reminder to user {user_id} (posts: {post_count})")
+                        return True
+                        
+                    except Exception as e:
+                        logger.error(f"Error sending reminder to user {user_id}: {e}")
+                        return False
+            
+            results = await asyncio.gather(*[send_reminder(*user) for user in users_to_remind])
+            
+            # Stamp every successful reminder in one write
+            Database.update_last_reminder_sent_bulk(
+                [user[0] for user, sent in zip(users_to_remind, results) if sent]
+            )
             
             if users_to_remind:
-                logger.info(f"Sent reminders to {len(users_to_remind)} users")
+                sent_count = sum(results)
+                logger.info(f"Sent reminders to {sent_count} users ({len(users_to_remind) - sent_count} failed)")
             else:
                 logger.info("No users need reminders at this time")
                 
@@ -638,9 +668,7 @@ class PostScheduler:
     async def _handle_recurring_post(self, post):
         """Handle recurring post logic after successful posting"""
         post_id = post['id']
-        
-        # Increment the posted count
-        Database.increment_recurring_post_count(post_id)
+        now = get_current_kyiv_time()
         
         # Check if we should schedule the next occurrence
         should_continue = True
@@ -649,59 +677,35 @@ class PostScheduler:
         if post['recurring_count'] and post['recurring_posted_count'] + 1 >= post['recurring_count']:
             should_continue = False
         
-        # Check end date - parse string dates properly
+        # Check end date; get_post_by_id already parsed it into an aware datetime
         recurring_end_date = post['recurring_end_date']
-        if recurring_end_date:
-            # Handle string dates from database
-            if isinstance(recurring_end_date, str):
-                try:
-                    recurring_end_date = datetime.fromisoformat(recurring_end_date)
-                    if recurring_end_date.tzinfo is None:
-                        recurring_end_date = get_kyiv_timezone().localize(recurring_end_date)
-                except (ValueError, TypeError):
-                    logger.warning(f"Could not parse recurring_end_date: {recurring_end_date}")
-                    recurring_end_date = None
-            
-            if recurring_end_date and get_current_kyiv_time() >= recurring_end_date:
-                should_continue = False
+        if recurring_end_date and now >= recurring_end_date:
+            should_continue = False
         
         if should_continue and post['recurring_interval_hours']:
             # Schedule next occurrence
-            next_time = get_current_kyiv_time() + timedelta(hours=post['recurring_interval_hours'])
+            next_time = now + timedelta(hours=post['recurring_interval_hours'])
             
-            # Update the scheduled_time in database for the next occurrence
-            Database.update_post_schedule(post_id, next_time)
+            # Count this occurrence and store the next one in the same write
+            Database.finalize_recurring_post(post_id, next_time)
             
-            # Create new job for next occurrence
-            job_id = f"post_{post_id}"
-            self.scheduler.add_job(
-                self._post_to_channel,
-                'date',
-                run_date=next_time,
-                args=[post_id],
-                id=job_id,
-                replace_existing=True
-            )
+            # Create new timer or job for next occurrence
+            self._schedule_single_post(post_id, next_time)
             
             logger.info(f"Scheduled next recurring post {post_id} for {next_time}")
         else:
-            # Mark as completed
-            Database.mark_post_as_posted(post_id)
+            # Count this occurrence and mark the series as completed
+            Database.finalize_recurring_post(post_id)
             logger.info(f"Recurring post {post_id} completed")
 
     async def _post_album_to_channel(self, post_id: int, media_bundle_json: str, description: str, 
                                    target_channel: str, user_id: int):
         """Post an album (multiple media) to channel using sendMediaGroup"""
-        open_files = []  # Track open file handles
-        
         try:
-            import json
-            from telegram import InputMediaPhoto, InputMediaVideo
-            
             # Parse media bundle
             media_bundle = json.loads(media_bundle_json)
             
-            if not media_bundle or len(media_bundle) == 0:
+            if not media_bundle:
                 logger.error(f"Empty media bundle for album post {post_id}")
                 Database.mark_post_as_failed(post_id, "Empty media bundle")
                 return
@@ -711,42 +715,27 @@ class PostScheduler:
                 Database.mark_post_as_failed(post_id, "Album too large (>10 items)")
                 return
             
-            # Prepare media group for Telegram
-            media_group = []
-            missing_files = []
+            # Pick the album items Telegram accepts in a media group
+            album_items = []
             
-            for i, media_item in enumerate(media_bundle):
+            for media_item in media_bundle:
                 file_path = media_item['file_path']
                 media_type = media_item['media_type']
                 
-                # Check if file exists
-                if not os.path.exists(file_path):
-                    missing_files.append(file_path)
-                    continue
-                
-                # Open file and keep it open until after send_media_group
-                f = open(actual_file_path, 'rb')
-                open_files.append(f)
-                
                 # Determine InputMedia type for Telegram
-                # No parse_mode to avoid HTML parsing issues with special chars like </3
                 if media_type in ['photo', 'document_image']:
-                    media_obj = InputMediaPhoto(
-                        media=f,
-                        caption=description if i == 0 else None  # Caption only on first item
-                    )
+                    album_items.append((InputMediaPhoto, file_path))
                 elif media_type in ['video', 'document_video']:
-                    media_obj = InputMediaVideo(
-                        media=f,
-                        caption=description if i == 0 else None  # Caption only on first item
-                    )
+                    album_items.append((InputMediaVideo, file_path))
                 else:
                     logger.warning(f"Unsupported media type for album: {media_type}, skipping")
-                    f.close()  # Close the file since we're not using it
-                    open_files.pop()  # Remove from tracking
-                    continue
-                
-                media_group.append(media_obj)
+            
+            # Read all album files in parallel, off the event loop; a missing file reads as None
+            album_bytes = await asyncio.gather(*[
+                asyncio.to_thread(_read_media_file, file_path) for _, file_path in album_items
+            ])
+            missing_files = [file_path for (_, file_path), media_bytes in zip(album_items, album_bytes)
+                             if media_bytes is None]
             
             # Check for missing files
             if missing_files:
@@ -759,6 +748,15 @@ class PostScheduler:
                 )
                 return
             
+            # No parse_mode to avoid HTML parsing issues with special chars like </3
+            media_group = [
+                media_class(
+                    media=InputFile(media_bytes, filename=os.path.basename(file_path)),
+                    caption=description if i == 0 else None  # Caption only on first item
+                )
+                for i, ((media_class, file_path), media_bytes) in enumerate(zip(album_items, album_bytes))
+            ]
+            
             # Check if we have any valid media
             if not media_group:
                 logger.error(f"No valid media found for album post {post_id}")
@@ -782,7 +780,6 @@ class PostScheduler:
             Database.mark_post_as_posted(post_id)
             
             # Set cleanup date for media files (7 days from now)
-            from datetime import datetime, timedelta
             cleanup_date = datetime.now() + timedelta(days=7)
             if hasattr(Database, 'set_post_cleanup_date'):
                 Database.set_post_cleanup_date(post_id, cleanup_date)
@@ -796,20 +793,11 @@ class PostScheduler:
                 chat_id=user_id,
                 text=f"❌ Album post #{post_id} failed: {str(e)}"
             )
-        finally:
-            # Always close all opened files
-            for f in open_files:
-                try:
-                    f.close()
-                except Exception as e:
-                    logger.warning(f"Error closing file {f.name}: {e}")
 
     async def cancel_post_job(self, post_id: int):
         """Cancel a scheduled job for a specific post"""
-        job_id = f"post_{post_id}"
         try:
-            if self.scheduler.get_job(job_id):
-                self.scheduler.remove_job(job_id)
+            if self._unschedule_post(post_id):
                 logger.info(f"Cancelled job for post {post_id}")
             else:
                 logger.debug(f"No job found to cancel for post {post_id}")
@@ -825,6 +813,24 @@ class PostScheduler:
             logger.error(f"Error scheduling single post {post_id}: {e}")
             raise
 
+    async def reschedule_posts(self, updates: List[Tuple[int, datetime]]) -> int:
+        """Move the jobs of many posts to new times in one pass, returning how many are scheduled"""
+        scheduled_count = 0
+        for post_id, scheduled_time in updates:
+            try:
+                # Replaces the post's current timer or job, whichever it has
+                if self._schedule_single_post(post_id, scheduled_time):
+                    scheduled_count += 1
+                else:
+                    # The new time is already past: drop the old timer or job so it cannot
+                    # fire at the old time; the post monitor sends it as an overdue post
+                    self._unschedule_post(post_id)
+            except Exception as e:
+                logger.error(f"Error rescheduling job for post {post_id}: {e}")
+        
+        logger.info(f"Rescheduled {scheduled_count} of {len(updates)} post jobs")
+        return scheduled_count
+
     async def _handle_post_failure(self, post_id: int, user_id: int, failure_reason: str):
         """Handle post failure with retry logic"""
         retry_count = Database.increment_retry_count(post_id)
@@ -906,7 +912,6 @@ class PostScheduler:
         # Rate limiting errors
         if 'too many requests' in error_msg or 'retry after' in error_msg:
             # Extract wait time from error message if available
-            import re
             match = re.search(r'retry after (\d+)', error_msg)
             wait_time = int(match.group(1)) if match else 30
             
@@ -1089,11 +1094,7 @@ The post has been marked for manual review.
         """Reschedule all pending posts starting from today with custom hours"""
         try:
             # Cancel existing scheduled jobs first
-            pending_posts = Database.get_pending_posts(user_id, channel_id)
-            for post in pending_posts:
-                job_id = f"post_{post['id']}"
-                if self.scheduler.get_job(job_id):
-                    self.scheduler.remove_job(job_id)
+            self._remove_post_jobs(Database.get_pending_post_ids(user_id, channel_id))
             
             # Reschedule in database
             rescheduled_count = Database.reschedule_all_posts_from_today(user_id, start_hour, end_hour, interval_hours, channel_id)
@@ -0,0 +1,173 @@
+"""
+In-memory user session store with periodic write-behind to the database
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+from .database import Database
+
+logger = logging.getLogger(__name__)
+
+# How often dirty sessions are written back to the user_sessions table
+FLUSH_INTERVAL_SECONDS = 1.0
+
+# Most recently used sessions kept in memory; older ones are re-read on demand
+MAX_CACHED_SESSIONS = 10_000
+
+
+class SessionStore:
+    """Keeps user sessions in memory and writes changed ones back in batches.
+
+    Until the flush loop is running every update is written through directly,
+    so code paths that run outside the bot (scripts, recovery tools) never
+    leave sessions unsaved.
+    """
+
+    def __init__(self):
+        # Session data is kept serialized so callers always get a fresh dict,
+        # exactly as they did when every read went to the database
+        self._sessions: "OrderedDict[int, Tuple[str, Optional[str]]]" = OrderedDict()
+        self._dirty: Set[int] = set()
+        # Handlers reach the store both from the event loop and from worker threads
+        self._lock = threading.Lock()
+        # Held only around database writes, never by get/set
+        self._flush_lock = threading.Lock()
+        self._write_behind = False
+
+    def _evict(self):
+        """Drop least recently used sessions beyond the size limit; caller holds the lock"""
+        excess = len(self._sessions) - MAX_CACHED_SESSIONS
+        if excess <= 0:
+            return
+        # Walk from the least recently used end and stop once enough are found;
+        # unflushed sessions must stay until they have been written
+        victims = []
+        for user_id in self._sessions:
+            if user_id not in self._dirty:
+                victims.append(user_id)
+                if len(victims) == excess:
+                    break
+        for user_id in victims:
+            del self._sessions[user_id]
+
+    def warm(self):
+        """Load the most recently active sessions into memory"""
+        conn = Database.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT user_id, current_mode, session_data
+            FROM user_sessions
+            ORDER BY updated_at DESC
+            LIMIT ?
+        ''', (MAX_CACHED_SESSIONS,))
+        rows = cursor.fetchall()
+        conn.close()
+
+        with self._lock:
+            # Oldest first so the most recent end up at the fresh end of the LRU order
+            for user_id, mode, session_json in reversed(rows):
+                if user_id not in self._dirty:
+                    self._sessions[user_id] = (mode, session_json)
+            self._evict()
+
+        logger.info(f"Loaded {len(rows)} user sessions into memory")
+
+    def get(self, user_id: int) -> Tuple[str, Dict]:
+        """Get user session state, reading the database only on a cache miss"""
+        with self._lock:
+            entry = self._sessions.get(user_id)
+            if entry is not None:
+                self._sessions.move_to_end(user_id)
+
+        if entry is None:
+            conn = Database.get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                SELECT current_mode, session_data
+                FROM user_sessions
+                WHERE user_id = ?
+            ''', (user_id,))
+
+            row = cursor.fetchone()
+            conn.close()
+
+            if not row:
+                return 'idle', {}
+
+            entry = (row[0], row[1])
+            with self._lock:
+                # An update may have landed while we were reading
+                entry = self._sessions.setdefault(user_id, entry)
+                self._evict()
+
+        mode, session_json = entry
+        return mode, json.loads(session_json) if session_json else {}
+
+    def set(self, user_id: int, mode: str, session_data: Optional[Dict] = None):
+        """Update user session state, deferring the database write when possible"""
+        session_json = json.dumps(session_data) if session_data else None
+
+        with self._lock:
+            self._sessions[user_id] = (mode, session_json)
+            self._sessions.move_to_end(user_id)
+            if self._write_behind:
+                self._dirty.add(user_id)
+                self._evict()
+                return
+            self._evict()
+
+        Database.write_user_sessions([(user_id, mode, session_json)])
+
+    def discard(self, user_id: int):
+        """Forget a user's session, e.g. before their stored data is deleted"""
+        # Wait out an in-flight flush so it cannot write the session back afterwards
+        with self._flush_lock, self._lock:
+            self._sessions.pop(user_id, None)
+            self._dirty.discard(user_id)
+
+    def flush(self):
+        """Write all changed sessions back to the database in one transaction"""
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                snapshot = {user_id: self._sessions[user_id] for user_id in self._dirty
+                            if user_id in self._sessions}
+            
+            # Written outside the lock so get/set never wait on sqlite;
+            # on failure the entries stay dirty and are retried next time
+            Database.write_user_sessions([(user_id, *entry) for user_id, entry in snapshot.items()])
+            
+            with self._lock:
+                # Sessions updated during the write hold a new entry and stay dirty
+                for user_id, entry in snapshot.items():
+                    if self._sessions.get(user_id) is entry:
+                        self._dirty.discard(user_id)
+                self._evict()
+
+    async def run_flush_loop(self):
+        """Flush dirty sessions periodically until cancelled, then flush once more"""
+        with self._lock:
+            self._write_behind = True
+
+        try:
+            while True:
+                await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+                try:
+                    await asyncio.to_thread(self.flush)
+                except Exception as e:
+                    logger.error(f"Failed to flush user sessions: {e}")
+        finally:
+            with self._lock:
+                self._write_behind = False
+            self.flush()
+
+
+session_store = SessionStore()
@@ -5,19 +5,22 @@ Utility functions for the bot
 import os
 import uuid
 import logging
-from datetime import datetime, timedelta
-import pytz
+from datetime import date, datetime, timedelta
 import calendar
-from typing import List, Tuple, Dict, Optional
+from zoneinfo import ZoneInfo
+from typing import List, Tuple, Dict, Optional, Union
 from PIL import Image
 from config import UPLOADS_DIR, TIMEZONE, MAX_FILE_SIZE
 import aiofiles
 
 logger = logging.getLogger(__name__)
 
+# The zone never changes at runtime, so it is resolved once
+_KYIV_TZ = ZoneInfo(TIMEZONE)
+
 def get_kyiv_timezone():
     """Get Kyiv timezone object"""
-    return pytz.timezone(TIMEZONE)
+    return _KYIV_TZ
 
 def get_current_kyiv_time():
     """Get current time in Kyiv timezone"""
@@ -154,8 +157,11 @@ async def save_media_streaming(telegram_file, filename: str, media_type: str = '
             os.remove(file_path)
         raise ValueError(f"Could not download file: {e}")
 
-def save_media(file_data: bytes, filename: str, media_type: str = 'photo', user_id: int = None) -> str:
-    """Save media data to the uploads directory with optimized heavy file handling (fallback method)"""
+def save_media(file_data: Union[bytes, bytearray], filename: str, media_type: str = 'photo', user_id: int = None) -> str:
+    """Save media data to the uploads directory with optimized heavy file handling (fallback method)
+    
+    Accepts the bytearray from download_as_bytearray directly, so callers need not copy it into bytes.
+    """
     # Log file size for monitoring (but don't restrict)
     file_size_mb = len(file_data) / (1024 * 1024)
     logger.info(f"Processing {media_type} file: {file_size_mb:.2f} MB")
@@ -172,13 +178,11 @@ def save_media(file_data: bytes, filename: str, media_type: str = 'photo', user_
     # Use buffered writing for large files to prevent memory issues
     try:
         with open(file_path, 'wb') as f:
-            # Write in chunks for memory efficiency with large files
+            # Write in chunks through a memoryview so slicing does not copy the data
             chunk_size = 64 * 1024  # 64KB chunks
-            if len(file_data) > chunk_size:
-                for i in range(0, len(file_data), chunk_size):
-                    f.write(file_data[i:i + chunk_size])
-            else:
-                f.write(file_data)
+            view = memoryview(file_data)
+            for i in range(0, len(view), chunk_size):
+                f.write(view[i:i + chunk_size])
     except IOError as e:
         logger.error(f"Failed to save {media_type} file {filename}: {e}")
         raise ValueError(f"Could not save file: {e}")
@@ -244,7 +248,7 @@ def calculate_schedule_times(start_hour: int, end_hour: int, interval_hours: int
     
     # Ensure start_date is timezone-aware
     if start_date.tzinfo is None:
-        start_date = kyiv_tz.localize(start_date)
+        start_date = start_date.replace(tzinfo=kyiv_tz)
     
     schedule_times = []
     current_time = start_date.replace(hour=start_hour, minute=0, second=0, microsecond=0)
@@ -348,7 +352,7 @@ def parse_date_input(text: str) -> Tuple[bool, Optional[datetime], int, str]:
         
         # Create datetime in Kyiv timezone
         kyiv_tz = get_kyiv_timezone()
-        start_datetime = kyiv_tz.localize(datetime(year, month, day, hour, minute))
+        start_datetime = datetime(year, month, day, hour, minute, tzinfo=kyiv_tz)
         
         # Check if date is in the past
         current_time = get_current_kyiv_time()
@@ -492,7 +496,7 @@ def parse_bulk_edit_input(text: str) -> Tuple[bool, int, int, int, str, Optional
                     date_str = parts[3]
                     try:
                         start_date = datetime.strptime(date_str, '%Y-%m-%d')
-                        start_date = get_kyiv_timezone().localize(start_date)
+                        start_date = start_date.replace(tzinfo=get_kyiv_timezone())
                         
                         # Check if date is not in the past
                         current_kyiv = get_current_kyiv_time().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -507,7 +511,7 @@ def parse_bulk_edit_input(text: str) -> Tuple[bool, int, int, int, str, Optional
                 try:
                     date_str = parts[2]
                     start_date = datetime.strptime(date_str, '%Y-%m-%d')
-                    start_date = get_kyiv_timezone().localize(start_date)
+                    start_date = start_date.replace(tzinfo=get_kyiv_timezone())
                     interval_hours = None  # Auto-calculate
                     
                     # Check if date is not in the past
@@ -603,20 +607,21 @@ def cleanup_old_files(days_old: int = 7):
                 except Exception as e:
                     logger.error(f"Failed to remove old file {file_path}: {e}")
 
+_MEDIA_TYPE_ICONS = {
+    'photo': '📸',
+    'video': '🎥',
+    'audio': '🎵',
+    'animation': '🎬',
+    'document': '📄',
+    'document_image': '🖼️',  # Uncompressed image
+    'document_video': '🎬'   # Uncompressed video
+}
+
 def get_media_icon(media_type: str) -> str:
     """Get emoji icon for media type"""
-    icons = {
-        'photo': '📸',
-        'video': '🎥',
-        'audio': '🎵',
-        'animation': '🎬',
-        'document': '📄',
-        'document_image': '🖼️',  # Uncompressed image
-        'document_video': '🎬'   # Uncompressed video
-    }
-    return icons.get(media_type, '📎')
+    return _MEDIA_TYPE_ICONS.get(media_type, '📎')
 
-def generate_mini_calendar(year: int, month: int, posts_by_date: Dict[str, List[Dict]]) -> str:
+def generate_mini_calendar(year: int, month: int, day_counts: Dict[date, int]) -> str:
     """Generate a mini-calendar view with scheduled posts indicators"""
     cal = calendar.monthcalendar(year, month)
     month_name = calendar.month_name[month]
@@ -633,9 +638,8 @@ def generate_mini_calendar(year: int, month: int, posts_by_date: Dict[str, List[
             if day == 0:
                 week_str += "   "
             else:
-                date_key = f"{year:04d}-{month:02d}-{day:02d}"
-                if date_key in posts_by_date:
-                    count = len(posts_by_date[date_key])
+                count = day_counts.get(date(year, month, day))
+                if count:
                     if count > 9:
                         week_str += "9+ "
                     else:
@@ -670,7 +674,7 @@ def format_daily_schedule(date_str: str, posts: List[Dict]) -> str:
     date_obj = datetime.strptime(date_str, '%Y-%m-%d')
     formatted_date = date_obj.strftime('%B %d, %Y')
     
-    schedule_str = f"📅 *{formatted_date}*\n\n"
+    parts = [f"📅 *{formatted_date}*\n\n"]
     
     # Group posts by time
     posts_by_time = {}
@@ -683,7 +687,7 @@ def format_daily_schedule(date_str: str, posts: List[Dict]) -> str:
     # Display posts ordered by time
     for time_key in sorted(posts_by_time.keys()):
         time_posts = posts_by_time[time_key]
-        schedule_str += f"🕐 *{time_key}*\n"
+        parts.append(f"🕐 *{time_key}*\n")
         
         for post in time_posts:
             icon = get_media_icon(post['media_type'])
@@ -699,11 +703,12 @@ def format_daily_schedule(date_str: str, posts: List[Dict]) -> str:
                 desc_preview = escape_markdown(desc_preview)
                 desc_preview = f" - {desc_preview}"
             
-            schedule_str += f"  {icon} {recurring_icon}→ {channel_name}{desc_preview}\n"
+            parts.append(f"  {icon} {recurring_icon}→ {channel_name}{desc_preview}\n")
         
-        schedule_str += "\n"
+        parts.append("\n")
     
-    return schedule_str
+    # Collect pieces and join once; busy days would otherwise re-copy the string per post
+    return "".join(parts)
 
 def get_calendar_navigation_dates(current_date: datetime) -> Tuple[datetime, datetime]:
     """Get previous and next month dates for navigation"""
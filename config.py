@@ -15,6 +15,12 @@ DATA_DIR = os.getenv("DATA_DIR", "/data")
 DATABASE_PATH = os.path.join(DATA_DIR, "bot_data.db")
 UPLOADS_DIR = os.path.join(DATA_DIR, "uploads")
 
+# HTTP connection pools: handler traffic and scheduled posts each get their own
+BOT_CONNECTION_POOL_SIZE = int(os.getenv("BOT_CONNECTION_POOL_SIZE", "256"))
+BOT_POOL_TIMEOUT = float(os.getenv("BOT_POOL_TIMEOUT", "120"))
+SCHEDULER_CONNECTION_POOL_SIZE = int(os.getenv("SCHEDULER_CONNECTION_POOL_SIZE", "50"))
+SCHEDULER_POOL_TIMEOUT = float(os.getenv("SCHEDULER_POOL_TIMEOUT", "120"))
+
 # Timezone settings
 TIMEZONE = "Europe/Kiev"  # Kyiv timezone
 
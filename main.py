@@ -21,8 +21,9 @@ from bot.handlers import (
     edit_captions_handler, editposts_handler
 )
 from bot.database import init_database
+from bot.session_store import session_store
 from bot.scheduler import PostScheduler
-from config import BOT_TOKEN, DATABASE_PATH, UPLOADS_DIR
+from config import BOT_TOKEN, DATABASE_PATH, UPLOADS_DIR, BOT_CONNECTION_POOL_SIZE, BOT_POOL_TIMEOUT
 
 # Configure logging
 logging.basicConfig(
@@ -38,10 +39,24 @@ logger = logging.getLogger(__name__)
 
 async def post_init(application):
     """Initialize scheduler after the application starts"""
-    scheduler = PostScheduler()
+    scheduler = PostScheduler.instance()
     scheduler.start()
     # Store scheduler in application context
     application.bot_data['scheduler'] = scheduler
+    
+    # Serve sessions from memory and write changes back in the background
+    session_store.warm()
+    application.bot_data['session_flush_task'] = asyncio.create_task(session_store.run_flush_loop())
+
+async def post_shutdown(application):
+    """Write any pending session changes before the process exits"""
+    flush_task = application.bot_data.get('session_flush_task')
+    if flush_task:
+        flush_task.cancel()
+        try:
+            await flush_task
+        except asyncio.CancelledError:
+            pass
 
 def main():
     """Main function to run the bot"""
@@ -52,20 +67,36 @@ def main():
     # Initialize database
     init_database()
     
-    # Create HTTP request optimized for heavy file uploads
+    # Create HTTP request optimized for heavy file uploads.
+    # Size the pool at roughly 2x the number of handler coroutines expected to be
+    # in flight at once, since a handler often holds a download while replying.
     request = HTTPXRequest(
-        connection_pool_size=50,   # Increased for heavy concurrent uploads
-        pool_timeout=120.0,        # Extended timeout for large files
+        connection_pool_size=BOT_CONNECTION_POOL_SIZE,  # Room for bursts of menu edits and uploads from many users
+        pool_timeout=BOT_POOL_TIMEOUT,                  # Extended timeout for large files
         read_timeout=300.0,        # 5 minutes for large file downloads
         write_timeout=300.0,       # 5 minutes for large file uploads
         connect_timeout=60.0       # 1 minute connection timeout
     )
     
-    # Create the Application with custom HTTP request
-    application = Application.builder().token(BOT_TOKEN).request(request).build()
+    # getUpdates long-polls on its own small pool so it never competes with handlers
+    get_updates_request = HTTPXRequest(
+        connection_pool_size=16,
+        read_timeout=60.0,
+        connect_timeout=60.0
+    )
+    
+    # Create the Application with custom HTTP request; handlers share its single context.bot
+    application = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .request(request)
+        .get_updates_request(get_updates_request)
+        .build()
+    )
     
     # Set up post-init callback
     application.post_init = post_init
+    application.post_shutdown = post_shutdown
     
     # Add handlers
     application.add_handler(CommandHandler("start", start_handler))